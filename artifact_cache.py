@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Client for the shared artifact cache used by the generation stages.
+
+A generated asset is stored under a key derived from everything that decides
+its content: the ComfyUI workflow (models, prompt, sampler settings, size) or
+the TTS voice, text and prosody. Before queuing work, generate_characters.py,
+generate_walk_frames.py, generate_buildings_comfyui.py and generate_voices.py
+ask the cache for that key, and upload what they produce on a miss, so a
+rebuild on a fresh machine downloads the assets instead of re-rendering them.
+
+The cache is any server speaking the small protocol of
+artifact_cache_server.py (GET/PUT /artifacts/<key>, body verified against
+its X-Content-SHA256 header). Point $ARTIFACT_CACHE_URL at one, e.g.
+http://127.0.0.1:8190; without it the stages run exactly as before. Cache
+failures never fail a build: the stage falls back to generating.
+"""
+
+import copy
+import hashlib
+import json
+import os
+import urllib.error
+import urllib.request
+
+CACHE_URL_ENV = "ARTIFACT_CACHE_URL"
+TIMEOUT = 30
+DIGEST_HEADER = "X-Content-SHA256"
+
+# Workflow inputs that do not change the image
+IGNORED_WORKFLOW_INPUTS = {"filename_prefix"}
+
+_disabled = False
+
+
+def artifact_key(kind: str, params: dict) -> str:
+    """Content key of an artifact: SHA-256 of its kind and canonical JSON parameters."""
+    canonical = json.dumps({"kind": kind, "params": params}, sort_keys=True, ensure_ascii=False,
+                           separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def workflow_key(workflow: dict, random_seed: bool = False) -> str:
+    """Key of a ComfyUI workflow's output image.
+
+    The seed is part of the key unless the stage marks it as `random_seed`:
+    one it draws afresh on every run, where any earlier sample is a valid hit.
+    """
+    ignored = IGNORED_WORKFLOW_INPUTS | {"seed"} if random_seed else IGNORED_WORKFLOW_INPUTS
+    normalized = copy.deepcopy(workflow)
+    for node in normalized.values():
+        for name in ignored & node.get("inputs", {}).keys():
+            del node["inputs"][name]
+    return artifact_key("comfyui", normalized)
+
+
+def _url(key: str) -> str | None:
+    base = os.environ.get(CACHE_URL_ENV)
+    if not base or _disabled:
+        return None
+    return f"{base.rstrip('/')}/artifacts/{key}"
+
+
+def _unavailable(action: str, err: Exception):
+    # One unreachable server should not cost a timeout per asset
+    global _disabled
+    _disabled = True
+    print(f"  Artifact cache {action} failed ({err}); continuing without the cache")
+
+
+def fetch(key: str) -> bytes | None:
+    """Cached bytes for `key`, or None on a miss, a corrupt entry or no cache."""
+    url = _url(key)
+    if not url:
+        return None
+    try:
+        with urllib.request.urlopen(url, timeout=TIMEOUT) as resp:
+            data = resp.read()
+            expected = resp.headers.get(DIGEST_HEADER)
+    except urllib.error.HTTPError as e:
+        if e.code != 404:
+            _unavailable("read", e)
+        return None
+    except OSError as e:
+        _unavailable("read", e)
+        return None
+    if expected and hashlib.sha256(data).hexdigest() != expected:
+        print(f"  Artifact cache entry {key[:12]} is corrupt; regenerating")
+        return None
+    return data
+
+
+def store(key: str, data: bytes):
+    """Upload a new artifact; best effort."""
+    url = _url(key)
+    if not url:
+        return
+    req = urllib.request.Request(url, data=data, method="PUT", headers={
+        DIGEST_HEADER: hashlib.sha256(data).hexdigest(),
+        "Content-Type": "application/octet-stream",
+    })
+    try:
+        urllib.request.urlopen(req, timeout=TIMEOUT).read()
+    except OSError as e:
+        _unavailable("upload", e)
+
+
+def fetch_or_generate(key: str, generate) -> tuple[bytes, bool]:
+    """(bytes, True) from the cache, else (generate(), False) uploaded to it."""
+    data = fetch(key)
+    if data is not None:
+        return data, True
+    data = generate()
+    store(key, data)
+    return data, False
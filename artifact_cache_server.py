@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""Reference server for the shared artifact cache (see artifact_cache.py).
+
+Stores artifacts as files under a cache directory and evicts the least
+recently used ones once the total size exceeds --max-bytes. Recency is the
+file's mtime, refreshed on every hit, so it survives restarts.
+
+With --upstream it acts as a local tier in front of a shared cache:
+
+  read-through   a local miss is fetched from the upstream, kept and served
+  write-back     an upload is stored and acknowledged locally, then forwarded
+                 to the upstream by a background thread
+
+Protocol:
+
+  GET  /artifacts/<sha256 key>   200 with the bytes and X-Content-SHA256, or 404
+  HEAD /artifacts/<sha256 key>   as GET without the body
+  PUT  /artifacts/<sha256 key>   body verified against X-Content-SHA256; 201,
+                                 411 without a Content-Length (no chunked
+                                 uploads), 400 without the digest header
+
+Usage:
+    python artifact_cache_server.py [--port 8190] [--dir .cache/artifacts]
+        [--max-bytes 2000000000] [--upstream http://cache.example:8190]
+    ARTIFACT_CACHE_URL=http://127.0.0.1:8190 python generate_characters.py
+
+Outputs cached artifacts to the cache directory
+"""
+
+import argparse
+import hashlib
+import os
+import queue
+import re
+import threading
+import time
+import urllib.request
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from artifact_cache import DIGEST_HEADER
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_DIR = os.path.join(ROOT_DIR, ".cache", "artifacts")
+DEFAULT_MAX_BYTES = 2_000_000_000
+
+KEY_RE = re.compile(r"^/artifacts/([0-9a-f]{64})$")
+MAX_UPLOAD_BYTES = 256 * 1024 * 1024
+UPSTREAM_TIMEOUT = 30
+UPSTREAM_RETRIES = 3
+
+
+class ArtifactStore:
+    """Size-bounded LRU of files named by key; thread-safe."""
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._sizes = OrderedDict()  # key -> bytes, least recently used first
+        os.makedirs(directory, exist_ok=True)
+        found = []
+        for dirpath, _, files in os.walk(directory):
+            for name in files:
+                if re.fullmatch(r"[0-9a-f]{64}", name):
+                    st = os.stat(os.path.join(dirpath, name))
+                    found.append((st.st_mtime, name, st.st_size))
+        for _, key, size in sorted(found):
+            self._sizes[key] = size
+        self.total = sum(self._sizes.values())
+
+    def __len__(self) -> int:
+        return len(self._sizes)
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key)
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            if key not in self._sizes:
+                return None
+            self._sizes.move_to_end(key)
+        # Read outside the lock so one large hit does not stall every other request
+        path = self.path(key)
+        try:
+            os.utime(path)
+            with open(path, "rb") as f:
+                return f.read()
+        except FileNotFoundError:  # evicted since the lookup
+            with self._lock:
+                if key in self._sizes and not os.path.exists(path):
+                    self.total -= self._sizes.pop(key)
+            return None
+
+    def put(self, key: str, data: bytes):
+        path = self.path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        with self._lock:
+            os.replace(tmp, path)
+            self.total += len(data) - self._sizes.pop(key, 0)
+            self._sizes[key] = len(data)
+            self._evict(keep=key)
+
+    def _evict(self, keep: str):
+        while self.total > self.max_bytes and len(self._sizes) > 1:
+            key, size = next(iter(self._sizes.items()))
+            if key == keep:
+                break
+            del self._sizes[key]
+            self.total -= size
+            try:
+                os.remove(self.path(key))
+            except FileNotFoundError:
+                pass
+            print(f"  evicted {key[:12]} ({size:,} bytes)")
+
+
+class Upstream:
+    """Read-through fetches from, and write-back uploads to, another cache server."""
+
+    def __init__(self, base_url: str):
+        self.base_url = base_url.rstrip("/")
+        self._pending = queue.Queue()
+        threading.Thread(target=self._write_back, daemon=True).start()
+
+    def fetch(self, key: str) -> bytes | None:
+        try:
+            with urllib.request.urlopen(f"{self.base_url}/artifacts/{key}", timeout=UPSTREAM_TIMEOUT) as resp:
+                data = resp.read()
+                expected = resp.headers.get(DIGEST_HEADER)
+        except OSError:  # 404 included
+            return None
+        return data if not expected or hashlib.sha256(data).hexdigest() == expected else None
+
+    def enqueue(self, key: str, data: bytes, digest: str):
+        self._pending.put((key, data, digest))
+
+    def _write_back(self):
+        while True:
+            key, data, digest = self._pending.get()
+            for attempt in range(UPSTREAM_RETRIES):
+                req = urllib.request.Request(f"{self.base_url}/artifacts/{key}", data=data, method="PUT",
+                                             headers={DIGEST_HEADER: digest})
+                try:
+                    urllib.request.urlopen(req, timeout=UPSTREAM_TIMEOUT).read()
+                    break
+                except OSError as e:
+                    if attempt == UPSTREAM_RETRIES - 1:
+                        print(f"  write-back of {key[:12]} failed: {e}")
+                    else:
+                        time.sleep(2 ** attempt)
+
+
+class ArtifactHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    store: ArtifactStore = None
+    upstream: Upstream | None = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def _key(self) -> str | None:
+        m = KEY_RE.match(self.path)
+        if not m:
+            self.send_error(404)
+        return m.group(1) if m else None
+
+    def _lookup(self, key: str) -> bytes | None:
+        data = self.store.get(key)
+        if data is None and self.upstream:
+            data = self.upstream.fetch(key)
+            if data is not None:
+                self.store.put(key, data)
+                print(f"  read-through {key[:12]} ({len(data):,} bytes)")
+        return data
+
+    def _serve(self, with_body: bool):
+        key = self._key()
+        if key is None:
+            return
+        data = self._lookup(key)
+        if data is None:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header(DIGEST_HEADER, hashlib.sha256(data).hexdigest())
+        self.end_headers()
+        if with_body:
+            self.wfile.write(data)
+
+    def do_GET(self):
+        self._serve(with_body=True)
+
+    def do_HEAD(self):
+        self._serve(with_body=False)
+
+    def do_PUT(self):
+        key = self._key()
+        if key is None:
+            return
+        length = self.headers.get("Content-Length")
+        if length is None or "Transfer-Encoding" in self.headers:
+            self.close_connection = True  # the body's end is unknown
+            self.send_error(411)
+            return
+        if not length.isdigit():
+            self.close_connection = True
+            self.send_error(400, "bad Content-Length")
+            return
+        if int(length) > MAX_UPLOAD_BYTES:
+            self.close_connection = True
+            self.send_error(413)
+            return
+        data = self.rfile.read(int(length))
+        expected = self.headers.get(DIGEST_HEADER)
+        if expected is None:
+            self.send_error(400, f"{DIGEST_HEADER} is required")
+            return
+        digest = hashlib.sha256(data).hexdigest()
+        if expected != digest:
+            self.send_error(400, "body does not match X-Content-SHA256")
+            return
+        self.store.put(key, data)
+        if self.upstream:
+            self.upstream.enqueue(key, data, digest)
+        print(f"  stored {key[:12]} ({len(data):,} bytes, cache {self.store.total:,} bytes)")
+        self.send_response(201)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8190)
+    parser.add_argument("--dir", default=DEFAULT_DIR)
+    parser.add_argument("--max-bytes", type=int, default=DEFAULT_MAX_BYTES)
+    parser.add_argument("--upstream", help="shared cache server for read-through and write-back")
+    args = parser.parse_args()
+
+    ArtifactHandler.store = ArtifactStore(args.dir, args.max_bytes)
+    ArtifactHandler.upstream = Upstream(args.upstream) if args.upstream else None
+    server = ThreadingHTTPServer((args.host, args.port), ArtifactHandler)
+    server.daemon_threads = True
+    tier = f", upstream {args.upstream}" if args.upstream else ""
+    print(f"Artifact cache on http://{args.host}:{args.port} ({args.dir}, "
+          f"{len(ArtifactHandler.store)} entries, {ArtifactHandler.store.total:,} / "
+          f"{args.max_bytes:,} bytes{tier})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Benchmark walk-frame in-betweening (inbetween.py) at the token sheet sizes.
+
+For each method and scale, synthesizes the in-betweens of every consecutive
+pair of walk frames of every character, as generate_token_sprites.py does,
+and reports the synthesis rate. As a quality check it also rebuilds each
+generated frame from its two neighbours (t = 0.5) and reports the PSNR of the
+result against the real frame, composited over grey.
+
+Usage:
+    pip install pillow numpy scipy
+    python bench_inbetween.py [--runs 3] [--inbetweens 1]
+
+Outputs a table to stdout
+"""
+
+import argparse
+import math
+import os
+import statistics
+import time
+
+import numpy as np
+from PIL import Image
+
+from board_defs import ROOT_DIR, load_character_defs, load_numbers
+from inbetween import inbetweens
+
+TOKEN_RENDERER_TS = os.path.join(ROOT_DIR, "src", "render", "TokenRenderer.ts")
+PUBLIC_DIR = os.path.join(ROOT_DIR, "public")
+SCALES = [1, 2]
+METHODS = ["blend", "flow"]
+
+
+def load_cycles(size: int) -> list:
+    """Walk frames of each character with all frames present, resized to `size`."""
+    cycles = []
+    for char in load_character_defs():
+        paths = [os.path.join(PUBLIC_DIR, url.lstrip("/")) for url in char["walkFrames"]]
+        if len(paths) >= 3 and all(os.path.exists(p) for p in paths):
+            cycles.append([Image.open(p).convert("RGBA").resize((size, size), Image.LANCZOS) for p in paths])
+    return cycles
+
+
+def psnr_over_grey(a: Image.Image, b: Image.Image) -> float:
+    grey = Image.new("RGBA", a.size, (128, 128, 128, 255))
+    x = np.asarray(Image.alpha_composite(grey, a), dtype=np.float64)[..., :3]
+    y = np.asarray(Image.alpha_composite(grey, b), dtype=np.float64)[..., :3]
+    mse = np.mean((x - y) ** 2)
+    return math.inf if mse == 0 else 10 * math.log10(255 ** 2 / mse)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--inbetweens", type=int, default=1)
+    args = parser.parse_args()
+
+    token_size = int(load_numbers(TOKEN_RENDERER_TS)["TOKEN_SIZE"])
+    print(f"{'method':<6} {'size':>5} {'pairs':>6} {'frames/s':>9} {'held-out PSNR':>14}")
+    for scale in SCALES:
+        size = token_size * scale
+        cycles = load_cycles(size)
+        if not cycles:
+            raise SystemExit("No complete walk cycles found in public/characters")
+        pairs = [(c[i], c[(i + 1) % len(c)]) for c in cycles for i in range(len(c))]
+        for method in METHODS:
+            rates = []
+            for _ in range(args.runs):
+                t0 = time.perf_counter()
+                made = sum(len(inbetweens(a, b, args.inbetweens, method)) for a, b in pairs)
+                rates.append(made / (time.perf_counter() - t0))
+            held_out = [
+                psnr_over_grey(inbetweens(c[i - 1], c[(i + 1) % len(c)], 1, method)[0], c[i])
+                for c in cycles for i in range(len(c))
+            ]
+            print(f"{method:<6} {size:>5} {len(pairs):>6} {statistics.median(rates):>9.1f} "
+                  f"{statistics.mean(held_out):>11.2f} dB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""Benchmark loading the published assets as loose files versus asset packs.
+
+Serves public/ from a local HTTP/1.1 server with byte-range support and times
+three ways of fetching every asset in the manifest over a small pool of
+keep-alive connections (browsers use about six per origin):
+
+  loose    one GET per hashed file (public/hashed/), in its packed encoding
+  ranges   the pack index, then one range request per asset into its pack
+  packs    the pack index, then each pack file whole
+
+--latency-ms adds a fixed delay to every request to stand in for the network
+round trip and per-file static lookup that dominate on a real server.
+
+Usage:
+    python encode_assets.py && python hash_assets.py && python pack_assets.py
+    python bench_pack.py [--runs 5] [--connections 6] [--latency-ms 0]
+
+Outputs a timing table to stdout
+"""
+
+import argparse
+import http.client
+import json
+import os
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+from pack_assets import INDEX_NAME, MANIFEST_PATH, OUTPUT_DIR as PACK_DIR, PUBLIC_DIR, PackIndex, packed_form
+
+CHUNK = 1 << 16
+
+
+class RangeRequestHandler(SimpleHTTPRequestHandler):
+    """Static files with keep-alive and single `bytes=a-b` range support."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True  # headers and body go out separately
+    latency = 0.0
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, directory=PUBLIC_DIR, **kwargs)
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        if self.latency:
+            time.sleep(self.latency)
+        path = self.translate_path(self.path)
+        if not os.path.isfile(path):
+            self.send_error(404)
+            return
+        size = os.path.getsize(path)
+        start, end, status = 0, size - 1, 200
+        spec = self.headers.get("Range", "")
+        if spec.startswith("bytes="):
+            first, _, last = spec[len("bytes="):].partition("-")
+            start, end, status = int(first), min(int(last) if last else size - 1, size - 1), 206
+        self.send_response(status)
+        self.send_header("Content-Type", self.guess_type(path))
+        self.send_header("Content-Length", str(end - start + 1))
+        if status == 206:
+            self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+        self.end_headers()
+        with open(path, "rb") as f:
+            f.seek(start)
+            remaining = end - start + 1
+            while remaining:
+                chunk = f.read(min(CHUNK, remaining))
+                self.wfile.write(chunk)
+                remaining -= len(chunk)
+
+
+def fetch_all(port: int, requests: list, connections: int) -> int:
+    """Issue (url, range) requests over `connections` keep-alive connections; returns bytes read."""
+    local = threading.local()
+
+    def get(req):
+        if not hasattr(local, "conn"):
+            local.conn = http.client.HTTPConnection("127.0.0.1", port)
+        url, byte_range = req
+        headers = {"Range": f"bytes={byte_range[0]}-{byte_range[1]}"} if byte_range else {}
+        local.conn.request("GET", url, headers=headers)
+        res = local.conn.getresponse()
+        body = res.read()
+        if res.status not in (200, 206):
+            raise RuntimeError(f"GET {url}: HTTP {res.status}")
+        return len(body)
+
+    with ThreadPoolExecutor(connections) as pool:
+        return sum(pool.map(get, requests))
+
+
+def scenarios(manifest: dict, index: PackIndex) -> dict:
+    order = manifest["preload"]
+    idx = [(f"/packs/{INDEX_NAME}", None)]
+    return {
+        "loose": [(packed_form(manifest["assets"][a])["url"], None) for a in order],
+        "ranges": idx + [
+            (f"/packs/{index.packs[e['pack']][0]}", (e["offset"], e["offset"] + e["length"] - 1))
+            for e in (index.entries[a] for a in order)
+        ],
+        "packs": idx + [(f"/packs/{name}", None) for name, _ in index.packs],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--connections", type=int, default=6)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    args = parser.parse_args()
+
+    with open(MANIFEST_PATH, encoding="utf-8") as f:
+        manifest = json.load(f)
+    index = PackIndex(PACK_DIR)
+
+    RangeRequestHandler.latency = args.latency_ms / 1000
+    server = ThreadingHTTPServer(("127.0.0.1", 0), RangeRequestHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    port = server.server_address[1]
+
+    print(f"{len(manifest['preload'])} assets, {len(index.packs)} packs, "
+          f"{args.connections} connections, +{args.latency_ms:g} ms/request, {args.runs} runs\n")
+    print(f"{'mode':<8} {'requests':>8} {'bytes':>12} {'median ms':>10} {'min ms':>8}")
+    try:
+        for name, requests in scenarios(manifest, index).items():
+            fetch_all(port, requests, args.connections)  # warm the page cache
+            times = []
+            for _ in range(args.runs):
+                t0 = time.perf_counter()
+                total = fetch_all(port, requests, args.connections)
+                times.append((time.perf_counter() - t0) * 1000)
+            print(f"{name:<8} {len(requests):>8} {total:>12,} {statistics.median(times):>10.1f} {min(times):>8.1f}")
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
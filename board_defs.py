@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""Board definitions and geometry shared by the Python build stages.
+
+Parses the game constants straight out of src/constants.ts (and the board
+layout constants from src/core/Board.ts) so the TypeScript sources stay the
+single source of truth, and mirrors Board.project() so baked sprites land on
+the same screen pixels the renderer uses.
+"""
+
+import glob
+import math
+import os
+import re
+import struct
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+CONSTANTS_TS = os.path.join(ROOT_DIR, "src", "constants.ts")
+BOARD_TS = os.path.join(ROOT_DIR, "src", "core", "Board.ts")
+FONT_DIR = os.path.join(ROOT_DIR, "fonts")
+# Subset written by bundle_font.py; the game's @font-face serves the same file
+BUNDLED_FONT = os.path.join(ROOT_DIR, "public", "fonts", "richman4-sans.otf")
+
+# The game draws with the bundled face and falls back to "Microsoft YaHei";
+# without a bundle these are the closest CJK faces we can rasterize with. A
+# font named by $CJK_FONT, or dropped into fonts/, wins over them.
+FONT_CANDIDATES = {
+    False: [
+        "C:/Windows/Fonts/msyh.ttc",
+        "/System/Library/Fonts/PingFang.ttc",
+        "/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc",
+        "/usr/share/fonts/noto-cjk/NotoSansCJK-Regular.ttc",
+        "/usr/share/fonts/truetype/wqy/wqy-microhei.ttc",
+        "/usr/share/fonts/truetype/droid/DroidSansFallbackFull.ttf",
+    ],
+    True: [
+        "C:/Windows/Fonts/msyhbd.ttc",
+        "/usr/share/fonts/opentype/noto/NotoSansCJK-Bold.ttc",
+        "/usr/share/fonts/noto-cjk/NotoSansCJK-Bold.ttc",
+    ],
+}
+
+_TILE_RE = re.compile(
+    r"\{\s*index:\s*(\d+),\s*type:\s*TileType\.(\w+),\s*name:\s*'([^']*)',\s*price:\s*(\d+),"
+    r"\s*rent:\s*\[([\d,\s]*)\],\s*buildCost:\s*(\d+),\s*colorGroup:\s*(-?\d+)\s*\}"
+)
+
+
+def _read(path: str) -> str:
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+def _block(source: str, name: str) -> str:
+    """Return the text of the array/object literal assigned to `name`."""
+    m = re.search(rf"\b{name}\b[^=]*=\s*([\[{{])", source)
+    if not m:
+        raise ValueError(f"{name} not found")
+    open_ch = m.group(1)
+    close_ch = "]" if open_ch == "[" else "}"
+    depth = 0
+    for i in range(m.start(1), len(source)):
+        if source[i] == open_ch:
+            depth += 1
+        elif source[i] == close_ch:
+            depth -= 1
+            if depth == 0:
+                return source[m.start(1):i + 1]
+    raise ValueError(f"unterminated literal for {name}")
+
+
+def _eval_number(expr: str, env: dict) -> float:
+    """Evaluate a numeric TS expression such as `Math.atan2(2.2, 2.0)`."""
+    expr = re.sub(r"\bMath\.", "math.", expr.split("//")[0].strip().rstrip(";"))
+    return float(eval(expr, {"__builtins__": {}, "math": math}, env))
+
+
+def load_numbers(path: str = CONSTANTS_TS) -> dict:
+    """All top-level numeric `const NAME = <expr>;` declarations in a TS file."""
+    env = {}
+    for m in re.finditer(r"^(?:export\s+)?const\s+([A-Z_][A-Z0-9_]*)\s*(?::\s*\w+\s*)?=\s*([^;{\[\n]+);",
+                         _read(path), re.MULTILINE):
+        try:
+            env[m.group(1)] = _eval_number(m.group(2), env)
+        except Exception:
+            continue
+    return env
+
+
+def load_vec3(name: str, path: str = CONSTANTS_TS) -> tuple:
+    lit = _block(_read(path), name)
+    return tuple(float(re.search(rf"\b{axis}:\s*(-?[\d.]+)", lit).group(1)) for axis in "xyz")
+
+
+def load_tile_defs(path: str = CONSTANTS_TS) -> list:
+    """TILE_DEFS as a list of dicts, in index order."""
+    tiles = []
+    for m in _TILE_RE.finditer(_block(_read(path), "TILE_DEFS")):
+        tiles.append({
+            "index": int(m.group(1)),
+            "type": m.group(2),
+            "name": m.group(3),
+            "price": int(m.group(4)),
+            "rent": [int(v) for v in m.group(5).split(",")],
+            "buildCost": int(m.group(6)),
+            "colorGroup": int(m.group(7)),
+        })
+    tiles.sort(key=lambda t: t["index"])
+    return tiles
+
+
+def load_group_colors(path: str = CONSTANTS_TS) -> dict:
+    lit = _block(_read(path), "GROUP_COLORS")
+    return {int(k): v for k, v in re.findall(r"(\d+):\s*'(#[0-9A-Fa-f]{6})'", lit)}
+
+
+def load_character_defs(path: str = CONSTANTS_TS) -> list:
+    """CHARACTER_DEFS as dicts with id, name, imagePath and walkFrames."""
+    chars = []
+    for entry in re.findall(r"\{(.*?)\}", _block(_read(path), "CHARACTER_DEFS"), re.DOTALL):
+        frames = re.search(r"walkFrames:\s*\[([^\]]*)\]", entry)
+        chars.append({
+            "id": re.search(r"id:\s*'([^']*)'", entry).group(1),
+            "name": re.search(r"name:\s*'([^']*)'", entry).group(1),
+            "imagePath": re.search(r"imagePath:\s*'([^']*)'", entry).group(1),
+            "walkFrames": re.findall(r"'([^']*)'", frames.group(1)) if frames else [],
+        })
+    return chars
+
+
+def load_strings(name: str, field: str = None, path: str = CONSTANTS_TS) -> list:
+    """Quoted strings in the literal assigned to `name`, or only its `field: '...'` values."""
+    lit = _block(_read(path), name)
+    pattern = rf"\b{field}:\s*'([^']*)'" if field else r"'([^']*)'"
+    return re.findall(pattern, lit)
+
+
+def find_cjk_font(bold: bool = False) -> str:
+    """Path of the font used for baked text; bold falls back to the regular face.
+
+    The bundled face has no bold: the game draws bold text with its regular
+    outlines too, so that is what gets baked.
+    """
+    if os.path.exists(BUNDLED_FONT):
+        return BUNDLED_FONT
+    env = os.environ.get("CJK_FONT_BOLD" if bold else "CJK_FONT")
+    if env:
+        return env
+    bundled = sorted(glob.glob(os.path.join(FONT_DIR, "*.[ot]t[fc]")))
+    bundled_bold = [f for f in bundled if "bold" in os.path.basename(f).lower()]
+    bundled_regular = [f for f in bundled if f not in bundled_bold]
+    for path in (bundled_bold if bold else bundled_regular) + FONT_CANDIDATES[bold]:
+        if os.path.exists(path):
+            return path
+    if bold:
+        return find_cjk_font(False)
+    raise FileNotFoundError(f"No CJK font found: run bundle_font.py, put one in {FONT_DIR}/ or set $CJK_FONT")
+
+
+def load_font(size: float, bold: bool = False):
+    from PIL import ImageFont
+
+    return ImageFont.truetype(find_cjk_font(bold), size=max(1, round(size)))
+
+
+def _font_tables(data: bytes) -> dict:
+    """Table tag -> bytes of the first face in an OpenType file or collection."""
+    offset = struct.unpack_from(">I", data, 12)[0] if data[:4] == b"ttcf" else 0
+    count = struct.unpack_from(">H", data, offset + 4)[0]
+    tables = {}
+    for i in range(count):
+        tag, _, start, length = struct.unpack_from(">4sIII", data, offset + 12 + 16 * i)
+        tables[tag.decode("latin-1")] = data[start:start + length]
+    return tables
+
+
+def em_box(bold: bool = False) -> tuple[float, float]:
+    """(ascent, descent) of the em box as fractions of the font size.
+
+    Canvas textBaseline 'top', 'middle' and 'bottom' are the em box's top,
+    middle and bottom; browsers place it from the OS/2 typo ascender and
+    descender scaled to sum to the em, or from the hhea ones without them.
+    """
+    with open(find_cjk_font(bold), "rb") as f:
+        tables = _font_tables(f.read())
+    ascent, descent = struct.unpack_from(">hh", tables["hhea"], 4)
+    os2 = tables.get("OS/2")
+    if os2 and len(os2) >= 72:
+        typo_ascent, typo_descent = struct.unpack_from(">hh", os2, 68)
+        if typo_ascent > 0 and typo_ascent > typo_descent:
+            ascent, descent = typo_ascent, typo_descent
+    return ascent / (ascent - descent), -descent / (ascent - descent)
+
+
+def middle_baseline(size: float, bold: bool = False) -> float:
+    """Distance from the em-box middle (textBaseline 'middle') down to the alphabetic baseline."""
+    ascent, descent = em_box(bold)
+    return (ascent - descent) / 2 * size
+
+
+class BoardGeometry:
+    """Python port of src/core/Board.ts (tile layout and perspective projection)."""
+
+    def __init__(self):
+        consts = load_numbers(CONSTANTS_TS)
+        board = load_numbers(BOARD_TS)
+        self.total_tiles = int(consts["TOTAL_TILES"])
+        self.canvas_w = consts["CANVAS_WIDTH"]
+        self.canvas_h = consts["CANVAS_HEIGHT"]
+        self.fov = consts["FOV"]
+        self.pitch = consts["CAMERA_PITCH"]
+        self.camera = load_vec3("CAMERA_POS")
+        self.board_half = board["BOARD_HALF"]
+        self.tile_depth = board["TILE_DEPTH"]
+        self.inner_edge = board["INNER_EDGE"]
+        self.corner_size = board["CORNER_SIZE"]
+        self.regular_width = (2 * self.board_half - 2 * self.corner_size) / 7
+
+    def _edge_range(self, pos_in_side: int) -> tuple:
+        if pos_in_side == 0:
+            return -self.board_half, -self.board_half + self.corner_size
+        start = -self.board_half + self.corner_size + (pos_in_side - 1) * self.regular_width
+        return start, start + self.regular_width
+
+    def tile_corners(self, index: int) -> list:
+        side, pos = divmod(index, 8)
+        e0, e1 = self._edge_range(pos)
+        outer, inner = self.board_half, self.inner_edge
+        if side == 0:
+            return [(e0, 0, outer), (e1, 0, outer), (e1, 0, inner), (e0, 0, inner)]
+        if side == 1:
+            return [(outer, 0, -e0), (outer, 0, -e1), (inner, 0, -e1), (inner, 0, -e0)]
+        if side == 2:
+            return [(-e0, 0, -outer), (-e1, 0, -outer), (-e1, 0, -inner), (-e0, 0, -inner)]
+        if side == 3:
+            return [(-outer, 0, e0), (-outer, 0, e1), (-inner, 0, e1), (-inner, 0, e0)]
+        return []
+
+    def project(self, p: tuple) -> tuple:
+        dx = p[0] - self.camera[0]
+        dy = p[1] - self.camera[1]
+        dz = p[2] - self.camera[2]
+        cos_p, sin_p = math.cos(self.pitch), math.sin(self.pitch)
+        ry = dy * cos_p - dz * sin_p
+        rz = dy * sin_p + dz * cos_p
+        if rz >= -0.01:
+            return self.canvas_w / 2, self.canvas_h / 2
+        scale = self.fov / -rz
+        return (self.canvas_w / 2 + dx * scale * self.canvas_w * 0.5,
+                self.canvas_h / 2 - ry * scale * self.canvas_h * 0.5)
+
+    def tile_screen_poly(self, index: int) -> list:
+        return [self.project(c) for c in self.tile_corners(index)]
+
+    def tile_bbox(self, index: int) -> tuple:
+        poly = self.tile_screen_poly(index)
+        xs, ys = [p[0] for p in poly], [p[1] for p in poly]
+        return min(xs), min(ys), max(xs), max(ys)
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""Precompute board probability tables for the AI.
+
+Solves the Markov chain of one player's turns on the board from TILE_DEFS in
+constants.ts, using the movement rules of GameEngine: two dice, no extra roll
+on doubles, GO_TO_JAIL sends the player to the jail tile, and a jailed player
+escapes by rolling doubles (moving by that roll) or is released on the fourth
+turn for a normal roll. The chain has one state per tile plus one per jail
+turn; its stationary distribution gives how often each tile is landed on per
+turn.
+
+The tables are written as a generated TypeScript module of typed arrays that
+the client and server can look up in O(1). AI.ts reads colour-group ownership
+from the group tables; the landing and rent tables are there for decisions
+that prove themselves in simulate.py first:
+
+  LANDING_PROB    Float32Array[tile]               landings per player turn
+  EXPECTED_RENT   Float32Array[tile * RENT_LEVELS + level]
+                                                   rent per opponent turn
+  GROUP_OF        Int8Array[tile]                  colour group, -1 if none
+  GROUP_OFFSETS   Uint8Array[group + 1]            slice of GROUP_TILES
+  GROUP_TILES     Uint8Array                       property tiles by group
+
+Usage:
+    pip install numpy
+    python board_tables.py
+
+Outputs src/core/BoardTables.ts
+"""
+
+import os
+
+import numpy as np
+
+from board_defs import ROOT_DIR, load_tile_defs
+
+OUTPUT_PATH = os.path.join(ROOT_DIR, "src", "core", "BoardTables.ts")
+
+JAIL_MAX_TURNS = 3
+
+# Probability of each two-dice total, and of rolling that total as doubles
+DICE_TOTALS = np.arange(2, 13)
+DICE_PROB = np.array([6 - abs(7 - t) for t in DICE_TOTALS]) / 36
+DOUBLE_PROB = np.array([1 / 36 if t % 2 == 0 else 0.0 for t in DICE_TOTALS])
+
+
+def turn_matrices(tiles: list) -> tuple[np.ndarray, np.ndarray]:
+    """Transition matrix between turn-start states and per-state landing probabilities.
+
+    States 0..n-1 are "standing on tile i"; state n + k is "in jail, k turns
+    served". Returns (P, L) with P[s, s'] the probability of starting the next
+    turn in s' and L[s, tile] the probability of landing on `tile` this turn.
+    """
+    n = len(tiles)
+    types = [t["type"] for t in tiles]
+    jail_tile = types.index("JAIL")
+    jail_state = [n + k for k in range(JAIL_MAX_TURNS + 1)]
+    size = n + len(jail_state)
+    P = np.zeros((size, size))
+    L = np.zeros((size, n))
+
+    def move(state: int, start: int, probs: np.ndarray):
+        for total, p in zip(DICE_TOTALS, probs):
+            if p == 0:
+                continue
+            dest = (start + total) % n
+            L[state, dest] += p
+            P[state, jail_state[0] if types[dest] == "GO_TO_JAIL" else dest] += p
+
+    for i in range(n):
+        move(i, i, DICE_PROB)
+    for k in range(JAIL_MAX_TURNS):
+        # Serving turn k + 1: doubles escape and move, anything else stays
+        move(jail_state[k], jail_tile, DOUBLE_PROB)
+        P[jail_state[k], jail_state[k + 1]] += 1 - DOUBLE_PROB.sum()
+    move(jail_state[JAIL_MAX_TURNS], jail_tile, DICE_PROB)
+    return P, L
+
+
+def stationary(P: np.ndarray) -> np.ndarray:
+    """Stationary distribution: solve pi (P - I) = 0 with sum(pi) = 1."""
+    size = len(P)
+    A = np.vstack([(P - np.eye(size)).T, np.ones(size)])
+    b = np.zeros(size + 1)
+    b[-1] = 1
+    pi, *_ = np.linalg.lstsq(A, b, rcond=None)
+    return pi
+
+
+def landing_probabilities(tiles: list) -> np.ndarray:
+    P, L = turn_matrices(tiles)
+    return stationary(P) @ L
+
+
+def group_tables(tiles: list) -> tuple[list, list, list]:
+    group_of = [t["colorGroup"] if t["type"] == "PROPERTY" else -1 for t in tiles]
+    n_groups = max(group_of) + 1
+    offsets, members = [0], []
+    for g in range(n_groups):
+        members += [t["index"] for t in tiles if group_of[t["index"]] == g]
+        offsets.append(len(members))
+    return group_of, offsets, members
+
+
+def _ts_array(kind: str, values, per_line: int = 8, fmt=str) -> str:
+    items = [fmt(v) for v in values]
+    lines = [", ".join(items[i:i + per_line]) for i in range(0, len(items), per_line)]
+    return f"new {kind}([\n  " + ",\n  ".join(lines) + ",\n])"
+
+
+def write_module(tiles: list, landing: np.ndarray, path: str):
+    rent_levels = len(tiles[0]["rent"])
+    expected_rent = [landing[t["index"]] * r for t in tiles for r in t["rent"]]
+    group_of, offsets, members = group_tables(tiles)
+    props = [t["index"] for t in tiles if t["type"] == "PROPERTY"]
+    mean_landing = float(np.mean(landing[props]))
+    f6 = lambda v: f"{v:.6g}"
+
+    source = f"""// Generated by board_tables.py from TILE_DEFS; do not edit by hand.
+// Landing probabilities come from the stationary distribution of the board's
+// two-dice Markov chain with jail (see board_tables.py).
+
+export const RENT_LEVELS = {rent_levels};
+
+// Landings per player turn on each tile
+export const LANDING_PROB = {_ts_array("Float32Array", landing, fmt=f6)};
+
+// Mean of LANDING_PROB over property tiles
+export const MEAN_PROPERTY_LANDING = {mean_landing:.6g};
+
+// Expected rent per opponent turn: [tile * RENT_LEVELS + buildings]
+export const EXPECTED_RENT = {_ts_array("Float32Array", expected_rent, per_line=rent_levels, fmt=f6)};
+
+// Colour group of each tile (-1 for non-property tiles)
+export const GROUP_OF = {_ts_array("Int8Array", group_of)};
+
+// Property tiles of group g are GROUP_TILES[GROUP_OFFSETS[g] .. GROUP_OFFSETS[g + 1])
+export const GROUP_OFFSETS = {_ts_array("Uint8Array", offsets, per_line=16)};
+export const GROUP_TILES = {_ts_array("Uint8Array", members, per_line=16)};
+"""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(source)
+
+
+def main():
+    tiles = load_tile_defs()
+    landing = landing_probabilities(tiles)
+    write_module(tiles, landing, OUTPUT_PATH)
+
+    order = np.argsort(-landing)
+    print("Most landed-on tiles (per turn):")
+    for i in order[:6]:
+        print(f"  {i:>2} {tiles[i]['name']:<6} {landing[i]:.4f}")
+    print(f"\nDone! Wrote {OUTPUT_PATH}")
+
+
+if __name__ == "__main__":
+    main()
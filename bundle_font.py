@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""Subset a CJK font down to the text of 大富翁4 and bundle it with the game.
+
+The canvas text and the baked text (glyph_atlas.py, render_board.py and the
+other stages that call board_defs.load_font) must come from the same face, so
+the game ships its own: index.html declares it with @font-face as "Richman4
+Sans", the renderers ask for it first, and find_cjk_font() picks the bundled
+file before any system font.
+
+Keeps printable ASCII and every character that appears in src/, written out
+or as a \\u escape (string literals, the defs in constants.ts, and some
+comments along the way), which covers everything the game can draw except
+names typed in the lobby; those fall through to the rest of the font stack.
+
+The default source is Noto Sans CJK SC Regular (SIL Open Font License 1.1),
+which has no bold weight: the @font-face covers weights 400-700 so browsers
+draw bold text with the same outlines the atlas bakes instead of
+synthesizing a bold of their own.
+
+Usage:
+    pip install fonttools
+    python bundle_font.py path/to/NotoSansCJKsc-Regular.otf
+
+Outputs public/fonts/richman4-sans.otf
+"""
+
+import argparse
+import glob
+import os
+import re
+
+from fontTools import subset
+from fontTools.ttLib import TTFont
+
+from board_defs import BUNDLED_FONT, ROOT_DIR
+
+SRC_DIR = os.path.join(ROOT_DIR, "src")
+ASCII = "".join(chr(c) for c in range(0x20, 0x7F))
+
+
+def game_text() -> str:
+    """Printable ASCII plus every character used anywhere in the TypeScript sources."""
+    chars = set(ASCII)
+    for path in glob.glob(os.path.join(SRC_DIR, "**", "*.ts"), recursive=True):
+        with open(path, encoding="utf-8") as f:
+            source = f.read()
+        chars.update(ch for ch in source if ch.isprintable())
+        chars.update(chr(int(code, 16)) for code in re.findall(r"\\u([0-9a-fA-F]{4})", source))
+    return "".join(sorted(chars))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("source", help="CJK font to subset (.otf/.ttf, or .ttc with --font-number)")
+    parser.add_argument("--font-number", type=int, default=0, help="face index inside a .ttc")
+    args = parser.parse_args()
+
+    text = game_text()
+    font = TTFont(args.source, fontNumber=args.font_number)
+    options = subset.Options()
+    options.name_IDs = ["*"]  # keep the copyright and licence records
+    options.name_languages = ["*"]
+    options.notdef_outline = True
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(text=text)
+    subsetter.subset(font)
+
+    os.makedirs(os.path.dirname(BUNDLED_FONT), exist_ok=True)
+    font.save(BUNDLED_FONT)
+    cmap = font.getBestCmap()
+    missing = "".join(ch for ch in text if ord(ch) not in cmap and not ch.isspace())
+    note = f", missing {missing!r}" if missing else ""
+    print(f"\nDone! {len(cmap)} characters, {os.path.getsize(BUNDLED_FONT) / 1024:.0f} KB "
+          f"in {os.path.relpath(BUNDLED_FONT, ROOT_DIR)}{note}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""Re-encode sprite assets into the smallest format that stays within an error budget.
+
+For every PNG under public/buildings and public/characters this tries an
+optimized palette PNG, lossless WebP and lossy WebP/AVIF (with alpha) at a
+descending quality ladder, and keeps the smallest candidate whose decoded
+pixels stay within the error budget:
+
+  * SSIM of the luma, composited over neutral grey, >= MIN_SSIM
+  * PSNR of the alpha channel >= MIN_ALPHA_PSNR (catches fringes and halos)
+
+Both are measured only where either image has coverage (alpha > 0), so the
+transparent margin of a sprite cannot average an error away.
+
+The manifest lists the chosen encoding first, followed by fallbacks for
+browsers without AVIF/WebP support, ending with a PNG that always decodes.
+
+Usage:
+    pip install pillow numpy scipy
+    python encode_assets.py
+
+hash_assets.py publishes the chosen encodings next to the originals, and the
+game loads the first one the browser can decode.
+
+Outputs files to public/encoded/ and public/encoded/manifest.json
+"""
+
+import hashlib
+import io
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from PIL import Image, features
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+PUBLIC_DIR = os.path.join(ROOT_DIR, "public")
+OUTPUT_DIR = os.path.join(PUBLIC_DIR, "encoded")
+ASSET_DIRS = ["buildings", "characters"]
+
+MIN_SSIM = 0.99
+MIN_ALPHA_PSNR = 38.0
+
+WEBP_QUALITIES = [90, 80, 70, 60, 50]
+AVIF_QUALITIES = [80, 70, 60, 50, 40]
+
+MIME_TYPES = {"png": "image/png", "webp": "image/webp", "avif": "image/avif"}
+
+
+def _luma_over_grey(rgba: np.ndarray) -> np.ndarray:
+    rgb = rgba[:, :, :3].astype(np.float32)
+    a = rgba[:, :, 3:4].astype(np.float32) / 255.0
+    comp = rgb * a + 128.0 * (1.0 - a)
+    return comp @ np.array([0.299, 0.587, 0.114], dtype=np.float32)
+
+
+def ssim(x: np.ndarray, y: np.ndarray, mask: np.ndarray, window: int = 7) -> float:
+    """Mean structural similarity of two single-channel images over the `mask` pixels."""
+    from scipy import ndimage
+
+    c1, c2 = (0.01 * 255) ** 2, (0.03 * 255) ** 2
+    mx = ndimage.uniform_filter(x, window)
+    my = ndimage.uniform_filter(y, window)
+    vx = ndimage.uniform_filter(x * x, window) - mx * mx
+    vy = ndimage.uniform_filter(y * y, window) - my * my
+    cxy = ndimage.uniform_filter(x * y, window) - mx * my
+    s = ((2 * mx * my + c1) * (2 * cxy + c2)) / ((mx * mx + my * my + c1) * (vx + vy + c2))
+    return float(s[mask].mean())
+
+
+def psnr(x: np.ndarray, y: np.ndarray, mask: np.ndarray) -> float:
+    mse = float(np.mean((x[mask].astype(np.float32) - y[mask].astype(np.float32)) ** 2))
+    return float("inf") if mse == 0 else 10 * np.log10(255.0 ** 2 / mse)
+
+
+def measure(ref: np.ndarray, data: bytes) -> dict:
+    """Decode an encoded candidate and compare it against the reference pixels."""
+    dec = np.array(Image.open(io.BytesIO(data)).convert("RGBA"))
+    covered = (ref[:, :, 3] > 0) | (dec[:, :, 3] > 0)
+    if not covered.any():
+        covered[:] = True  # fully transparent: compare the whole frame
+    return {
+        "ssim": round(ssim(_luma_over_grey(ref), _luma_over_grey(dec), covered), 5),
+        "alpha_psnr": round(min(psnr(ref[:, :, 3], dec[:, :, 3], covered), 99.0), 2),
+    }
+
+
+def within_budget(metrics: dict) -> bool:
+    return metrics["ssim"] >= MIN_SSIM and metrics["alpha_psnr"] >= MIN_ALPHA_PSNR
+
+
+def _encode(img: Image.Image, fmt: str, **params) -> bytes:
+    buf = io.BytesIO()
+    img.save(buf, fmt, **params)
+    return buf.getvalue()
+
+
+def candidates(img: Image.Image):
+    """Yield (label, ext, encoder) triples; lossy ladders run best quality first.
+
+    The truecolor PNG is lossless and therefore always within budget.
+    """
+    yield "png-palette", "png", lambda: _encode(
+        img.quantize(256, method=Image.Quantize.FASTOCTREE, dither=Image.Dither.NONE), "PNG", optimize=True)
+    yield "png", "png", lambda: _encode(img, "PNG", optimize=True)
+    if features.check("webp"):
+        yield "webp-lossless", "webp", lambda: _encode(img, "WEBP", lossless=True, method=4)
+        for q in WEBP_QUALITIES:
+            yield f"webp-q{q}", "webp", lambda q=q: _encode(img, "WEBP", quality=q, alpha_quality=100, method=6)
+    if features.check("avif"):
+        for q in AVIF_QUALITIES:
+            yield f"avif-q{q}", "avif", lambda q=q: _encode(img, "AVIF", quality=q, speed=6)
+
+
+def _file_sha256(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def encode_asset(rel_path: str) -> dict:
+    """Pick the best encoding per format for one asset and write the winners."""
+    src = os.path.join(PUBLIC_DIR, rel_path)
+    img = Image.open(src).convert("RGBA")
+    ref = np.array(img)
+
+    best = {}  # ext -> (label, data, metrics)
+    failed_ladders = set()
+    for label, ext, encode in candidates(img):
+        ladder = label.rsplit("-q", 1)[0]
+        if ladder in failed_ladders:
+            continue  # a lower quality on a ladder that already broke the budget
+        if label == "png" and "png" in best:
+            continue  # truecolor PNG is only needed when the palette PNG fails
+        data = encode()
+        metrics = measure(ref, data) if label != "png" else {"ssim": 1.0, "alpha_psnr": 99.0}
+        if not within_budget(metrics):
+            if "-q" in label:
+                failed_ladders.add(ladder)
+            continue
+        if ext not in best or len(data) < len(best[ext][1]):
+            best[ext] = (label, data, metrics)
+
+    logical_id = os.path.splitext(rel_path)[0].replace(os.sep, "/")
+    sources = []
+    for ext, (label, data, metrics) in best.items():
+        out_rel = f"{logical_id}.{ext}"
+        out_path = os.path.join(OUTPUT_DIR, out_rel)
+        os.makedirs(os.path.dirname(out_path), exist_ok=True)
+        with open(out_path, "wb") as f:
+            f.write(data)
+        sources.append({
+            "url": f"/encoded/{out_rel}",
+            "type": MIME_TYPES[ext],
+            "encoding": label,
+            "bytes": len(data),
+            **metrics,
+        })
+
+    # Smallest first, but the PNG always closes the list as the universal fallback
+    sources.sort(key=lambda s: (s["type"] == "image/png", s["bytes"]))
+    return {
+        "id": logical_id,
+        "width": img.width,
+        "height": img.height,
+        "original": {"url": "/" + rel_path.replace(os.sep, "/"), "bytes": os.path.getsize(src),
+                     "sha256": _file_sha256(src)},
+        "sources": sources,
+    }
+
+
+def main():
+    rel_paths = []
+    for d in ASSET_DIRS:
+        folder = os.path.join(PUBLIC_DIR, d)
+        if os.path.isdir(folder):
+            rel_paths += [os.path.join(d, f) for f in sorted(os.listdir(folder)) if f.endswith(".png")]
+
+    print(f"Encoding {len(rel_paths)} assets "
+          f"(budget: SSIM >= {MIN_SSIM}, alpha PSNR >= {MIN_ALPHA_PSNR} dB)...")
+    with ProcessPoolExecutor() as pool:
+        entries = list(pool.map(encode_asset, rel_paths))
+
+    total_before = total_after = 0
+    print(f"\n{'asset':<32} {'original':>10} {'best':>10} {'encoding':<14} {'saved':>6}")
+    for entry in entries:
+        before = entry["original"]["bytes"]
+        best = entry["sources"][0]
+        total_before += before
+        total_after += best["bytes"]
+        print(f"{entry['id']:<32} {before:>10,} {best['bytes']:>10,} {best['encoding']:<14} "
+              f"{100 * (1 - best['bytes'] / before):>5.1f}%")
+    print(f"{'TOTAL':<32} {total_before:>10,} {total_after:>10,} {'':<14} "
+          f"{100 * (1 - total_after / max(total_before, 1)):>5.1f}%")
+
+    manifest_path = os.path.join(OUTPUT_DIR, "manifest.json")
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump({"assets": {e["id"]: e for e in entries}}, f, indent=2)
+    print(f"\nDone! Wrote {manifest_path}")
+
+
+if __name__ == "__main__":
+    main()
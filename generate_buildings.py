@@ -3,21 +3,42 @@
 
 Creates house and hotel images in the style of classic Monopoly.
 
+Sprites are rendered supersampled at exactly the pixel size BoardRenderer
+draws them on each tile (computed from the board geometry in constants.ts),
+for 1x and 2x device pixel ratios, and packed into a single sheet.
+
 Usage:
     pip install pillow
-    python generate_buildings.py
+    python generate_buildings.py [--pngs]
 
-Outputs PNG files to public/buildings/
+Outputs public/sheets/buildings.png and public/sheets/buildings.json
+(plus PNG files in public/buildings/ with --pngs)
 """
 
 from PIL import Image, ImageDraw
+import argparse
+import json
 import os
 
+from board_defs import BoardGeometry, load_tile_defs
+from sprite_sheet import build_sheet
+
 OUTPUT_DIR = "public/buildings"
+SHEET_DIR = "public/sheets"
+
+SCALES = [1, 2]
+SUPERSAMPLE = 4
+BUILDING_FRACTION = 0.7  # sprite size relative to the tile, as in BoardRenderer
+SHEET_WIDTH = 512
+SHEET_PADDING = 2
+
 
+def draw_house(draw: ImageDraw.Draw, x: int, y: int, size: int, color: str = "#2e7d32", px: int = 1):
+    """Draw a single house at position (x, y).
 
-def draw_house(draw: ImageDraw.Draw, x: int, y: int, size: int, color: str = "#2e7d32"):
-    """Draw a single house at position (x, y)."""
+    `px` is the size of one output pixel in drawing units (the supersampling
+    factor); fixed offsets and outline widths are scaled by it.
+    """
     # House body (rectangle)
     body_h = int(size * 0.5)
     body_w = int(size * 0.7)
@@ -28,18 +49,19 @@ def draw_house(draw: ImageDraw.Draw, x: int, y: int, size: int, color: str = "#2
     roof_h = int(size * 0.4)
     roof_points = [
         (x, y - roof_h + int(size * 0.1)),  # top
-        (body_x - 2, body_y),  # bottom left
-        (body_x + body_w + 2, body_y),  # bottom right
+        (body_x - 2 * px, body_y),  # bottom left
+        (body_x + body_w + 2 * px, body_y),  # bottom right
     ]
 
     # Draw roof
-    draw.polygon(roof_points, fill="#8B4513", outline="#5D3A1A")
+    draw.polygon(roof_points, fill="#8B4513", outline="#5D3A1A", width=px)
 
     # Draw body
     draw.rectangle(
         [body_x, body_y, body_x + body_w, body_y + body_h],
         fill=color,
-        outline="#1B5E20"
+        outline="#1B5E20",
+        width=px,
     )
 
     # Draw door
@@ -50,11 +72,12 @@ def draw_house(draw: ImageDraw.Draw, x: int, y: int, size: int, color: str = "#2
     draw.rectangle(
         [door_x, door_y, door_x + door_w, body_y + body_h],
         fill="#5D3A1A",
-        outline="#3E2723"
+        outline="#3E2723",
+        width=px,
     )
 
 
-def draw_hotel(draw: ImageDraw.Draw, x: int, y: int, size: int):
+def draw_hotel(draw: ImageDraw.Draw, x: int, y: int, size: int, px: int = 1):
     """Draw a hotel at position (x, y)."""
     # Hotel body (taller rectangle)
     body_h = int(size * 0.7)
@@ -66,15 +89,17 @@ def draw_hotel(draw: ImageDraw.Draw, x: int, y: int, size: int):
     draw.rectangle(
         [body_x, body_y, body_x + body_w, body_y + body_h],
         fill="#c62828",
-        outline="#8B0000"
+        outline="#8B0000",
+        width=px,
     )
 
     # Draw roof
     roof_h = int(size * 0.15)
     draw.rectangle(
-        [body_x - 2, body_y - roof_h, body_x + body_w + 2, body_y],
+        [body_x - 2 * px, body_y - roof_h, body_x + body_w + 2 * px, body_y],
         fill="#8B0000",
-        outline="#5D0000"
+        outline="#5D0000",
+        width=px,
     )
 
     # Draw windows (2x2 grid)
@@ -90,7 +115,8 @@ def draw_hotel(draw: ImageDraw.Draw, x: int, y: int, size: int):
             draw.rectangle(
                 [wx, wy, wx + win_size, wy + win_size],
                 fill="#FFEB3B",
-                outline="#FBC02D"
+                outline="#FBC02D",
+                width=px,
             )
 
     # Draw door
@@ -101,11 +127,12 @@ def draw_hotel(draw: ImageDraw.Draw, x: int, y: int, size: int):
     draw.rectangle(
         [door_x, door_y, door_x + door_w, body_y + body_h],
         fill="#5D3A1A",
-        outline="#3E2723"
+        outline="#3E2723",
+        width=px,
     )
 
 
-def generate_building_sprite(level: int, size: int = 32) -> Image.Image:
+def generate_building_sprite(level: int, size: int = 32, px: int = 1) -> Image.Image:
     """Generate a building sprite for the given level (1-5)."""
     # Create transparent image
     img = Image.new("RGBA", (size, size), (0, 0, 0, 0))
@@ -113,21 +140,21 @@ def generate_building_sprite(level: int, size: int = 32) -> Image.Image:
 
     if level == 5:
         # Hotel
-        draw_hotel(draw, size // 2, size // 2, size)
+        draw_hotel(draw, size // 2, size // 2, size, px=px)
     elif level == 1:
         # Single house centered
-        draw_house(draw, size // 2, size // 2, size)
+        draw_house(draw, size // 2, size // 2, size, px=px)
     elif level == 2:
         # Two houses side by side
         house_size = int(size * 0.6)
-        draw_house(draw, size // 3, size // 2 + 2, house_size)
-        draw_house(draw, 2 * size // 3, size // 2 + 2, house_size)
+        draw_house(draw, size // 3, size // 2 + 2 * px, house_size, px=px)
+        draw_house(draw, 2 * size // 3, size // 2 + 2 * px, house_size, px=px)
     elif level == 3:
         # Three houses in triangle formation
         house_size = int(size * 0.5)
-        draw_house(draw, size // 2, size // 3, house_size)
-        draw_house(draw, size // 4, 2 * size // 3, house_size)
-        draw_house(draw, 3 * size // 4, 2 * size // 3, house_size)
+        draw_house(draw, size // 2, size // 3, house_size, px=px)
+        draw_house(draw, size // 4, 2 * size // 3, house_size, px=px)
+        draw_house(draw, 3 * size // 4, 2 * size // 3, house_size, px=px)
     elif level == 4:
         # Four houses in 2x2 grid
         house_size = int(size * 0.45)
@@ -137,23 +164,82 @@ def generate_building_sprite(level: int, size: int = 32) -> Image.Image:
             (size // 3, 2 * size // 3),
             (2 * size // 3, 2 * size // 3),
         ]
-        for px, py in positions:
-            draw_house(draw, px, py, house_size)
+        for hx, hy in positions:
+            draw_house(draw, hx, hy, house_size, px=px)
 
     return img
 
 
-def main():
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
+def render_supersampled(level: int, size: int, scale: int = 1) -> Image.Image:
+    """Render a sprite at SUPERSAMPLE x its final size and downsample it.
+
+    `scale` is the device pixel ratio the sprite is rendered for, so outlines
+    and offsets keep the same on-screen thickness at 2x.
+    """
+    big = generate_building_sprite(level, size * SUPERSAMPLE, px=SUPERSAMPLE * scale)
+    return big.resize((size, size), Image.LANCZOS)
+
 
-    # Generate building sprites for levels 1-5
-    for level in range(1, 6):
-        img = generate_building_sprite(level, size=48)
-        output_path = os.path.join(OUTPUT_DIR, f"building_{level}.png")
-        img.save(output_path)
-        print(f"Generated: {output_path}")
+def board_sprite_sizes(geometry: BoardGeometry, tiles: list) -> dict:
+    """On-board sprite size (device px) per property tile and scale.
 
-    print(f"\nDone! Generated 5 building sprites.")
+    Mirrors BoardRenderer: min(tileW, tileH) * BUILDING_FRACTION of the tile's
+    projected bounding box.
+    """
+    sizes = {}
+    for tile in tiles:
+        if tile["type"] != "PROPERTY":
+            continue
+        x0, y0, x1, y1 = geometry.tile_bbox(tile["index"])
+        base = min(x1 - x0, y1 - y0) * BUILDING_FRACTION
+        sizes[tile["index"]] = {scale: max(1, round(base * scale)) for scale in SCALES}
+    return sizes
+
+
+def generate_building_sheet() -> tuple[Image.Image, dict]:
+    """Pack every (scale, size, level) sprite the board needs into one sheet."""
+    tile_sizes = board_sprite_sizes(BoardGeometry(), load_tile_defs())
+    wanted = sorted({(scale, size) for per_scale in tile_sizes.values() for scale, size in per_scale.items()},
+                    key=lambda k: -k[1])
+
+    frames = {}
+    for scale, size in wanted:
+        for level in range(1, 6):
+            frames[f"{scale}:{size}:{level}"] = render_supersampled(level, size, scale)
+    sheet, rects = build_sheet(frames, SHEET_WIDTH, SHEET_PADDING)
+
+    manifest = {
+        "image": "buildings.png",
+        "scales": SCALES,
+        "tiles": {str(i): {str(s): v for s, v in per.items()} for i, per in tile_sizes.items()},
+        "frames": rects,
+    }
+    return sheet, manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate building sprites for 大富翁4.")
+    parser.add_argument("--pngs", action="store_true",
+                        help="also write the legacy 48px building_N.png files to public/buildings/")
+    args = parser.parse_args()
+
+    if args.pngs:
+        os.makedirs(OUTPUT_DIR, exist_ok=True)
+        for level in range(1, 6):
+            img = generate_building_sprite(level, size=48)
+            output_path = os.path.join(OUTPUT_DIR, f"building_{level}.png")
+            img.save(output_path)
+            print(f"Generated: {output_path}")
+
+    os.makedirs(SHEET_DIR, exist_ok=True)
+    sheet, manifest = generate_building_sheet()
+    sheet_path = os.path.join(SHEET_DIR, "buildings.png")
+    sheet.save(sheet_path, optimize=True)
+    with open(os.path.join(SHEET_DIR, "buildings.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    print(f"Generated: {sheet_path} ({sheet.width}x{sheet.height}, {len(manifest['frames'])} frames)")
+
+    print(f"\nDone! Generated building sheet for {len(manifest['tiles'])} property tiles.")
 
 
 if __name__ == "__main__":
@@ -14,6 +14,8 @@ import os
 import time
 import uuid
 
+import artifact_cache
+
 COMFYUI_URL = "http://127.0.0.1:8188"
 OUTPUT_DIR = "public/buildings"
 
@@ -141,6 +143,30 @@ def download_image(filename: str, subfolder: str, folder_type: str) -> bytes:
         return response.read()
 
 
+def render_workflow(workflow: dict) -> bytes:
+    """Queue a workflow and download its output image."""
+    prompt_id = queue_prompt(workflow)
+    print(f"  Queued prompt: {prompt_id}")
+
+    result = wait_for_completion(prompt_id)
+
+    status = result.get('status', {})
+    if status.get('status_str') == 'error':
+        raise RuntimeError(status)
+
+    # Find and download output image
+    outputs = result.get('outputs', {})
+    for node_id, node_output in outputs.items():
+        if 'images' in node_output:
+            img_info = node_output['images'][0]
+            return download_image(
+                img_info['filename'],
+                img_info.get('subfolder', ''),
+                img_info['type']
+            )
+    raise RuntimeError(f"Prompt {prompt_id} produced no image")
+
+
 def main():
     os.makedirs(OUTPUT_DIR, exist_ok=True)
 
@@ -153,32 +179,13 @@ def main():
         workflow = get_workflow(prompt, seed, filename_prefix)
 
         try:
-            prompt_id = queue_prompt(workflow)
-            print(f"  Queued prompt: {prompt_id}")
-
-            result = wait_for_completion(prompt_id)
-
-            status = result.get('status', {})
-            if status.get('status_str') == 'error':
-                print(f"  Error: {status}")
-                continue
-
-            # Find and download output image
-            outputs = result.get('outputs', {})
-            for node_id, node_output in outputs.items():
-                if 'images' in node_output:
-                    for img_info in node_output['images']:
-                        img_data = download_image(
-                            img_info['filename'],
-                            img_info.get('subfolder', ''),
-                            img_info['type']
-                        )
-                        out_path = os.path.join(OUTPUT_DIR, f"building_{level}.png")
-                        with open(out_path, 'wb') as f:
-                            f.write(img_data)
-                        print(f"  Saved: {out_path} ({len(img_data)} bytes)")
-                        break
-                    break
+            img_data, cached = artifact_cache.fetch_or_generate(
+                artifact_cache.workflow_key(workflow), lambda: render_workflow(workflow))
+            out_path = os.path.join(OUTPUT_DIR, f"building_{level}.png")
+            with open(out_path, 'wb') as f:
+                f.write(img_data)
+            origin = " from the artifact cache" if cached else ""
+            print(f"  Saved: {out_path} ({len(img_data)} bytes){origin}")
 
         except Exception as e:
             print(f"  Error: {e}")
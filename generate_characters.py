@@ -9,6 +9,8 @@ import time
 import urllib.request
 import urllib.parse
 
+import artifact_cache
+
 SERVER = "127.0.0.1:8188"
 OUTPUT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "public", "characters")
 
@@ -150,6 +152,21 @@ def download_image(filename: str, subfolder: str, folder_type: str) -> bytes:
         return resp.read()
 
 
+def render_workflow(workflow: dict) -> bytes:
+    """Queue a workflow and download its SaveImage output."""
+    prompt_id = queue_prompt(workflow)
+    print(f"  Queued prompt {prompt_id}, waiting for completion...")
+
+    entry = wait_for_completion(prompt_id)
+
+    # Find the SaveImage output
+    for node_id, node_out in entry["outputs"].items():
+        if "images" in node_out:
+            img_info = node_out["images"][0]
+            return download_image(img_info["filename"], img_info.get("subfolder", ""), img_info["type"])
+    raise RuntimeError(f"Prompt {prompt_id} produced no image")
+
+
 def main():
     os.makedirs(OUTPUT_DIR, exist_ok=True)
 
@@ -168,21 +185,17 @@ def main():
         seed = base_seed + i
         workflow = build_workflow(char["prompt"], f"richman4_{char['id']}", seed)
 
-        prompt_id = queue_prompt(workflow)
-        print(f"  Queued prompt {prompt_id}, waiting for completion...")
-
-        entry = wait_for_completion(prompt_id)
-
-        # Find the SaveImage output
-        for node_id, node_out in entry["outputs"].items():
-            if "images" in node_out:
-                for img_info in node_out["images"]:
-                    img_data = download_image(img_info["filename"], img_info.get("subfolder", ""), img_info["type"])
-                    with open(out_path, "wb") as f:
-                        f.write(img_data)
-                    print(f"  Saved to {out_path} ({len(img_data)} bytes)")
-                    break
-                break
+        # The seed is drawn at random on every run, so any cached sample will do
+        try:
+            img_data, cached = artifact_cache.fetch_or_generate(
+                artifact_cache.workflow_key(workflow, random_seed=True), lambda: render_workflow(workflow))
+        except Exception as e:
+            print(f"  Error: {e}")
+            continue
+        with open(out_path, "wb") as f:
+            f.write(img_data)
+        origin = " from the artifact cache" if cached else ""
+        print(f"  Saved to {out_path} ({len(img_data)} bytes){origin}")
 
     print("\nDone! All character images are in:", OUTPUT_DIR)
     for char in CHARACTERS:
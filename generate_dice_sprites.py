@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""Bake dice sprites for 大富翁4.
+
+Renders each of the six faces the way DiceRenderer draws a die (gradient body,
+rounded border, inner highlight and pips) at ROTATION_STEPS angles over a full
+turn, with the blurred drop shadow composited underneath in screen space. The
+pips repeat after half a turn but the body's diagonal gradient does not, so
+every orientation the dice tumble through gets its own frame. Frames are
+rendered supersampled at the final size for 1x and 2x, so DiceRenderer can draw
+a die, rolling or at rest, with one untransformed blit.
+
+Usage:
+    pip install pillow numpy
+    python generate_dice_sprites.py
+
+Outputs public/sheets/dice.png, public/sheets/dice@2x.png and
+public/sheets/dice.json
+"""
+
+import json
+import math
+import os
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFilter
+
+from board_defs import ROOT_DIR, load_numbers
+from sprite_sheet import build_sheet
+
+DICE_RENDERER_TS = os.path.join(ROOT_DIR, "src", "render", "DiceRenderer.ts")
+OUTPUT_DIR = os.path.join(ROOT_DIR, "public", "sheets")
+
+SCALES = [1, 2]
+SUPERSAMPLE = 4
+SHEET_WIDTH = 1024
+ROTATION_STEPS = 48  # frames per full turn (7.5 degrees apart)
+
+# Drop shadow as drawn by DiceRenderer: canvas shadowBlur is twice the
+# Gaussian sigma, and the offset is applied after the die's rotation
+SHADOW_ALPHA = 0.5
+SHADOW_BLUR = 8
+SHADOW_OFFSET = 4
+
+BODY_STOPS = [(0.0, (255, 255, 255)), (0.5, (245, 245, 245)), (1.0, (232, 232, 232))]
+BORDER_COLOR = "#555555"
+HIGHLIGHT_COLOR = (255, 255, 255, 204)
+PIP_COLOR = "#222222"
+
+PIP_RADIUS = 0.09
+PIP_OFFSET = 0.26
+PIPS = {
+    1: [(0, 0)],
+    2: [(-1, -1), (1, 1)],
+    3: [(-1, -1), (0, 0), (1, 1)],
+    4: [(-1, -1), (1, -1), (-1, 1), (1, 1)],
+    5: [(-1, -1), (1, -1), (0, 0), (-1, 1), (1, 1)],
+    6: [(-1, -1), (1, -1), (-1, 0), (1, 0), (-1, 1), (1, 1)],
+}
+
+
+def body_gradient(size: int) -> Image.Image:
+    """createLinearGradient(0, 0, size, size) with BODY_STOPS."""
+    t = np.add.outer(np.arange(size), np.arange(size)) / (2 * max(1, size - 1))
+    stops = np.array([s for s, _ in BODY_STOPS])
+    rgb = np.stack([np.interp(t, stops, [c[i] for _, c in BODY_STOPS]) for i in range(3)], axis=-1)
+    return Image.fromarray(rgb.astype(np.uint8), "RGB").convert("RGBA")
+
+
+def draw_die(face: int, die: int, radius: float, k: int) -> tuple[Image.Image, Image.Image]:
+    """Upright die at k drawing units per CSS pixel, with a 1px margin for the border.
+
+    Returns (die RGBA, body alpha); the body alpha is what casts the shadow.
+    """
+    m = k  # margin: the 2px border is centered on the body's edge
+    side = (die + 2) * k
+    body_mask = Image.new("L", (side, side), 0)
+    ImageDraw.Draw(body_mask).rounded_rectangle([m, m, m + die * k - 1, m + die * k - 1], radius * k, fill=255)
+
+    img = Image.new("RGBA", (side, side), (0, 0, 0, 0))
+    img.paste(body_gradient(die * k), (m, m), body_mask.crop((m, m, m + die * k, m + die * k)))
+    draw = ImageDraw.Draw(img)
+    draw.rounded_rectangle([0, 0, side - 1, side - 1], (radius + 1) * k, outline=BORDER_COLOR, width=2 * k)
+
+    highlight = Image.new("RGBA", (side, side), (0, 0, 0, 0))
+    ImageDraw.Draw(highlight).rounded_rectangle(
+        [m + 1.5 * k, m + 1.5 * k, m + (die - 1.5) * k, m + (die - 1.5) * k], (radius - 0.5) * k,
+        outline=HIGHLIGHT_COLOR, width=k)
+    img.alpha_composite(highlight)
+
+    c, off, r = side / 2, PIP_OFFSET * die * k, PIP_RADIUS * die * k
+    for dx, dy in PIPS[face]:
+        x, y = c + dx * off, c + dy * off
+        draw.ellipse([x - r, y - r, x + r, y + r], fill=PIP_COLOR)
+    return img, body_mask
+
+
+def frame_extent(die: int, radius: float) -> tuple[int, int]:
+    """Distance from the die center to the frame's top-left and bottom-right edges, CSS px."""
+    # Farthest point of a rounded square at 45 degrees, plus the border overhang
+    reach = (die / 2 - radius) * math.sqrt(2) + radius + 1
+    blur = 3 * SHADOW_BLUR / 2
+    near = math.ceil(max(reach, reach + blur - SHADOW_OFFSET))
+    far = math.ceil(reach + SHADOW_OFFSET + blur)
+    return near, far
+
+
+def bake_die(face: int, angle: float, die: int, radius: float, scale: int) -> Image.Image:
+    """One die frame at `scale` device pixels per CSS pixel, rotated clockwise by `angle`."""
+    k = scale * SUPERSAMPLE
+    near, far = frame_extent(die, radius)
+    frame_side = (near + far) * k
+    img, body = draw_die(face, die, radius, k)
+    degrees = -math.degrees(angle)  # canvas rotates clockwise, PIL counter-clockwise
+    img = img.rotate(degrees, Image.BICUBIC, expand=True)
+    body = body.rotate(degrees, Image.BICUBIC, expand=True)
+
+    origin = (near * k - img.width // 2, near * k - img.height // 2)
+    shadow_mask = Image.new("L", (frame_side, frame_side), 0)
+    shadow_mask.paste(body, (origin[0] + SHADOW_OFFSET * k, origin[1] + SHADOW_OFFSET * k))
+    shadow_mask = shadow_mask.filter(ImageFilter.GaussianBlur(SHADOW_BLUR / 2 * k))
+    shadow_mask = shadow_mask.point(lambda v: round(v * SHADOW_ALPHA))
+    frame = Image.new("RGBA", (frame_side, frame_side), (0, 0, 0, 0))
+    frame.putalpha(shadow_mask)
+    frame.alpha_composite(img, origin)
+
+    side = (near + far) * scale
+    return frame.resize((side, side), Image.LANCZOS)
+
+
+def main():
+    consts = load_numbers(DICE_RENDERER_TS)
+    die, radius = int(consts["DIE_SIZE"]), consts["DIE_RADIUS"]
+    near, _ = frame_extent(die, radius)
+
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    images, rects = {}, {}
+    for scale in SCALES:
+        frames = {}
+        for face in PIPS:
+            for step in range(ROTATION_STEPS):
+                frames[f"{scale}:{face}:{step}"] = bake_die(face, step * 2 * math.pi / ROTATION_STEPS, die, radius, scale)
+        sheet, scale_rects = build_sheet(frames, SHEET_WIDTH * scale)
+        name = "dice.png" if scale == 1 else f"dice@{scale}x.png"
+        sheet.save(os.path.join(OUTPUT_DIR, name), optimize=True)
+        images[str(scale)] = name
+        rects.update(scale_rects)
+        print(f"  {name}: {sheet.width}x{sheet.height}, {len(frames)} frames")
+
+    manifest = {
+        "images": images,
+        "dieSize": die,
+        "rotationSteps": ROTATION_STEPS,
+        # Offset from the frame's top-left to the die center, in CSS pixels
+        "center": [near, near],
+        "frames": rects,
+    }
+    with open(os.path.join(OUTPUT_DIR, "dice.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+
+    print(f"\nDone! Generated {len(rects)} dice frames in {OUTPUT_DIR}")
+
+
+if __name__ == "__main__":
+    main()
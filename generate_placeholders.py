@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""Generate procedural stand-ins for every generated asset of 大富翁4.
+
+A clean build otherwise needs ComfyUI with the z_image_turbo models and
+network TTS. This writes, in a few seconds and with PIL only, stand-ins with
+the names, sizes and formats the real stages produce, so the downstream
+stages (remove_bg, the sheet and atlas generators, encode_assets, hash_assets,
+pack_assets) and their benchmarks run end-to-end anywhere:
+
+  portraits     public/characters/<id>.png           1024x1024, drawn on white
+                                                     and matted as remove_bg.py does
+  walk frames   public/characters/<id>_walk_<n>.png  the same, one per WALK_POSES
+                                                     entry, legs and arms posed
+  buildings     public/buildings/building_<n>.png    512x512 RGBA
+  voices        public/voices/<id>/<line>.mp3        silent 24 kHz mono 48 kbps
+                                                     MP3, the Edge TTS format,
+                                                     timed to the line's length
+
+Names come from CHARACTER_DEFS, generate_walk_frames.WALK_POSES and
+generate_voices.CHARACTERS. Existing files are kept unless --force is given.
+Every file written is recorded with its hash in .cache/standins.json (build
+metadata, kept out of public/ so it is never served), and hash_assets.py
+flags those assets with "standIn" in the manifest until they are replaced by
+real renders.
+
+Usage:
+    pip install pillow
+    python generate_placeholders.py [--force]
+    python remove_bg.py  # then the usual stages
+
+Outputs files to public/characters/, public/buildings/, public/voices/ and
+.cache/standins.json
+"""
+
+import argparse
+import colorsys
+import hashlib
+import json
+import math
+import os
+import time
+
+from PIL import Image, ImageDraw
+
+from board_defs import ROOT_DIR, load_character_defs
+from generate_buildings import generate_building_sprite
+from generate_voices import CHARACTERS as VOICE_LINES
+from generate_walk_frames import WALK_POSES, remove_background
+
+PUBLIC_DIR = os.path.join(ROOT_DIR, "public")
+STANDINS_PATH = os.path.join(ROOT_DIR, ".cache", "standins.json")
+
+PORTRAIT_SIZE = 1024
+BUILDING_SIZE = 512
+SUPERSAMPLE = 2
+
+# Edge TTS output format: MPEG-2 Layer III, 24 kHz, 48 kbps, mono. A frame
+# whose side info is all zero decodes to 576 samples of silence.
+MP3_HEADER = bytes([0xFF, 0xF3, 0x64, 0xC4])
+MP3_FRAME_BYTES = 144
+MP3_FRAME_SECONDS = 576 / 24000
+SECONDS_PER_CHAR = 0.28
+SECONDS_LEAD = 0.4
+
+# Leg and arm swing (radians, + is forward) for each walk pose, in
+# WALK_POSES order: left stride, passing, right stride, passing
+POSE_SWING = [(0.45, -0.45), (0.05, -0.05), (-0.45, 0.45), (-0.05, 0.05)]
+
+
+def character_colors(char_id: str) -> tuple:
+    """Stable (clothes, accent) colours from the character id."""
+    hue = int(hashlib.sha256(char_id.encode()).hexdigest()[:4], 16) / 0xFFFF
+    clothes = colorsys.hsv_to_rgb(hue, 0.55, 0.85)
+    accent = colorsys.hsv_to_rgb((hue + 0.5) % 1, 0.6, 0.6)
+    return tuple(round(c * 255) for c in clothes), tuple(round(c * 255) for c in accent)
+
+
+def _limb(draw: ImageDraw.ImageDraw, top: tuple, length: float, angle: float, width: float, fill):
+    end = (top[0] + length * math.sin(angle), top[1] + length * math.cos(angle))
+    draw.line([top, end], fill=fill, width=round(width))
+    r = width / 2
+    draw.ellipse([end[0] - r, end[1] - r, end[0] + r, end[1] + r], fill=fill)
+
+
+def draw_figure(char_id: str, swing: tuple | None) -> Image.Image:
+    """Chibi stand-in figure on white; `swing` is (leg, arm) for a side-on walk pose, None to stand."""
+    size = PORTRAIT_SIZE * SUPERSAMPLE
+    u = size / 100  # layout unit
+    img = Image.new("RGB", (size, size), (255, 255, 255))
+    draw = ImageDraw.Draw(img)
+    clothes, accent = character_colors(char_id)
+    skin, outline = (250, 214, 180), (60, 50, 45)
+    cx = 50 * u
+
+    leg, arm = swing if swing else (0.12, 0.18)
+    hip, shoulder = (cx, 66 * u), (cx, 46 * u)
+    # Far limbs first, then the body, then the near limbs
+    _limb(draw, (hip[0] - 2 * u, hip[1]), 20 * u, -leg, 7 * u, accent)
+    _limb(draw, (shoulder[0] - 3 * u, shoulder[1]), 17 * u, -arm, 5 * u, skin)
+    draw.rounded_rectangle([cx - 12 * u, 42 * u, cx + 12 * u, 70 * u], 6 * u, fill=clothes, outline=outline,
+                           width=round(0.6 * u))
+    _limb(draw, (hip[0] + 2 * u, hip[1]), 20 * u, leg, 7 * u, accent)
+    _limb(draw, (shoulder[0] + 3 * u, shoulder[1]), 17 * u, arm, 5 * u, skin)
+
+    head_y = 28 * u
+    draw.ellipse([cx - 16 * u, head_y - 16 * u, cx + 16 * u, head_y + 16 * u], fill=skin, outline=outline,
+                 width=round(0.6 * u))
+    draw.chord([cx - 16 * u, head_y - 17 * u, cx + 16 * u, head_y + 9 * u], 180, 360, fill=accent)
+    facing = 5 * u if swing else 0  # walk frames face right, like the generated ones
+    for ex in (-6 * u, 6 * u):
+        x = cx + ex + facing
+        draw.ellipse([x - 2 * u, head_y + 1 * u, x + 2 * u, head_y + 5 * u], fill=outline)
+    return img.resize((PORTRAIT_SIZE, PORTRAIT_SIZE), Image.LANCZOS)
+
+
+def silent_mp3(seconds: float) -> bytes:
+    frames = max(1, math.ceil(seconds / MP3_FRAME_SECONDS))
+    return (MP3_HEADER + bytes(MP3_FRAME_BYTES - len(MP3_HEADER))) * frames
+
+
+class StandInWriter:
+    """Writes stand-ins that are missing (or all with force) and records their hashes."""
+
+    def __init__(self, force: bool):
+        self.force = force
+        self.written = {}
+        self.kept = 0
+
+    def wanted(self, rel_path: str) -> bool:
+        if self.force or not os.path.exists(os.path.join(PUBLIC_DIR, rel_path)):
+            return True
+        self.kept += 1
+        return False
+
+    def write(self, rel_path: str, data: bytes):
+        path = os.path.join(PUBLIC_DIR, rel_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(data)
+        self.written["/" + rel_path] = hashlib.sha256(data).hexdigest()
+
+    def write_image(self, rel_path: str, img: Image.Image, matte: bool = False):
+        path = os.path.join(PUBLIC_DIR, rel_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        img.save(path)
+        if matte:
+            remove_background(path)
+        with open(path, "rb") as f:
+            self.written["/" + rel_path] = hashlib.sha256(f.read()).hexdigest()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--force", action="store_true", help="replace existing assets too")
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    out = StandInWriter(args.force)
+    for char in load_character_defs():
+        portrait = char["imagePath"].lstrip("/")
+        if out.wanted(portrait):
+            out.write_image(portrait, draw_figure(char["id"], None), matte=True)
+        for n in range(len(WALK_POSES)):
+            rel = f"characters/{char['id']}_walk_{n}.png"
+            if out.wanted(rel):
+                out.write_image(rel, draw_figure(char["id"], POSE_SWING[n % len(POSE_SWING)]), matte=True)
+
+    for level in range(1, 6):
+        rel = f"buildings/building_{level}.png"
+        if out.wanted(rel):
+            out.write_image(rel, generate_building_sprite(level, size=BUILDING_SIZE, px=BUILDING_SIZE // 48))
+
+    for char_id, config in VOICE_LINES.items():
+        for line_id, text in config["lines"].items():
+            rel = f"voices/{char_id}/{line_id}.mp3"
+            if out.wanted(rel):
+                out.write(rel, silent_mp3(SECONDS_LEAD + SECONDS_PER_CHAR * len(text)))
+
+    standins = {}
+    if os.path.exists(STANDINS_PATH):
+        with open(STANDINS_PATH, encoding="utf-8") as f:
+            standins = json.load(f)
+    standins.update(out.written)
+    os.makedirs(os.path.dirname(STANDINS_PATH), exist_ok=True)
+    with open(STANDINS_PATH, "w", encoding="utf-8") as f:
+        json.dump(dict(sorted(standins.items())), f, indent=2)
+
+    print(f"\nDone! Wrote {len(out.written)} stand-ins in {time.perf_counter() - t0:.1f}s "
+          f"(kept {out.kept} existing assets; --force replaces them)")
+
+
+if __name__ == "__main__":
+    main()
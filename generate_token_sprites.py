@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""Bake board token sprites for 大富翁4.
+
+For every character in CHARACTER_DEFS this renders the standing pose and each
+walk frame at the final token size (TOKEN_SIZE in TokenRenderer.ts) for 1x and
+2x, in both facings (the sprites face right; left-facing copies are mirrored
+here instead of with a canvas transform), with a soft drop shadow composited
+underneath. TokenRenderer can then draw a token with one untransformed blit.
+
+Between consecutive walk frames it appends --inbetweens synthesized frames
+(inbetween.py, on the CPU at the final token size), so the walk cycle plays
+smoother without generating more poses. The default cross-dissolve beats
+optical flow on both speed and fidelity in bench_inbetween.py. The walk poses
+in the sheet are numbered along the whole cycle: walk0 is the first generated
+frame, walk1 the first in-between, and so on.
+
+Usage:
+    pip install pillow numpy scipy
+    python generate_token_sprites.py [--inbetweens 1] [--method blend|flow]
+
+Outputs public/sheets/tokens.png and public/sheets/tokens.json
+"""
+
+import argparse
+import json
+import math
+import os
+
+from PIL import Image, ImageDraw, ImageFilter, ImageOps
+
+from board_defs import ROOT_DIR, load_character_defs, load_numbers
+from inbetween import inbetweens
+from sprite_sheet import build_sheet
+
+TOKEN_RENDERER_TS = os.path.join(ROOT_DIR, "src", "render", "TokenRenderer.ts")
+PUBLIC_DIR = os.path.join(ROOT_DIR, "public")
+OUTPUT_DIR = os.path.join(PUBLIC_DIR, "sheets")
+
+SCALES = [1, 2]
+SHEET_WIDTH = 1024
+
+# Token geometry relative to its size, as drawn by TokenRenderer: the sprite's
+# top-left sits at (pos.x - 0.5s, pos.y - 0.7s) and the shadow ellipse is
+# centered at (pos.x, pos.y + 0.38s) with radii 0.3s x 0.12s.
+ANCHOR_Y = 0.7
+SHADOW_Y = 0.38
+SHADOW_RX = 0.3
+SHADOW_RY = 0.12
+SHADOW_ALPHA = 0.4
+SHADOW_BLUR = 0.03  # Gaussian sigma, relative to token size
+
+
+def shadow_layer(width: int, height: int, size: int, anchor_y: float) -> Image.Image:
+    """Soft elliptical drop shadow in frame coordinates."""
+    mask = Image.new("L", (width, height), 0)
+    cx, cy = width / 2, anchor_y + SHADOW_Y * size
+    rx, ry = SHADOW_RX * size, SHADOW_RY * size
+    ImageDraw.Draw(mask).ellipse([cx - rx, cy - ry, cx + rx, cy + ry], fill=round(255 * SHADOW_ALPHA))
+    mask = mask.filter(ImageFilter.GaussianBlur(SHADOW_BLUR * size))
+    layer = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+    layer.putalpha(mask)
+    return layer
+
+
+def bake_token(sprite: Image.Image, size: int, mirror: bool) -> Image.Image:
+    """Token sprite (already `size` device pixels square) with its shadow composited underneath."""
+    # The shadow extends below the sprite; leave room for it plus the blur
+    margin = math.ceil(3 * SHADOW_BLUR * size)
+    height = math.ceil(ANCHOR_Y * size + (SHADOW_Y + SHADOW_RY) * size) + margin
+    frame = shadow_layer(size, height, size, ANCHOR_Y * size)
+    if mirror:
+        sprite = ImageOps.mirror(sprite)
+    frame.alpha_composite(sprite, (0, 0))
+    return frame
+
+
+def load_sprite(url: str, size: int) -> Image.Image | None:
+    path = os.path.join(PUBLIC_DIR, url.lstrip("/"))
+    if not os.path.exists(path):
+        return None
+    return Image.open(path).convert("RGBA").resize((size, size), Image.LANCZOS)
+
+
+def walk_cycle(walk: list, steps: int, method: str) -> dict:
+    """Walk poses along the cycle: each generated frame followed by steps - 1 in-betweens.
+
+    `walk` holds the sized walk frames (None where missing); no in-betweens
+    are synthesized next to a missing frame.
+    """
+    poses = {}
+    for i, frame in enumerate(walk):
+        if frame is None:
+            continue
+        poses[f"walk{i * steps}"] = frame
+        following = walk[(i + 1) % len(walk)]
+        if steps > 1 and following is not None:
+            for j, mid in enumerate(inbetweens(frame, following, steps - 1, method), start=1):
+                poses[f"walk{i * steps + j}"] = mid
+    return poses
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--inbetweens", type=int, default=1, help="frames synthesized between walk frames")
+    parser.add_argument("--method", choices=["blend", "flow"], default="blend")
+    args = parser.parse_args()
+    steps = args.inbetweens + 1
+
+    token_size = int(load_numbers(TOKEN_RENDERER_TS)["TOKEN_SIZE"])
+    frames = {}
+    walk_frames = 0
+    for char in load_character_defs():
+        for url in [char["imagePath"]] + char["walkFrames"]:
+            if not os.path.exists(os.path.join(PUBLIC_DIR, url.lstrip("/"))):
+                print(f"  Skipped (not found): {url}")
+        walk_frames = max(walk_frames, len(char["walkFrames"]) * steps)
+        for scale in SCALES:
+            size = token_size * scale
+            stand = load_sprite(char["imagePath"], size)
+            poses = {"stand": stand} if stand else {}
+            poses.update(walk_cycle([load_sprite(url, size) for url in char["walkFrames"]], steps, args.method))
+            for pose, sprite in poses.items():
+                for facing in ("R", "L"):
+                    frames[f"{scale}:{char['id']}:{pose}:{facing}"] = bake_token(sprite, size, mirror=facing == "L")
+        print(f"  Baked: {char['id']} ({len(poses)} poses)")
+
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    sheet, rects = build_sheet(frames, SHEET_WIDTH)
+    sheet_path = os.path.join(OUTPUT_DIR, "tokens.png")
+    sheet.save(sheet_path, optimize=True)
+
+    manifest = {
+        "image": "tokens.png",
+        "tokenSize": token_size,
+        "scales": SCALES,
+        # Walk poses per cycle, and how many of them play per generated walk frame
+        "walkFrames": walk_frames,
+        "walkSteps": steps,
+        # Offset from the token position to the frame's top-left, in CSS pixels
+        "anchor": [token_size / 2, ANCHOR_Y * token_size],
+        "frames": rects,
+    }
+    with open(os.path.join(OUTPUT_DIR, "tokens.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+
+    print(f"\nDone! Generated {sheet_path} ({sheet.width}x{sheet.height}, {len(rects)} frames)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,10 @@
 #!/usr/bin/env python3
 """Generate character voice lines for 大富翁4 using Edge TTS.
 
+Lines already in the shared artifact cache ($ARTIFACT_CACHE_URL, see
+artifact_cache.py), keyed by voice, text and prosody, are downloaded instead
+of synthesized.
+
 Usage:
     pip install edge-tts
     python generate_voices.py
@@ -10,7 +14,8 @@ Outputs MP3 files to public/voices/{characterId}/{voiceId}.mp3
 
 import asyncio
 import os
-import edge_tts
+
+import artifact_cache
 
 # Character voice configurations
 CHARACTERS = {
@@ -91,12 +96,26 @@ CHARACTERS = {
 
 OUTPUT_DIR = "public/voices"
 
+# Prosody passed to Edge TTS; part of the artifact cache key
+TTS_PARAMS = {"rate": "+0%", "volume": "+0%", "pitch": "+0Hz"}
+
 
 async def generate_voice(voice: str, text: str, output_path: str):
     """Generate a single voice line."""
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    communicate = edge_tts.Communicate(text, voice)
+    key = artifact_cache.artifact_key("edge-tts", {"voice": voice, "text": text, **TTS_PARAMS})
+    data = artifact_cache.fetch(key)
+    if data is not None:
+        with open(output_path, "wb") as f:
+            f.write(data)
+        print(f"  From artifact cache: {output_path}")
+        return
+    import edge_tts  # only needed on a cache miss; CHARACTERS is imported without it
+
+    communicate = edge_tts.Communicate(text, voice, **TTS_PARAMS)
     await communicate.save(output_path)
+    with open(output_path, "rb") as f:
+        artifact_cache.store(key, f.read())
     print(f"  Generated: {output_path}")
 
 
@@ -10,6 +10,8 @@ import urllib.request
 import urllib.parse
 import random
 
+import artifact_cache
+
 SERVER = "127.0.0.1:8188"
 OUTPUT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "public", "characters")
 
@@ -157,55 +159,31 @@ def download_image(filename: str, subfolder: str, folder_type: str) -> bytes:
         return resp.read()
 
 
+def render_workflow(workflow: dict) -> bytes:
+    """Queue a workflow and download its SaveImage output."""
+    prompt_id = queue_prompt(workflow)
+    print(f"  Queued prompt {prompt_id}, waiting...")
+
+    entry = wait_for_completion(prompt_id)
+
+    for node_id, node_out in entry["outputs"].items():
+        if "images" in node_out:
+            img_info = node_out["images"][0]
+            return download_image(img_info["filename"], img_info.get("subfolder", ""), img_info["type"])
+    raise RuntimeError(f"Prompt {prompt_id} produced no image")
+
+
 def remove_background(img_path: str):
-    """Remove background from a single image (same logic as remove_bg.py)."""
-    from PIL import Image
-    import numpy as np
-    from scipy import ndimage
-
-    img = Image.open(img_path).convert('RGBA')
-    data = np.array(img)
-    h, w = data.shape[:2]
-
-    corners = [
-        data[0:20, 0:20],
-        data[0:20, w-20:w],
-        data[h-20:h, 0:20],
-        data[h-20:h, w-20:w],
-    ]
-    bg_color = np.mean(np.concatenate([c.reshape(-1, 4) for c in corners], axis=0), axis=0)[:3]
-
-    rgb = data[:, :, :3].astype(float)
-    diff = np.sqrt(np.sum((rgb - bg_color) ** 2, axis=2))
-
-    threshold = 50
-    soft_edge = 20
-
-    bg_mask = diff < (threshold + soft_edge)
-    labeled, num_features = ndimage.label(bg_mask)
-    border_labels = set()
-    border_labels.update(labeled[0, :].tolist())
-    border_labels.update(labeled[-1, :].tolist())
-    border_labels.update(labeled[:, 0].tolist())
-    border_labels.update(labeled[:, -1].tolist())
-    border_labels.discard(0)
-
-    edge_bg = np.zeros((h, w), dtype=bool)
-    for lbl in border_labels:
-        edge_bg |= (labeled == lbl)
-
-    final_alpha = np.full((h, w), 255, dtype=np.uint8)
-    # Vectorized version for speed
-    bg_pixels = edge_bg & (diff < threshold)
-    soft_pixels = edge_bg & (~bg_pixels)
-    final_alpha[bg_pixels] = 0
-    soft_alpha = np.clip((diff[soft_pixels] - threshold) / soft_edge * 255, 0, 255).astype(np.uint8)
-    final_alpha[soft_pixels] = soft_alpha
-
-    data[:, :, 3] = final_alpha
-    result = Image.fromarray(data)
-    result.save(img_path)
-    print(f"    Background removed: {os.path.basename(img_path)}")
+    """Remove background from a single image (same logic as remove_bg.py).
+
+    Goes through remove_bg so the raw decode is cached before matting and any
+    per-asset entry in matting_overrides.json is respected.
+    """
+    import remove_bg
+
+    name = os.path.basename(img_path)
+    threshold, soft_edge = remove_bg.matting_params(name, remove_bg.load_overrides())
+    remove_bg.remove_background(img_path, threshold, soft_edge)
 
 
 def main():
@@ -229,20 +207,18 @@ def main():
             print(f"[{count}/{total}] Generating {char['name']} walk frame {frame_idx}...")
             workflow = build_workflow(prompt_text, f"richman4_{char['id']}_walk_{frame_idx}", seed)
 
-            prompt_id = queue_prompt(workflow)
-            print(f"  Queued prompt {prompt_id}, waiting...")
-
-            entry = wait_for_completion(prompt_id)
-
-            for node_id, node_out in entry["outputs"].items():
-                if "images" in node_out:
-                    for img_info in node_out["images"]:
-                        img_data = download_image(img_info["filename"], img_info.get("subfolder", ""), img_info["type"])
-                        with open(out_path, "wb") as f:
-                            f.write(img_data)
-                        print(f"  Saved: {out_path} ({len(img_data)} bytes)")
-                        break
-                    break
+            # The cache holds the raw render; matting below stays local. The seed
+            # is drawn at random on every run, so any cached sample will do.
+            try:
+                img_data, cached = artifact_cache.fetch_or_generate(
+                    artifact_cache.workflow_key(workflow, random_seed=True), lambda: render_workflow(workflow))
+            except Exception as e:
+                print(f"  Error: {e}")
+                continue
+            with open(out_path, "wb") as f:
+                f.write(img_data)
+            origin = " from the artifact cache" if cached else ""
+            print(f"  Saved: {out_path} ({len(img_data)} bytes){origin}")
 
             # Remove background immediately
             remove_background(out_path)
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""Pre-rasterize the HUD and board text of 大富翁4 into a glyph atlas.
+
+Collects the static glyph set straight from the renderers: every fillText call
+in UIRenderer, TokenRenderer and BoardRenderer is paired with the literal
+ctx.font in effect, and its text is resolved to the strings it can show:
+literals and the static parts of template strings as written, names and
+labels from the defs in constants.ts and GameEngine (see TEXT_SOURCES), and
+local variables through the literals assigned to them. Calls whose font is
+computed at runtime (the board's tile labels, already baked into the static
+board layer by render_board.py) are skipped.
+
+Each font style's glyphs are rasterized white, at 1x and 2x, with the font
+bundled by bundle_font.py (the face the game's fillText draws with too), into
+one band of the sheet per style so src/render/GlyphAtlas.ts can tint a band
+per fill colour and draw labels as glyph blits. Each style records its em box,
+which canvas textBaseline 'top', 'middle' and 'bottom' align to. Text using a
+glyph the atlas lacks falls back to fillText.
+
+Usage:
+    pip install pillow fonttools
+    python bundle_font.py path/to/NotoSansCJKsc-Regular.otf
+    python glyph_atlas.py
+
+Outputs public/sheets/glyphs.png, public/sheets/glyphs@2x.png and
+public/sheets/glyphs.json
+"""
+
+import json
+import os
+import re
+
+from PIL import Image, ImageDraw
+
+from board_defs import (BUNDLED_FONT, ROOT_DIR, em_box, load_character_defs, load_font, load_strings,
+                        load_tile_defs)
+from sprite_sheet import build_sheet
+
+OUTPUT_DIR = "public/sheets"
+SCALES = [1, 2]
+SHEET_WIDTH = 512
+GLYPH_PADDING = 1
+
+RENDER_DIR = os.path.join(ROOT_DIR, "src", "render")
+SOURCES = [os.path.join(RENDER_DIR, name) for name in ("UIRenderer.ts", "TokenRenderer.ts", "BoardRenderer.ts")]
+ENGINE_TS = os.path.join(ROOT_DIR, "src", "core", "GameEngine.ts")
+
+DIGITS = "0123456789-$"
+
+# Code point with no glyph in any font, used to recognise the .notdef box
+NOTDEF_PROBE = "\U000F0000"
+
+
+def _names() -> str:
+    return "".join(c["name"] for c in load_character_defs()) + "".join(load_strings("PLAYER_NAMES"))
+
+
+def _button_labels() -> str:
+    """Everything drawButton can be handed: GameEngine option labels and UIRenderer's own."""
+    with open(ENGINE_TS, encoding="utf-8") as f:
+        engine = [line for line in f if re.search(r"\blabel:|\bbuildingName\s*=", line)]
+    with open(SOURCES[0], encoding="utf-8") as f:
+        ui = [line for line in f if re.search(r"\bdrawButton\(|Label\s*=", line)]
+    # Drop action ids ('buy', 'toggleAutoPlay'), which are passed alongside but never drawn
+    lines = [re.sub(r"'[A-Za-z_]+'", "", line) for line in engine + ui]
+    return "".join(line_text(line, skip=_button_labels) for line in lines)
+
+
+# Expressions in drawn text -> the strings they can evaluate to
+TEXT_SOURCES = [
+    (r"\b(?:player|winner|char)\.name\b|\binitial\b", _names),
+    (r"\bchar\.description\b", lambda: "".join(load_strings("CHARACTER_DEFS", "description"))),
+    (r"\bcardDef\.name\b", lambda: "".join(load_strings("CARD_DEFS", "name"))),
+    (r"\bstock\.name\b", lambda: "".join(load_strings("STOCK_DEFS", "name"))),
+    (r"\btile\.name\b", lambda: "".join(t["name"] for t in load_tile_defs())),
+    (r"\blabel\b", _button_labels),
+    (r"\.(?:money|price|buildCost|buildings|immuneTurns)\b|\bholding\b", lambda: DIGITS),
+]
+
+
+def _unescape(s: str) -> str:
+    s = re.sub(r"\\u([0-9a-fA-F]{4})", lambda m: chr(int(m.group(1), 16)), s)
+    return re.sub(r"\\(.)", r"\1", s)
+
+
+def literals(code: str) -> str:
+    """Characters of the string literals in a line of TS, template expressions removed."""
+    text = ""
+    for template in re.findall(r"`([^`]*)`", code):
+        text += _unescape(re.sub(r"\$\{[^}]*\}", "", template))
+    for quoted in re.findall(r"'((?:[^'\\]|\\.)*)'", re.sub(r"`[^`]*`", "", code)):
+        text += _unescape(quoted)
+    return text
+
+
+def line_text(code: str, skip=None) -> str:
+    """Literals of a line plus every text source (other than `skip`) an expression on it refers to."""
+    text = literals(code)
+    for pattern, source in TEXT_SOURCES:
+        if source is not skip and re.search(pattern, code):
+            text += source()
+    return text
+
+
+def expression_text(expr: str, lines: list) -> str:
+    """Strings a fillText argument can show; bare locals resolve through their assignments."""
+    text = line_text(expr)
+    local_names = [expr] if re.fullmatch(r"[A-Za-z_]\w*", expr) else re.findall(r"\$\{\s*([A-Za-z_]\w*)\s*\}", expr)
+    for name in local_names:
+        if not any(re.search(pattern, name) for pattern, _ in TEXT_SOURCES):
+            assigned = re.compile(rf"\b{name}\s*\+?=(?!=)")
+            text += "".join(line_text(line) for line in lines if assigned.search(line))
+    return text
+
+
+def collect_glyphs(paths: list) -> dict:
+    """Font style ("bold 14px") -> characters drawn with it."""
+    styles = {}
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        style = None
+        for line in lines:
+            font = re.search(r"ctx\.font\s*=\s*(['`])(.*?)\1", line)
+            if font:
+                m = re.match(r"(bold\s+)?(\d+)px", font.group(2))
+                style = f"{'bold ' if m.group(1) else ''}{m.group(2)}px" if font.group(1) == "'" and m else None
+            call = re.search(r"\.fillText\((?:ctx,\s*)?(.*),[^,]*,[^,]*\);", line)
+            if call and style:
+                styles.setdefault(style, set()).update(expression_text(call.group(1).strip(), lines))
+    return {s: "".join(sorted(chars)) for s, chars in styles.items()}
+
+
+def parse_style(style: str) -> tuple[int, bool]:
+    m = re.match(r"(bold )?(\d+)px", style)
+    return int(m.group(2)), bool(m.group(1))
+
+
+def _ink(font, ch: str) -> tuple:
+    x0, y0, x1, y1 = font.getbbox(ch)
+    img = Image.new("L", (max(1, x1 - x0), max(1, y1 - y0)))
+    ImageDraw.Draw(img).text((-x0, -y0), ch, font=font, fill=255)
+    return img.size, img.tobytes()
+
+
+def rasterize(ch: str, font, notdef: tuple):
+    """(white RGBA glyph image, left, top) relative to the pen on the baseline; None if blank or missing."""
+    if _ink(font, ch) == notdef and ch != NOTDEF_PROBE:
+        raise KeyError(ch)
+    x0, y0, x1, y1 = font.getbbox(ch, anchor="ls")
+    if x1 <= x0 or y1 <= y0:
+        return None
+    pad = GLYPH_PADDING
+    img = Image.new("RGBA", (x1 - x0 + 2 * pad, y1 - y0 + 2 * pad), (255, 255, 255, 0))
+    ImageDraw.Draw(img).text((pad - x0, pad - y0), ch, font=font, fill=(255, 255, 255, 255), anchor="ls")
+    return img, x0 - pad, y0 - pad
+
+
+def build_style(style: str, chars: str) -> tuple[dict, dict, list]:
+    """Metrics of one style and its per-scale glyph sheets; reports characters the font lacks."""
+    size, bold = parse_style(style)
+    base = load_font(size, bold)
+    em_ascent, em_descent = em_box(bold)
+    advances, missing = {}, []
+    frames = {scale: {} for scale in SCALES}
+    offsets = {scale: {} for scale in SCALES}
+    for scale in SCALES:
+        font = load_font(size * scale, bold)
+        notdef = _ink(font, NOTDEF_PROBE)
+        for ch in chars:
+            try:
+                glyph = rasterize(ch, font, notdef)
+            except KeyError:
+                if scale == SCALES[0]:
+                    missing.append(ch)
+                continue
+            if scale == SCALES[0]:
+                advances[ch] = round(base.getlength(ch), 2)
+            if glyph:
+                frames[scale][ch], offsets[scale][ch] = glyph[0], glyph[1:]
+
+    meta = {"emAscent": round(em_ascent * size, 2), "emDescent": round(em_descent * size, 2), "advances": advances, "bands": {}, "glyphs": {}}
+    sheets = {}
+    for scale in SCALES:
+        sheet, rects = build_sheet(frames[scale], SHEET_WIDTH * scale, GLYPH_PADDING)
+        sheets[scale] = sheet
+        meta["glyphs"][str(scale)] = {ch: rects[ch] + list(offsets[scale][ch]) for ch in rects}
+    return meta, sheets, missing
+
+
+def main():
+    if not os.path.exists(BUNDLED_FONT):
+        raise SystemExit(f"{os.path.relpath(BUNDLED_FONT, ROOT_DIR)} not found: run bundle_font.py first "
+                         "(without the atlas the game draws all text with fillText)")
+    glyph_sets = collect_glyphs(SOURCES)
+    print(f"Font: {os.path.relpath(BUNDLED_FONT, ROOT_DIR)}")
+
+    styles, bands = {}, {scale: [] for scale in SCALES}
+    for style in sorted(glyph_sets, key=lambda s: (parse_style(s)[0], s)):
+        meta, sheets, missing = build_style(style, glyph_sets[style])
+        styles[style] = meta
+        for scale in SCALES:
+            bands[scale].append((style, sheets[scale]))
+        note = f", missing {''.join(missing)!r}" if missing else ""
+        print(f"  {style:<10} {len(meta['advances']):>4} glyphs{note}")
+
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    images = {}
+    for scale in SCALES:
+        width = max(sheet.width for _, sheet in bands[scale])
+        atlas = Image.new("RGBA", (width, sum(sheet.height for _, sheet in bands[scale])), (255, 255, 255, 0))
+        y = 0
+        for style, sheet in bands[scale]:
+            atlas.paste(sheet, (0, y))
+            styles[style]["bands"][str(scale)] = [y, sheet.width, sheet.height]
+            y += sheet.height
+        name = "glyphs.png" if scale == 1 else f"glyphs@{scale}x.png"
+        atlas.save(os.path.join(OUTPUT_DIR, name), optimize=True)
+        images[str(scale)] = name
+        print(f"  {name}: {atlas.width}x{atlas.height}")
+
+    with open(os.path.join(OUTPUT_DIR, "glyphs.json"), "w", encoding="utf-8") as f:
+        json.dump({"images": images, "styles": styles}, f, ensure_ascii=False, separators=(",", ":"))
+    print(f"\nDone! {sum(len(s['advances']) for s in styles.values())} glyphs "
+          f"in {len(styles)} styles in {OUTPUT_DIR}/")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""Publish content-hashed copies of the game assets for immutable caching.
+
+Every file under the asset folders of public/ is copied to public/hashed/ with
+a content hash in its name (characters/atube.png -> characters/atube.3f9a1c2e7b.png),
+so the hashed URLs never change meaning and can be served with
+`Cache-Control: public, max-age=31536000, immutable`. The manifest maps each
+logical asset ID (the original URL the game uses, e.g. "/characters/atube.png")
+to its hashed URL, byte size, MIME type and image dimensions, and carries a
+priority-ordered preload list for the client and the precache service worker
+(public/sw.js). Only the manifest itself must be revalidated.
+
+Character and building images that encode_assets.py has re-encoded also list
+their encodings under "sources" (hashed the same way, smallest first, ending
+with a PNG), and the game loads the first one the browser can decode. An
+encoding is only listed while its recorded original still matches the file.
+
+Character and building images also get an inline placeholder: a 16px
+alpha-preserving palette PNG as a data URL (a few hundred bytes each) that the
+game paints, upscaled, until the full-resolution image has arrived.
+
+Assets still holding a procedural stand-in from generate_placeholders.py (their
+hash matches the one recorded in .cache/standins.json) are flagged "standIn",
+so a build made without the generators is easy to tell apart.
+
+Run it after the other build stages (sheets, encodes) so their outputs are
+included; hashed files that are no longer referenced are removed.
+
+Usage:
+    pip install pillow
+    python hash_assets.py
+
+Outputs files to public/hashed/ and public/hashed/manifest.json
+"""
+
+import base64
+import fnmatch
+import hashlib
+import io
+import json
+import mimetypes
+import os
+import shutil
+
+from PIL import Image
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+PUBLIC_DIR = os.path.join(ROOT_DIR, "public")
+OUTPUT_DIR = os.path.join(PUBLIC_DIR, "hashed")
+MANIFEST_NAME = "manifest.json"
+STANDINS_PATH = os.path.join(ROOT_DIR, ".cache", "standins.json")
+ENCODED_MANIFEST_PATH = os.path.join(PUBLIC_DIR, "encoded", "manifest.json")
+ASSET_DIRS = ["sheets", "characters", "buildings", "voices"]
+
+HASH_LENGTH = 10
+
+PLACEHOLDER_DIRS = ["characters", "buildings"]
+PLACEHOLDER_SIZE = 16
+PLACEHOLDER_COLORS = 32
+
+# (pattern, tier) pairs; the first matching pattern decides an asset's tier and
+# lower tiers preload first. Portraits are needed on the character-select
+# screen, the sheets for the first board frame; walk frames and the per-level
+# building images are fallbacks, and voices only play once the game is running.
+PRELOAD_TIERS = [
+    ("/characters/*_walk_*", 3),
+    ("/characters/*", 0),
+    ("/sheets/board*", 1),
+    ("/sheets/*", 2),
+    ("/buildings/*", 4),
+    ("/voices/*/select.mp3", 5),
+    ("/voices/*", 6),
+]
+
+MIME_TYPES = {".json": "application/json", ".mp3": "audio/mpeg", ".png": "image/png",
+              ".webp": "image/webp", ".avif": "image/avif"}
+
+
+def content_hash(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def hashed_name(rel_path: str, digest: str) -> str:
+    stem, ext = os.path.splitext(rel_path)
+    return f"{stem}.{digest[:HASH_LENGTH]}{ext}"
+
+
+def placeholder_data_url(path: str) -> str:
+    """Tiny alpha-preserving thumbnail of an image, inlined as a PNG data URL."""
+    with Image.open(path) as img:
+        thumb = img.convert("RGBA")
+    thumb.thumbnail((PLACEHOLDER_SIZE, PLACEHOLDER_SIZE), Image.LANCZOS)
+    buf = io.BytesIO()
+    thumb.quantize(PLACEHOLDER_COLORS, method=Image.Quantize.FASTOCTREE).save(buf, "PNG", optimize=True)
+    return "data:image/png;base64," + base64.b64encode(buf.getvalue()).decode("ascii")
+
+
+def preload_tier(asset_id: str) -> int:
+    for pattern, tier in PRELOAD_TIERS:
+        if fnmatch.fnmatch(asset_id, pattern):
+            return tier
+    return max(tier for _, tier in PRELOAD_TIERS) + 1
+
+
+def collect_assets() -> list:
+    """Relative paths (with forward slashes) of every publishable asset."""
+    rel_paths = []
+    for d in ASSET_DIRS:
+        folder = os.path.join(PUBLIC_DIR, d)
+        for dirpath, _, files in os.walk(folder):
+            for name in sorted(files):
+                rel = os.path.relpath(os.path.join(dirpath, name), PUBLIC_DIR)
+                rel_paths.append(rel.replace(os.sep, "/"))
+    return sorted(rel_paths)
+
+
+def load_encodings() -> dict:
+    """Logical asset ID -> encode_assets.py entry, or {} if the encodes were not built."""
+    if not os.path.exists(ENCODED_MANIFEST_PATH):
+        return {}
+    with open(ENCODED_MANIFEST_PATH, encoding="utf-8") as f:
+        return {e["original"]["url"]: e for e in json.load(f)["assets"].values()}
+
+
+def publish_file(rel_path: str) -> dict:
+    """Copy one file under public/ to its hashed name (if not already there) and describe it."""
+    src = os.path.join(PUBLIC_DIR, rel_path)
+    digest = content_hash(src)
+    out_rel = hashed_name(rel_path, digest)
+    out_path = os.path.join(OUTPUT_DIR, out_rel)
+    if not os.path.exists(out_path):
+        os.makedirs(os.path.dirname(out_path), exist_ok=True)
+        shutil.copyfile(src, out_path)
+
+    ext = os.path.splitext(rel_path)[1].lower()
+    return {
+        "url": f"/hashed/{out_rel}",
+        "bytes": os.path.getsize(src),
+        "type": MIME_TYPES.get(ext) or mimetypes.guess_type(rel_path)[0] or "application/octet-stream",
+        "hash": f"sha256-{digest}",
+    }
+
+
+def publish_asset(rel_path: str, encoding: dict | None = None) -> dict:
+    """Publish one asset, and its encodings if they were made from this version of it."""
+    src = os.path.join(PUBLIC_DIR, rel_path)
+    entry = publish_file(rel_path)
+    if encoding and f"sha256-{encoding['original'].get('sha256')}" == entry["hash"]:
+        entry["sources"] = [publish_file(s["url"].lstrip("/")) for s in encoding["sources"]]
+    if entry["type"].startswith("image/"):
+        with Image.open(src) as img:
+            entry["width"], entry["height"] = img.size
+        if rel_path.split("/")[0] in PLACEHOLDER_DIRS:
+            entry["placeholder"] = placeholder_data_url(src)
+    return entry
+
+
+def load_standins() -> dict:
+    """Asset ID -> SHA-256 of the stand-ins written by generate_placeholders.py."""
+    if not os.path.exists(STANDINS_PATH):
+        return {}
+    with open(STANDINS_PATH, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def prune(keep: set) -> int:
+    """Delete hashed files from earlier builds that the new manifest no longer lists."""
+    removed = 0
+    for dirpath, _, files in os.walk(OUTPUT_DIR):
+        for name in files:
+            path = os.path.join(dirpath, name)
+            rel = os.path.relpath(path, OUTPUT_DIR).replace(os.sep, "/")
+            if rel != MANIFEST_NAME and rel not in keep:
+                os.remove(path)
+                removed += 1
+    return removed
+
+
+def main():
+    rel_paths = collect_assets()
+    if not rel_paths:
+        print(f"No assets found under {PUBLIC_DIR}")
+        return
+
+    standins = load_standins()
+    encodings = load_encodings()
+    assets = {}
+    for rel in rel_paths:
+        entry = publish_asset(rel, encodings.get("/" + rel))
+        if entry["hash"] == f"sha256-{standins.get('/' + rel)}":
+            entry["standIn"] = True
+        assets["/" + rel] = entry
+
+    preload = sorted(assets, key=lambda asset_id: (preload_tier(asset_id), asset_id))
+    hashes = [e["hash"] for a in preload for e in [assets[a], *assets[a].get("sources", [])]]
+    version = hashlib.sha256("".join(hashes).encode()).hexdigest()[:HASH_LENGTH]
+    manifest = {"version": version, "assets": assets, "preload": preload}
+
+    manifest_path = os.path.join(OUTPUT_DIR, MANIFEST_NAME)
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    published = [a["url"] for a in assets.values()] + [s["url"] for a in assets.values() for s in a.get("sources", [])]
+    removed = prune({url[len("/hashed/"):] for url in published})
+
+    total = sum(a["bytes"] for a in assets.values())
+    placeholders = [a["placeholder"] for a in assets.values() if "placeholder" in a]
+    print(f"Published {len(assets)} assets ({total:,} bytes), version {version}")
+    encoded = [a for a in assets.values() if "sources" in a]
+    if encoded:
+        print(f"Encoded sources for {len(encoded)} images: {sum(a['sources'][0]['bytes'] for a in encoded):,} bytes "
+              f"at their best encoding vs {sum(a['bytes'] for a in encoded):,} bytes as originals")
+    print(f"Inlined {len(placeholders)} placeholders ({sum(map(len, placeholders)):,} bytes)")
+    standin_count = sum(1 for a in assets.values() if a.get("standIn"))
+    if standin_count:
+        print(f"{standin_count} assets are procedural stand-ins (see {os.path.relpath(STANDINS_PATH, ROOT_DIR)})")
+    if removed:
+        print(f"Removed {removed} stale hashed files")
+    print(f"\nDone! Wrote {manifest_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""Sweep background-removal parameters across all character sprites.
+
+Evaluates a grid of threshold/soft_edge values against the cached raw decodes
+from remove_bg.py (no PNG is decoded twice or modified), prints per-setting
+alpha statistics and writes a contact sheet for eyeballing the results.
+
+Usage:
+    pip install pillow numpy scipy
+    python matte_sweep.py [--thresholds 30,40,50,60,70] [--soft-edges 10,20,30]
+
+Outputs .cache/matte_sweep/sweep.json and .cache/matte_sweep/contact_sheet.png
+"""
+
+import argparse
+import glob
+import json
+import os
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+from remove_bg import (
+    CHAR_DIR, ROOT_DIR, load_rgb, load_overrides, matting_params,
+    background_distance, compute_alpha,
+)
+
+OUTPUT_DIR = os.path.join(ROOT_DIR, ".cache", "matte_sweep")
+THUMB_SIZE = 128
+LABEL_H = 18
+
+
+def alpha_stats(alpha: np.ndarray, current: np.ndarray) -> dict:
+    """Summarize an alpha mask, relative to the mask the batch stage would produce."""
+    total = alpha.size
+    return {
+        "transparent": round(float(np.count_nonzero(alpha == 0)) / total, 4),
+        "soft": round(float(np.count_nonzero((alpha > 0) & (alpha < 255))) / total, 4),
+        "opaque": round(float(np.count_nonzero(alpha == 255)) / total, 4),
+        "mean_alpha": round(float(alpha.mean()), 2),
+        "changed_vs_current": round(float(np.count_nonzero(alpha != current)) / total, 4),
+    }
+
+
+def make_thumb(rgb: np.ndarray, alpha: np.ndarray) -> Image.Image:
+    """Composite a matted sprite over a checkerboard at thumbnail size."""
+    sprite = Image.fromarray(np.dstack([rgb, alpha]), "RGBA").resize((THUMB_SIZE, THUMB_SIZE), Image.BOX)
+    yy, xx = np.mgrid[0:THUMB_SIZE, 0:THUMB_SIZE]
+    checker = np.where(((yy // 8) + (xx // 8)) % 2 == 0, 200, 255).astype(np.uint8)
+    bg = Image.fromarray(np.dstack([checker] * 3 + [np.full_like(checker, 255)]), "RGBA")
+    return Image.alpha_composite(bg, sprite)
+
+
+def parse_grid(text: str) -> list:
+    return [float(v) if "." in v else int(v) for v in text.split(",") if v.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--thresholds", default="30,40,50,60,70")
+    parser.add_argument("--soft-edges", default="10,20,30")
+    parser.add_argument("--out", default=OUTPUT_DIR)
+    args = parser.parse_args()
+
+    settings = [(t, s) for t in parse_grid(args.thresholds) for s in parse_grid(args.soft_edges)]
+    paths = sorted(glob.glob(os.path.join(CHAR_DIR, "*.png")))
+    if not paths:
+        print(f"No sprites found in {CHAR_DIR}")
+        return
+
+    overrides = load_overrides()
+    os.makedirs(args.out, exist_ok=True)
+
+    sheet_w = THUMB_SIZE * (len(settings) + 1)
+    sheet_h = LABEL_H + THUMB_SIZE * len(paths)
+    sheet = Image.new("RGBA", (sheet_w, sheet_h), (40, 40, 40, 255))
+    draw = ImageDraw.Draw(sheet)
+    draw.text((4, 3), "current", fill="#ffeb3b")
+    for col, (t, s) in enumerate(settings, start=1):
+        draw.text((col * THUMB_SIZE + 4, 3), f"t={t} s={s}", fill="#ffffff")
+
+    results = {}
+    totals = {setting: [] for setting in settings}
+    for row, path in enumerate(paths):
+        name = os.path.basename(path)
+        rgb = load_rgb(path)
+        diff = background_distance(rgb)
+        cur_t, cur_s = matting_params(name, overrides)
+        current = compute_alpha(diff, cur_t, cur_s)
+
+        y = LABEL_H + row * THUMB_SIZE
+        sheet.paste(make_thumb(rgb, current), (0, y))
+        draw.text((4, y + 2), name, fill="#ffeb3b")
+
+        results[name] = {"current": {"threshold": cur_t, "soft_edge": cur_s}, "settings": []}
+        for col, (t, s) in enumerate(settings, start=1):
+            alpha = current if (t, s) == (cur_t, cur_s) else compute_alpha(diff, t, s)
+            stats = alpha_stats(alpha, current)
+            results[name]["settings"].append({"threshold": t, "soft_edge": s, **stats})
+            totals[(t, s)].append(stats)
+            sheet.paste(make_thumb(rgb, alpha), (col * THUMB_SIZE, y))
+        print(f"  Swept: {name} (current t={cur_t} s={cur_s})")
+
+    print(f"\n{'threshold':>9} {'soft_edge':>9} {'transp':>7} {'soft':>7} {'opaque':>7} {'changed':>8}")
+    for (t, s), stats in totals.items():
+        mean = {k: np.mean([st[k] for st in stats]) for k in ("transparent", "soft", "opaque", "changed_vs_current")}
+        print(f"{t:>9} {s:>9} {mean['transparent']:>7.3f} {mean['soft']:>7.3f} "
+              f"{mean['opaque']:>7.3f} {mean['changed_vs_current']:>8.3f}")
+
+    json_path = os.path.join(args.out, "sweep.json")
+    with open(json_path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    sheet_path = os.path.join(args.out, "contact_sheet.png")
+    sheet.save(sheet_path)
+    print(f"\nDone! Wrote {json_path} and {sheet_path}")
+
+
+if __name__ == "__main__":
+    main()
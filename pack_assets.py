@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""Concatenate the published assets into pack files with a binary index.
+
+Reads public/hashed/manifest.json (run encode_assets.py and hash_assets.py
+first) and writes the final form of every asset, in preload order, into one or
+more pack files of at most PACK_MAX_BYTES, so the most urgent assets sit at the
+front of the first pack. Each asset starts on a DATA_ALIGN boundary. Sheets
+with a @2x variant go into separate packs per scale (1x first, then 2x), so a
+display only downloads the variants it draws. An image
+with encoded "sources" is packed as its smallest encoding (the first source);
+other assets as their hashed file.
+
+The game loads the packs whole at startup and serves the assets from memory
+(src/assets/AssetPack.ts); an asset whose packed encoding the browser cannot
+decode is fetched on its own from public/hashed/ instead.
+
+The index (public/packs/assets.idx) is a little-endian binary file with
+naturally aligned fixed-size records, so it can be read with one fetch and a
+DataView in the browser or mmap'd by Python tooling (PackIndex):
+
+  header   32 bytes   magic "RM4PACK\\0", u16 version, u16 reserved,
+                      u32 entry count, u32 pack count, u32 entry table offset,
+                      u32 string table offset, u32 string table size
+  packs    16 bytes   u32 name offset, u32 name length, u64 pack size
+  entries  48 bytes   u16 pack, u16 type code, u32 reserved, u64 offset,
+                      u64 length, u32 id offset, u32 id length,
+                      16 bytes of the asset's SHA-256
+  strings             UTF-8 asset IDs and pack file names
+
+Pack file names carry a content hash like the other published assets; only
+the index has to be revalidated.
+
+Usage:
+    python encode_assets.py && python hash_assets.py
+    python pack_assets.py
+
+Outputs public/packs/assets-<n>.<hash>.pack and public/packs/assets.idx
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+PUBLIC_DIR = os.path.join(ROOT_DIR, "public")
+MANIFEST_PATH = os.path.join(PUBLIC_DIR, "hashed", "manifest.json")
+OUTPUT_DIR = os.path.join(PUBLIC_DIR, "packs")
+INDEX_NAME = "assets.idx"
+
+PACK_MAX_BYTES = 8 * 1024 * 1024
+DATA_ALIGN = 64
+HASH_LENGTH = 10
+
+MAGIC = b"RM4PACK\0"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<8sHHIIIII")
+PACK_RECORD = struct.Struct("<IIQ")
+ENTRY_RECORD = struct.Struct("<HHIQQII16s")
+
+# Type codes stored in the index; keep in sync with PACK_TYPES in AssetPack.ts
+TYPE_CODES = [
+    "application/octet-stream",
+    "image/png",
+    "image/webp",
+    "image/avif",
+    "application/json",
+    "audio/mpeg",
+]
+
+
+def _align(n: int, boundary: int) -> int:
+    return (n + boundary - 1) // boundary * boundary
+
+
+def packed_form(entry: dict) -> dict:
+    """The published file (url, bytes, type, hash) that goes into the pack for a manifest entry."""
+    return entry["sources"][0] if entry.get("sources") else entry
+
+
+def scale_variant(asset_id: str, ids: set) -> int:
+    """2 for a "@2x" asset, 1 for an asset that has a "@2x" variant, else 0."""
+    stem, ext = os.path.splitext(asset_id)
+    if stem.endswith("@2x"):
+        return 2
+    return 1 if f"{stem}@2x{ext}" in ids else 0
+
+
+def plan_packs(sizes: list) -> list:
+    """Split (id, bytes) pairs, in order, into packs of at most PACK_MAX_BYTES.
+
+    Returns one list of (id, offset) per pack. An asset larger than the limit
+    gets a pack of its own.
+    """
+    packs, current, offset = [], [], 0
+    for asset_id, size in sizes:
+        if current and offset + size > PACK_MAX_BYTES:
+            packs.append(current)
+            current, offset = [], 0
+        current.append((asset_id, offset))
+        offset = _align(offset + size, DATA_ALIGN)
+    if current:
+        packs.append(current)
+    return packs
+
+
+def write_pack(layout: list, assets: dict, number: int) -> tuple[str, int]:
+    """Write one pack file; returns (file name, size)."""
+    tmp_path = os.path.join(OUTPUT_DIR, f"assets-{number}.pack.tmp")
+    h = hashlib.sha256()
+    with open(tmp_path, "wb") as f:
+        for asset_id, offset in layout:
+            pad = offset - f.tell()
+            f.write(b"\0" * pad)
+            h.update(b"\0" * pad)
+            with open(os.path.join(PUBLIC_DIR, assets[asset_id]["url"].lstrip("/")), "rb") as src:
+                data = src.read()
+            f.write(data)
+            h.update(data)
+        size = f.tell()
+    name = f"assets-{number}.{h.hexdigest()[:HASH_LENGTH]}.pack"
+    os.replace(tmp_path, os.path.join(OUTPUT_DIR, name))
+    return name, size
+
+
+def build_index(packs: list, pack_files: list, assets: dict) -> bytes:
+    strings = bytearray()
+
+    def add_string(s: str) -> tuple[int, int]:
+        raw = s.encode("utf-8")
+        strings.extend(raw)
+        return len(strings) - len(raw), len(raw)
+
+    pack_table = b"".join(PACK_RECORD.pack(*add_string(name), size) for name, size in pack_files)
+    entry_table = bytearray()
+    for pack_no, layout in enumerate(packs):
+        for asset_id, offset in layout:
+            entry = assets[asset_id]
+            type_code = TYPE_CODES.index(entry["type"]) if entry["type"] in TYPE_CODES else 0
+            digest = bytes.fromhex(entry["hash"].split("-", 1)[1])[:16]
+            id_off, id_len = add_string(asset_id)
+            entry_table += ENTRY_RECORD.pack(pack_no, type_code, 0, offset, entry["bytes"], id_off, id_len, digest)
+
+    entries_offset = _align(HEADER.size + len(pack_table), 8)
+    strings_offset = entries_offset + len(entry_table)
+    count = sum(len(layout) for layout in packs)
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, 0, count, len(pack_files),
+                         entries_offset, strings_offset, len(strings))
+    body = header + pack_table
+    return body + b"\0" * (entries_offset - len(body)) + bytes(entry_table) + bytes(strings)
+
+
+class PackIndex:
+    """Read-only view of a pack index and its packs through mmap."""
+
+    def __init__(self, pack_dir: str = OUTPUT_DIR):
+        self.pack_dir = pack_dir
+        with open(os.path.join(pack_dir, INDEX_NAME), "rb") as f:
+            self._index = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, _, count, pack_count,
+         entries_offset, strings_offset, _) = HEADER.unpack_from(self._index, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"{INDEX_NAME}: not a version {FORMAT_VERSION} asset pack index")
+        self._strings = strings_offset
+
+        self.packs = []
+        for i in range(pack_count):
+            name_off, name_len, size = PACK_RECORD.unpack_from(self._index, HEADER.size + i * PACK_RECORD.size)
+            self.packs.append((self._string(name_off, name_len), size))
+
+        self.entries = {}
+        for i in range(count):
+            pack, type_code, _, offset, length, id_off, id_len, digest = ENTRY_RECORD.unpack_from(
+                self._index, entries_offset + i * ENTRY_RECORD.size)
+            self.entries[self._string(id_off, id_len)] = {
+                "pack": pack, "type": TYPE_CODES[type_code], "offset": offset,
+                "length": length, "sha256": digest.hex(),
+            }
+        self._maps = {}
+
+    def _string(self, offset: int, length: int) -> str:
+        start = self._strings + offset
+        return self._index[start:start + length].decode("utf-8")
+
+    def _pack_map(self, pack: int) -> mmap.mmap:
+        if pack not in self._maps:
+            with open(os.path.join(self.pack_dir, self.packs[pack][0]), "rb") as f:
+                self._maps[pack] = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._maps[pack]
+
+    def read(self, asset_id: str) -> memoryview:
+        """Zero-copy view of one asset's bytes."""
+        e = self.entries[asset_id]
+        return memoryview(self._pack_map(e["pack"]))[e["offset"]:e["offset"] + e["length"]]
+
+
+def main():
+    if not os.path.exists(MANIFEST_PATH):
+        raise SystemExit(f"{MANIFEST_PATH} not found; run hash_assets.py first")
+    with open(MANIFEST_PATH, encoding="utf-8") as f:
+        manifest = json.load(f)
+    assets = {asset_id: packed_form(entry) for asset_id, entry in manifest["assets"].items()}
+    order = manifest["preload"] + sorted(set(assets) - set(manifest["preload"]))
+
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    packs, ids = [], set(assets)
+    for scale in (0, 1, 2):
+        group = [a for a in order if scale_variant(a, ids) == scale]
+        packs += plan_packs([(asset_id, assets[asset_id]["bytes"]) for asset_id in group])
+    pack_files = [write_pack(layout, assets, n) for n, layout in enumerate(packs)]
+    index = build_index(packs, pack_files, assets)
+    with open(os.path.join(OUTPUT_DIR, INDEX_NAME), "wb") as f:
+        f.write(index)
+
+    keep = {name for name, _ in pack_files} | {INDEX_NAME}
+    for name in os.listdir(OUTPUT_DIR):
+        if name not in keep:
+            os.remove(os.path.join(OUTPUT_DIR, name))
+
+    # Round-trip every asset through the mmap reader
+    reader = PackIndex()
+    for asset_id, entry in reader.entries.items():
+        if hashlib.sha256(reader.read(asset_id)).hexdigest()[:32] != entry["sha256"]:
+            raise SystemExit(f"Pack verification failed for {asset_id}")
+
+    for (name, size), layout in zip(pack_files, packs):
+        print(f"  {name}: {len(layout)} assets, {size:,} bytes")
+    encoded = sum(1 for entry in manifest["assets"].values() if entry.get("sources"))
+    print(f"  {encoded} images packed as their smallest encoding")
+    print(f"\nDone! Packed {len(order)} assets into {len(pack_files)} packs "
+          f"(index {len(index):,} bytes) in {OUTPUT_DIR}")
+
+
+if __name__ == "__main__":
+    main()
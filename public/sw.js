@@ -0,0 +1,66 @@
+// Precache service worker for the content-hashed assets (hash_assets.py).
+// Hashed URLs are immutable, so they are served cache-first; everything else
+// (including the manifest) goes to the network untouched. The page registers
+// the worker with the image formats it decodes (?formats=avif,png,webp) and the
+// manifest version (&v=...), and re-encoded images are precached in the
+// smallest encoding it can decode. A new version is a new worker URL, so every
+// build runs install (precache) and activate (drop older caches) again.
+// When the asset packs are built the page loads those instead (through the
+// HTTP cache; pack names are content-hashed), so nothing is precached.
+
+const MANIFEST_URL = '/hashed/manifest.json';
+const PACK_INDEX_URL = '/packs/assets.idx';
+const CACHE_PREFIX = 'richman4-assets-';
+const FORMATS = (new URL(self.location.href).searchParams.get('formats') || 'png').split(',');
+
+function precacheUrl(entry) {
+  const source = (entry.sources || []).find((s) => FORMATS.includes(s.type.split('/')[1]));
+  return source ? source.url : entry.url;
+}
+
+self.addEventListener('install', (event) => {
+  event.waitUntil(
+    fetch(MANIFEST_URL, { cache: 'no-cache' })
+      .then((res) => res.json())
+      .then(async (manifest) => {
+        const cache = await caches.open(CACHE_PREFIX + manifest.version);
+        const packed = await fetch(PACK_INDEX_URL, { method: 'HEAD', cache: 'no-cache' }).then((res) => res.ok, () => false);
+        if (packed) return;
+        // Preload order is priority order; add them sequentially so the
+        // portraits and board sheets land before the voices
+        for (const id of manifest.preload) {
+          const entry = manifest.assets[id];
+          if (!entry) continue;
+          const url = precacheUrl(entry);
+          if (!(await cache.match(url))) {
+            await cache.add(url).catch(() => {});
+          }
+        }
+      })
+      .then(() => self.skipWaiting())
+      .catch(() => {}),
+  );
+});
+
+self.addEventListener('activate', (event) => {
+  event.waitUntil(
+    fetch(MANIFEST_URL, { cache: 'no-cache' })
+      .then((res) => res.json())
+      .then(async (manifest) => {
+        const keep = CACHE_PREFIX + manifest.version;
+        for (const name of await caches.keys()) {
+          if (name.startsWith(CACHE_PREFIX) && name !== keep) await caches.delete(name);
+        }
+      })
+      .catch(() => {})
+      .then(() => self.clients.claim()),
+  );
+});
+
+self.addEventListener('fetch', (event) => {
+  const url = new URL(event.request.url);
+  if (event.request.method !== 'GET' || url.origin !== self.location.origin) return;
+  if (!url.pathname.startsWith('/hashed/') || url.pathname === MANIFEST_URL) return;
+  // Misses (not precached yet) fall through to the network and the HTTP cache
+  event.respondWith(caches.match(event.request).then((hit) => hit || fetch(event.request)));
+});
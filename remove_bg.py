@@ -1,77 +1,145 @@
 #!/usr/bin/env python3
-"""Remove backgrounds from character images, making them transparent PNGs."""
+"""Remove backgrounds from character images, making them transparent PNGs.
+
+Raw RGB decodes are kept in a memory-mapped cache under .cache/decoded/ so the
+matting parameters can be re-evaluated (see matte_sweep.py) without decoding
+the PNGs again. Matting only ever rewrites the alpha channel, so the cached RGB
+stays valid after a PNG has been matted in place.
+
+Per-asset parameters can be overridden in matting_overrides.json:
+
+    {"atube_walk_2.png": {"threshold": 40, "soft_edge": 25}}
+"""
 
 from PIL import Image
 import numpy as np
+import json
 import os
 
-CHAR_DIR = os.path.join(os.path.dirname(__file__), 'public', 'characters')
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+CHAR_DIR = os.path.join(ROOT_DIR, 'public', 'characters')
+CACHE_DIR = os.path.join(ROOT_DIR, '.cache', 'decoded')
+CACHE_INDEX = os.path.join(CACHE_DIR, 'index.json')
+OVERRIDES_PATH = os.path.join(ROOT_DIR, 'matting_overrides.json')
+
+DEFAULT_THRESHOLD = 50
+DEFAULT_SOFT_EDGE = 20
+
+
+def load_overrides() -> dict:
+    """Load per-asset matting overrides, keyed by file name."""
+    if not os.path.exists(OVERRIDES_PATH):
+        return {}
+    with open(OVERRIDES_PATH, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def matting_params(name: str, overrides: dict) -> tuple[int, int]:
+    """Return (threshold, soft_edge) for an asset, honouring overrides."""
+    entry = overrides.get(name, {})
+    return entry.get('threshold', DEFAULT_THRESHOLD), entry.get('soft_edge', DEFAULT_SOFT_EDGE)
+
+
+def _load_index() -> dict:
+    if not os.path.exists(CACHE_INDEX):
+        return {}
+    with open(CACHE_INDEX, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _save_index(index: dict):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(CACHE_INDEX, 'w', encoding='utf-8') as f:
+        json.dump(index, f, indent=2)
 
-def remove_background(img_path: str):
-    """Remove background by flood-filling from corners with transparency."""
-    img = Image.open(img_path).convert('RGBA')
-    data = np.array(img)
-    h, w = data.shape[:2]
+
+def _file_stamp(path: str) -> list:
+    st = os.stat(path)
+    return [st.st_size, st.st_mtime_ns]
+
+
+def load_rgb(img_path: str) -> np.ndarray:
+    """Return the raw RGB decode of an image, memory-mapped from the decode cache."""
+    name = os.path.basename(img_path)
+    npy_path = os.path.join(CACHE_DIR, os.path.splitext(name)[0] + '.npy')
+    index = _load_index()
+    if index.get(name) == _file_stamp(img_path) and os.path.exists(npy_path):
+        return np.load(npy_path, mmap_mode='r')
+
+    # Dropping alpha (rather than compositing) recovers the pre-matte pixels
+    rgb = np.array(Image.open(img_path).convert('RGB'))
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    np.save(npy_path, rgb)
+    index[name] = _file_stamp(img_path)
+    _save_index(index)
+    return np.load(npy_path, mmap_mode='r')
+
+
+def background_distance(rgb: np.ndarray) -> np.ndarray:
+    """Color distance of every pixel from the background sampled at the corners."""
+    h, w = rgb.shape[:2]
 
     # Sample background color from corners (average of 20x20 corner patches)
     corners = [
-        data[0:20, 0:20],
-        data[0:20, w-20:w],
-        data[h-20:h, 0:20],
-        data[h-20:h, w-20:w],
+        rgb[0:20, 0:20],
+        rgb[0:20, w-20:w],
+        rgb[h-20:h, 0:20],
+        rgb[h-20:h, w-20:w],
     ]
-    bg_color = np.mean(np.concatenate([c.reshape(-1, 4) for c in corners], axis=0), axis=0)[:3]
+    bg_color = np.mean(np.concatenate([c.reshape(-1, 3) for c in corners], axis=0), axis=0)
 
-    # Calculate color distance from background for each pixel
-    rgb = data[:, :, :3].astype(float)
-    diff = np.sqrt(np.sum((rgb - bg_color) ** 2, axis=2))
+    diff = rgb.astype(np.float32) - bg_color.astype(np.float32)
+    return np.sqrt(np.sum(diff * diff, axis=2))
 
-    # Create alpha mask: pixels close to bg color become transparent
-    threshold = 50
-    soft_edge = 20
-    alpha = np.clip((diff - threshold) / soft_edge * 255, 0, 255).astype(np.uint8)
 
-    # Also do a flood fill from edges to only remove connected background
+def compute_alpha(diff: np.ndarray, threshold: float, soft_edge: float) -> np.ndarray:
+    """Alpha mask that clears only background regions connected to the border."""
     from scipy import ndimage
+
+    h, w = diff.shape
     bg_mask = diff < (threshold + soft_edge)
     # Label connected components
     labeled, num_features = ndimage.label(bg_mask)
     # Find labels that touch the border
-    border_labels = set()
-    border_labels.update(labeled[0, :].tolist())
-    border_labels.update(labeled[-1, :].tolist())
-    border_labels.update(labeled[:, 0].tolist())
-    border_labels.update(labeled[:, -1].tolist())
-    border_labels.discard(0)
+    border_labels = np.unique(np.concatenate([
+        labeled[0, :], labeled[-1, :], labeled[:, 0], labeled[:, -1],
+    ]))
+    border_labels = border_labels[border_labels != 0]
 
     # Only make border-connected background regions transparent
-    edge_bg = np.zeros((h, w), dtype=bool)
-    for lbl in border_labels:
-        edge_bg |= (labeled == lbl)
+    edge_bg = np.isin(labeled, border_labels)
 
     # For edge-connected bg pixels, use soft alpha based on distance
     final_alpha = np.full((h, w), 255, dtype=np.uint8)
-    for y in range(h):
-        for x in range(w):
-            if edge_bg[y, x]:
-                d = diff[y, x]
-                if d < threshold:
-                    final_alpha[y, x] = 0
-                else:
-                    final_alpha[y, x] = min(255, int((d - threshold) / soft_edge * 255))
-
-    data[:, :, 3] = final_alpha
-    result = Image.fromarray(data)
-    result.save(img_path)
-    print(f"  Processed: {os.path.basename(img_path)}")
+    soft = np.clip((diff[edge_bg] - threshold) / soft_edge * 255, 0, 255)
+    final_alpha[edge_bg] = soft.astype(np.uint8)
+    return final_alpha
+
+
+def remove_background(img_path: str, threshold: float = DEFAULT_THRESHOLD, soft_edge: float = DEFAULT_SOFT_EDGE):
+    """Remove background by clearing border-connected pixels close to the corner color."""
+    rgb = load_rgb(img_path)
+    alpha = compute_alpha(background_distance(rgb), threshold, soft_edge)
+
+    data = np.dstack([rgb, alpha])
+    Image.fromarray(data, 'RGBA').save(img_path)
+
+    # The RGB channels are unchanged, so the cached decode stays valid
+    index = _load_index()
+    index[os.path.basename(img_path)] = _file_stamp(img_path)
+    _save_index(index)
+    print(f"  Processed: {os.path.basename(img_path)} (threshold={threshold}, soft_edge={soft_edge})")
+
 
 def main():
     files = ['sunxiaomei.png', 'atube.png', 'qianfuren.png', 'shahongbasi.png']
+    overrides = load_overrides()
     print("Removing backgrounds from character images...")
     for f in files:
         path = os.path.join(CHAR_DIR, f)
         if os.path.exists(path):
-            remove_background(path)
+            threshold, soft_edge = matting_params(f, overrides)
+            remove_background(path, threshold, soft_edge)
         else:
             print(f"  Skipped (not found): {f}")
     print("Done!")
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""Pre-render the static board layer for 大富翁4.
+
+Rasterizes everything BoardRenderer draws that does not depend on game state
+(board surface, tile backgrounds with their inner shadow, borders, tile names,
+prices and the center logo) from TILE_DEFS in constants.ts, using the same
+projection as Board.ts.
+
+The image holds three canvas-sized layers stacked top to bottom, so the
+renderer keeps the procedural drawing order:
+
+  base     surface, tiles and center logo, drawn first
+  names    tile names, drawn over the highlight and ownership overlays
+  prices   tile prices, blitted per tile from its priceRect while unowned
+
+Usage:
+    pip install pillow numpy
+    python render_board.py
+
+Outputs public/sheets/board.png, public/sheets/board@2x.png and
+public/sheets/board.json
+"""
+
+import json
+import os
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFilter
+
+from board_defs import BoardGeometry, load_font, load_group_colors, load_tile_defs, middle_baseline
+
+OUTPUT_DIR = "public/sheets"
+SCALES = [1, 2]
+SUPERSAMPLE = 2
+LAYERS = ["base", "names", "prices"]
+
+# Mirrors the tile-type colors in BoardRenderer
+TYPE_COLORS = {
+    "GO": "#fff9c4",
+    "JAIL": "#ffccbc",
+    "GO_TO_JAIL": "#ffccbc",
+    "CHANCE": "#e1bee7",
+    "TAX": "#ffcdd2",
+    "FREE_PARKING": "#b2dfdb",
+}
+
+
+def tile_fill(tile: dict, group_colors: dict) -> str:
+    if tile["type"] == "PROPERTY" and tile["colorGroup"] >= 0:
+        return group_colors.get(tile["colorGroup"], "#ddd")
+    return TYPE_COLORS.get(tile["type"], "#e0e0e0")
+
+
+def _scaled(points: list, k: float) -> list:
+    return [(x * k, y * k) for x, y in points]
+
+
+def _stroke_closed(draw: ImageDraw.ImageDraw, points: list, fill, width: float):
+    draw.line(points + [points[0]], fill=fill, width=max(1, round(width)), joint="curve")
+
+
+def _label_metrics(poly: list) -> tuple:
+    """Font sizes and anchor points for a tile label, as BoardRenderer computes them."""
+    cx = sum(p[0] for p in poly) / len(poly)
+    cy = sum(p[1] for p in poly) / len(poly)
+    dx = poly[1][0] - poly[0][0]
+    dy = poly[1][1] - poly[0][1]
+    tile_w = (dx * dx + dy * dy) ** 0.5
+    font_size = max(7, min(12, tile_w * 0.3))
+    info_size = max(6, font_size * 0.7)
+    return cx, cy, font_size, info_size
+
+
+def draw_inner_shadow(img: Image.Image, poly: list, k: float):
+    """Canvas-style inner shadow: a 5px dark stroke with a 6px blurred shadow, clipped to the tile."""
+    margin = int(12 * k)
+    xs, ys = [p[0] for p in poly], [p[1] for p in poly]
+    x0, y0 = int(min(xs)) - margin, int(min(ys)) - margin
+    x1, y1 = int(max(xs)) + margin, int(max(ys)) + margin
+    local = [(x - x0, y - y0) for x, y in poly]
+    size = (x1 - x0, y1 - y0)
+
+    clip = Image.new("L", size, 0)
+    ImageDraw.Draw(clip).polygon(local, fill=255)
+    stroke = Image.new("L", size, 0)
+    _stroke_closed(ImageDraw.Draw(stroke), local, 255, 5 * k)
+    # Canvas shadowBlur maps to a Gaussian with sigma = blur / 2
+    shadow = stroke.filter(ImageFilter.GaussianBlur(6 * k / 2))
+
+    a_stroke = np.asarray(stroke, dtype=np.float32) / 255 * 0.6
+    a_shadow = np.asarray(shadow, dtype=np.float32) / 255 * 0.4
+    alpha = (1 - (1 - a_stroke) * (1 - a_shadow)) * (np.asarray(clip, dtype=np.float32) / 255)
+
+    layer = np.zeros((size[1], size[0], 4), dtype=np.uint8)
+    layer[:, :, 3] = np.round(alpha * 255).astype(np.uint8)
+    img.alpha_composite(Image.fromarray(layer, "RGBA"), dest=(x0, y0))
+
+
+def render_static_board(geometry: BoardGeometry, tiles: list, scale: int) -> tuple[Image.Image, list]:
+    """Render the static layers at `scale`, stacked; returns the image and per-tile layout (1x coords)."""
+    k = scale * SUPERSAMPLE
+    width, height = int(geometry.canvas_w * k), int(geometry.canvas_h * k)
+    img, names, prices = (Image.new("RGBA", (width, height), (0, 0, 0, 0)) for _ in LAYERS)
+    draw = ImageDraw.Draw(img)
+    names_draw, prices_draw = ImageDraw.Draw(names), ImageDraw.Draw(prices)
+    group_colors = load_group_colors()
+
+    # Outer board border
+    outer = [geometry.project(c) for c in
+             [(-1.02, 0, 1.02), (1.02, 0, 1.02), (1.02, 0, -1.02), (-1.02, 0, -1.02)]]
+    draw.polygon(_scaled(outer, k), fill="#2d5016")
+    _stroke_closed(draw, _scaled(outer, k), "#1a3a0a", 3 * k)
+
+    layout = []
+    for tile in tiles:
+        poly = geometry.tile_screen_poly(tile["index"])
+        if len(poly) < 4:
+            continue
+        fill = tile_fill(tile, group_colors)
+        draw.polygon(_scaled(poly, k), fill=fill)
+        draw_inner_shadow(img, _scaled(poly, k), k)
+        _stroke_closed(draw, _scaled(poly, k), "#444444", 1 * k)
+
+        cx, cy, font_size, info_size = _label_metrics(poly)
+        name_font = load_font(font_size * k, bold=True)
+        # Canvas textBaseline 'middle' is the em box's middle, not the "m" anchor's
+        names_draw.text((cx * k, (cy - font_size * 0.35) * k + middle_baseline(font_size * k, True)), tile["name"],
+                        font=name_font, fill="#222222", anchor="ms")
+
+        price_rect = None
+        if tile["type"] == "PROPERTY":
+            price_font = load_font(info_size * k)
+            text = f"${tile['price']}"
+            pos = (cx * k, (cy + font_size * 0.45) * k + middle_baseline(info_size * k))
+            prices_draw.text(pos, text, font=price_font, fill="#555555", anchor="ms")
+            bx0, by0, bx1, by1 = prices_draw.textbbox(pos, text, font=price_font, anchor="ms")
+            # 1x rect, padded so antialiased edges are included
+            price_rect = [int(bx0 / k) - 1, int(by0 / k) - 1,
+                          int(np.ceil((bx1 - bx0) / k)) + 3, int(np.ceil((by1 - by0) / k)) + 3]
+
+        layout.append({
+            "index": tile["index"],
+            "priceRect": price_rect,
+        })
+
+    # Inner board area (green felt) and title
+    inner = [geometry.project(c) for c in
+             [(-0.72, 0, 0.72), (0.72, 0, 0.72), (0.72, 0, -0.72), (-0.72, 0, -0.72)]]
+    draw.polygon(_scaled(inner, k), fill="#c8e6c9")
+    _stroke_closed(draw, _scaled(inner, k), "#81c784", 2 * k)
+    center = geometry.project((0, 0, -0.05))
+    draw.text((center[0] * k, (center[1] - 10) * k + middle_baseline(32 * k, True)), "大富翁4",
+              font=load_font(32 * k, bold=True), fill="#2e7d32", anchor="ms")
+    draw.text((center[0] * k, (center[1] + 18) * k + middle_baseline(14 * k)), "MONOPOLY",
+              font=load_font(14 * k), fill="#388e3c", anchor="ms")
+
+    w, h = int(geometry.canvas_w * scale), int(geometry.canvas_h * scale)
+    stacked = Image.new("RGBA", (w, h * len(LAYERS)), (0, 0, 0, 0))
+    for row, layer in enumerate([img, names, prices]):
+        stacked.paste(layer.resize((w, h), Image.LANCZOS), (0, row * h))
+    return stacked, layout
+
+
+def main():
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    geometry = BoardGeometry()
+    tiles = load_tile_defs()
+
+    images = {}
+    layout = []
+    for scale in SCALES:
+        img, layout = render_static_board(geometry, tiles, scale)
+        name = "board.png" if scale == 1 else f"board@{scale}x.png"
+        img.save(os.path.join(OUTPUT_DIR, name), optimize=True)
+        images[str(scale)] = name
+        print(f"Generated: {os.path.join(OUTPUT_DIR, name)} ({img.width}x{img.height})")
+
+    manifest = {
+        "width": int(geometry.canvas_w),
+        "height": int(geometry.canvas_h),
+        "images": images,
+        "layers": LAYERS,
+        "tiles": layout,
+    }
+    with open(os.path.join(OUTPUT_DIR, "board.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+
+    print(f"\nDone! Rendered static board with {len(layout)} tiles.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""Headless Monte Carlo simulator for balancing 大富翁4's board.
+
+Plays many complete games at once as NumPy arrays (one row per game) using
+the board from TILE_DEFS in constants.ts and the core rules of GameEngine and
+AI: two dice, movement with the GO salary, buying, building, rent, tax,
+chance money events, jail (doubles to escape, released after three turns)
+and bankruptcy. Every seat is played by the AI decision rules, with the seat
+personalities of a single-player game: the human seat (autoplay) is BALANCED
+and the three computer players are AGGRESSIVE, CONSERVATIVE and BALANCED.
+
+Cards and stocks are not modelled. Games still running after --max-turns
+player turns are stopped and counted as unfinished.
+
+Batches run in a process pool. The report covers the share of unfinished
+games, win rate per seat and personality over the finished games, game
+length, and per-property purchase rate, rent income and ROI.
+
+Usage:
+    pip install numpy
+    python simulate.py [--games 100000] [--batch 20000] [--workers N] [--seed 0]
+        [--max-turns 2000] [--json out.json]
+
+Outputs a report to stdout (and the raw aggregates to --json if given)
+"""
+
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from board_defs import load_numbers, load_tile_defs
+
+PERSONALITIES = ["AGGRESSIVE", "CONSERVATIVE", "BALANCED"]
+AGGRESSIVE, CONSERVATIVE, BALANCED = range(3)
+SEAT_PERSONALITIES = [BALANCED, AGGRESSIVE, CONSERVATIVE, BALANCED]
+
+# Mirrors AI.shouldBuy / AI.shouldBuild: money/price (or money/buildCost)
+# ratios per personality; AGGRESSIVE buys whenever it keeps AGGRESSIVE_RESERVE
+BUY_RATIO = np.array([0.0, 3.0, 1.5])
+BUILD_RATIO = np.array([2.0, 4.0, 3.0])
+AGGRESSIVE_RESERVE = 100
+
+# Money deltas of the chance events in GameEngine.handleChance
+CHANCE_EVENTS = np.array([100, -100, 50, -80, 150, -50, 200, -120])
+
+# Pair of dice from one draw in [0, 36)
+DICE_TOTAL = np.arange(36) // 6 + np.arange(36) % 6 + 2
+DICE_DOUBLE = np.arange(36) // 6 == np.arange(36) % 6
+
+MAX_BUILDINGS = 5
+JAIL_MAX_TURNS = 3
+DEFAULT_MAX_TURNS = 2000
+
+TILE_TYPES = ["GO", "PROPERTY", "CHANCE", "TAX", "JAIL", "FREE_PARKING", "GO_TO_JAIL"]
+
+
+class Rules:
+    """Board tables and money constants, read from the TypeScript sources."""
+
+    def __init__(self):
+        consts = load_numbers()
+        tiles = load_tile_defs()
+        self.num_tiles = len(tiles)
+        self.starting_money = int(consts["STARTING_MONEY"])
+        self.go_salary = int(consts["GO_SALARY"])
+        self.tax = int(consts["TAX_AMOUNT"])
+        self.names = [t["name"] for t in tiles]
+        self.type = np.array([TILE_TYPES.index(t["type"]) for t in tiles], dtype=np.int8)
+        self.price = np.array([t["price"] for t in tiles], dtype=np.int64)
+        self.build_cost = np.array([t["buildCost"] for t in tiles], dtype=np.int64)
+        self.rent = np.array([t["rent"] for t in tiles], dtype=np.int64)
+        self.group = np.array([t["colorGroup"] for t in tiles], dtype=np.int64)
+        self.jail_tile = int(np.flatnonzero(self.type == TILE_TYPES.index("JAIL"))[0])
+        self.is_property = self.type == TILE_TYPES.index("PROPERTY")
+
+        # Tiles sharing each tile's colour group, padded with the tile itself
+        groups = [np.flatnonzero((self.group == g) & self.is_property) if g >= 0 else np.array([i])
+                  for i, g in enumerate(self.group)]
+        width = max(len(g) for g in groups)
+        self.group_tiles = np.array([np.pad(g, (0, width - len(g)), constant_values=i)
+                                     for i, g in enumerate(groups)])
+
+
+def simulate_batch(n_games: int, seed: int, max_turns: int = DEFAULT_MAX_TURNS) -> dict:
+    """Play `n_games` games to completion or `max_turns`; returns per-batch aggregates."""
+    rules = Rules()
+    rng = np.random.default_rng(seed)
+    n_players, n_tiles = len(SEAT_PERSONALITIES), rules.num_tiles
+    seat_pers = np.array(SEAT_PERSONALITIES)
+    chance, go_to_jail, tax = (TILE_TYPES.index(t) for t in ("CHANCE", "GO_TO_JAIL", "TAX"))
+
+    # Per-player state is indexed game * n_players + seat and per-tile state
+    # game * n_tiles + tile: flat gathers are several times faster than 2-D ones
+    money = np.full(n_games * n_players, rules.starting_money, dtype=np.int64)
+    pos = np.zeros(n_games * n_players, dtype=np.int64)
+    in_jail = np.zeros(n_games * n_players, dtype=bool)
+    jail_turns = np.zeros(n_games * n_players, dtype=np.int64)
+    bankrupt = np.zeros(n_games * n_players, dtype=bool)
+    owner = np.full(n_games * n_tiles, -1, dtype=np.int64)
+    buildings = np.zeros(n_games * n_tiles, dtype=np.int64)
+    current = np.zeros(n_games, dtype=np.int64)
+
+    winner = np.full(n_games, -1, dtype=np.int64)
+    turns = np.full(n_games, max_turns + 1, dtype=np.int64)  # max_turns + 1: unfinished
+    income = np.zeros(n_tiles)
+    invested = np.zeros(n_tiles)
+    bought = np.zeros(n_tiles)
+
+    g = np.arange(n_games)
+    for turn in range(max_turns):
+        if g.size == 0:
+            break
+        p = current[g]
+        pf = g * n_players + p
+        # One draw in [0, 36) is a pair of dice
+        roll = rng.integers(0, 36, size=g.size, dtype=np.int16)
+        total, double = DICE_TOTAL[roll], DICE_DOUBLE[roll]
+
+        # Jail: a fourth turn releases the player for a normal roll; before
+        # that, doubles escape (and move) and anything else ends the turn
+        jailed = in_jail[pf]
+        mv = ~jailed
+        if jailed.any():
+            jail_turns[pf[jailed]] += 1
+            freed = jailed & ((jail_turns[pf] > JAIL_MAX_TURNS) | double)
+            in_jail[pf[freed]] = False
+            jail_turns[pf[freed]] = 0
+            mv |= freed
+
+        gm, pm, pfm = g[mv], p[mv], pf[mv]
+        new_pos = pos[pfm] + total[mv]
+        money[pfm] += np.where(new_pos >= n_tiles, rules.go_salary, 0)
+        new_pos %= n_tiles
+        pos[pfm] = new_pos
+        tile_type = rules.type[new_pos]
+
+        # Tax and chance
+        delta = np.where(tile_type == tax, -rules.tax, 0)
+        is_chance = tile_type == chance
+        delta[is_chance] = CHANCE_EVENTS[rng.integers(0, len(CHANCE_EVENTS), size=int(is_chance.sum()))]
+        money[pfm] += delta
+
+        # Go to jail
+        sent = pfm[tile_type == go_to_jail]
+        pos[sent] = rules.jail_tile
+        in_jail[sent] = True
+        jail_turns[sent] = 0
+
+        # Properties
+        on_prop = rules.is_property[new_pos]
+        gp, pp, pfp, tp = gm[on_prop], pm[on_prop], pfm[on_prop], new_pos[on_prop]
+        persp = seat_pers[pp]
+        tfp = gp * n_tiles + tp
+        own = owner[tfp]
+        cash = money[pfp]
+        price = rules.price[tp]
+        group_owned = owner[(gp * n_tiles)[:, None] + rules.group_tiles[tp]] == pp[:, None]
+
+        buy = (own == -1) & (cash >= price) & np.where(
+            persp == AGGRESSIVE,
+            cash - price >= AGGRESSIVE_RESERVE,
+            (cash >= BUY_RATIO[persp] * price) | group_owned.any(axis=1),
+        )
+        owner[tfp[buy]] = pp[buy]
+        buildings[tfp[buy]] = 1
+        money[pfp[buy]] -= price[buy]
+        invested += np.bincount(tp[buy], weights=price[buy], minlength=n_tiles)
+        bought += np.bincount(tp[buy], minlength=n_tiles)
+
+        pay = (own >= 0) & (own != pp)
+        payee = gp[pay] * n_players + own[pay]
+        pay[pay] = ~in_jail[payee]
+        payee = gp[pay] * n_players + own[pay]
+        rent = rules.rent[tp[pay], buildings[tfp[pay]]]
+        money[pfp[pay]] -= rent
+        money[payee] += rent
+        income += np.bincount(tp[pay], weights=rent, minlength=n_tiles)
+
+        # Own property of a complete group: keep upgrading while the AI agrees
+        build = (own == pp) & group_owned.all(axis=1)
+        pfb, tfb, tb = pfp[build], tfp[build], tp[build]
+        need = BUILD_RATIO[persp[build]] * rules.build_cost[tb]
+        for _ in range(MAX_BUILDINGS):
+            ok = (buildings[tfb] < MAX_BUILDINGS) & (money[pfb] >= need)
+            if not ok.any():
+                break
+            pfb, tfb, tb, need = pfb[ok], tfb[ok], tb[ok], need[ok]
+            cost = rules.build_cost[tb]
+            buildings[tfb] += 1
+            money[pfb] -= cost
+            invested += np.bincount(tb, weights=cost, minlength=n_tiles)
+
+        # Bankruptcy releases every property of the bankrupt player
+        broke = money[pf] < 0
+        if broke.any():
+            gk, pk, pfk = g[broke], p[broke], pf[broke]
+            bankrupt[pfk] = True
+            money[pfk] = 0
+            rows = (gk * n_tiles)[:, None] + np.arange(n_tiles)
+            released = owner[rows] == pk[:, None]
+            owner[rows[released]] = -1
+            buildings[rows[released]] = 0
+
+            alive = ~bankrupt[(gk * n_players)[:, None] + np.arange(n_players)]
+            over = alive.sum(axis=1) <= 1
+            if over.any():
+                go = gk[over]
+                winner[go] = np.where(alive[over].any(axis=1), alive[over].argmax(axis=1), -1)
+                turns[go] = turn + 1
+                keep = ~np.isin(g, go)
+                g, p = g[keep], p[keep]
+
+        # Next player who is still in the game
+        nxt = (p + 1) % n_players
+        for _ in range(n_players - 1):
+            skip = bankrupt[g * n_players + nxt]
+            if not skip.any():
+                break
+            nxt = np.where(skip, (nxt + 1) % n_players, nxt)
+        current[g] = nxt
+
+    return {
+        "games": n_games,
+        "wins": np.bincount(winner + 1, minlength=n_players + 1).tolist(),  # [unfinished, seat 0, ...]
+        "turns": np.bincount(turns, minlength=max_turns + 2).tolist(),
+        "income": income.astype(np.int64).tolist(),
+        "invested": invested.astype(np.int64).tolist(),
+        "bought": bought.astype(np.int64).tolist(),
+    }
+
+
+def merge(results: list) -> dict:
+    out = {k: np.sum([r[k] for r in results], axis=0) for k in ("wins", "turns", "income", "invested", "bought")}
+    out["games"] = sum(r["games"] for r in results)
+    return out
+
+
+def report(totals: dict, rules: Rules, elapsed: float, max_turns: int):
+    games = totals["games"]
+    wins = totals["wins"]
+    # Games that ended with every player bankrupt have no winner but are finished
+    unfinished = int(np.asarray(totals["turns"])[max_turns + 1])
+    finished_games = games - unfinished
+    print(f"Simulated {games:,} games in {elapsed:.1f}s ({games / elapsed * 60:,.0f} games/minute)\n")
+    print(f"Unfinished after {max_turns} turns: {unfinished:,} games ({unfinished / games:.1%})")
+    if not finished_games:
+        print("No game finished; raise --max-turns")
+        return
+
+    print(f"\nWin rate by seat ({finished_games:,} finished games)")
+    for seat, pers in enumerate(SEAT_PERSONALITIES):
+        label = "human (autoplay)" if seat == 0 else f"AI {seat}"
+        print(f"  seat {seat} {label:<17} {PERSONALITIES[pers]:<13} {wins[seat + 1] / finished_games:6.1%}")
+
+    print("\nWin rate by personality (per seat, finished games)")
+    for i, name in enumerate(PERSONALITIES):
+        seats = [s for s, p in enumerate(SEAT_PERSONALITIES) if p == i]
+        if seats:
+            print(f"  {name:<13} {sum(wins[s + 1] for s in seats) / finished_games / len(seats):6.1%}")
+
+    counts = np.asarray(totals["turns"])
+    finished = counts[:max_turns + 1]
+    lengths = np.repeat(np.arange(len(finished)), finished)
+    if lengths.size:
+        q = np.percentile(lengths, [10, 50, 90])
+        print(f"\nGame length (player turns, finished games): mean {lengths.mean():.0f}, "
+              f"p10 {q[0]:.0f}, median {q[1]:.0f}, p90 {q[2]:.0f}")
+
+    print(f"\n{'tile':>4} {'name':<6} {'price':>6} {'bought/game':>11} {'rent/game':>10} {'invest/game':>11} {'ROI':>6}")
+    for i in np.flatnonzero(rules.is_property):
+        inv = totals["invested"][i]
+        roi = totals["income"][i] / inv if inv else 0.0
+        print(f"{i:>4} {rules.names[i]:<6} {rules.price[i]:>6} {totals['bought'][i] / games:>11.2f} "
+              f"{totals['income'][i] / games:>10.0f} {inv / games:>11.0f} {roi:>6.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--games", type=int, default=100_000)
+    parser.add_argument("--batch", type=int, default=20_000, help="games per vectorized batch")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-turns", type=int, default=DEFAULT_MAX_TURNS,
+                        help="player turns after which a game is stopped as unfinished")
+    parser.add_argument("--json", help="write the aggregated results to this file")
+    args = parser.parse_args()
+
+    sizes = [args.batch] * (args.games // args.batch)
+    if args.games % args.batch:
+        sizes.append(args.games % args.batch)
+    seeds = [int(s.generate_state(1)[0]) for s in np.random.SeedSequence(args.seed).spawn(len(sizes))]
+
+    t0 = time.perf_counter()
+    if args.workers > 1 and len(sizes) > 1:
+        with ProcessPoolExecutor(args.workers) as pool:
+            results = list(pool.map(simulate_batch, sizes, seeds, [args.max_turns] * len(sizes)))
+    else:
+        results = [simulate_batch(n, s, args.max_turns) for n, s in zip(sizes, seeds)]
+    totals = merge(results)
+    report(totals, Rules(), time.perf_counter() - t0, args.max_turns)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({k: (v.tolist() if isinstance(v, np.ndarray) else v) for k, v in totals.items()}, f)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""Sprite-sheet packing shared by the sheet-producing build stages."""
+
+from PIL import Image
+
+
+def pack_shelves(sizes: dict, sheet_width: int, padding: int = 2) -> tuple[dict, int]:
+    """Shelf-pack rectangles, tallest first.
+
+    `sizes` maps key -> (w, h). Returns (key -> [x, y, w, h], sheet height).
+    """
+    rects = {}
+    x = y = shelf_h = 0
+    for key, (w, h) in sorted(sizes.items(), key=lambda kv: (-kv[1][1], -kv[1][0])):
+        if w > sheet_width:
+            raise ValueError(f"{key} ({w}px) is wider than the sheet ({sheet_width}px)")
+        if x + w > sheet_width:
+            x, y, shelf_h = 0, y + shelf_h + padding, 0
+        rects[key] = [x, y, w, h]
+        x += w + padding
+        shelf_h = max(shelf_h, h)
+    return rects, y + shelf_h
+
+
+def build_sheet(frames: dict, sheet_width: int, padding: int = 2) -> tuple[Image.Image, dict]:
+    """Pack RGBA frames (key -> Image) into one sheet; returns (sheet, key -> [x, y, w, h])."""
+    rects, height = pack_shelves({k: img.size for k, img in frames.items()}, sheet_width, padding)
+    sheet = Image.new("RGBA", (sheet_width, max(1, height)), (0, 0, 0, 0))
+    for key, (x, y, _, _) in rects.items():
+        sheet.paste(frames[key], (x, y))
+    # Keep the manifest in the caller's frame order rather than packing order
+    return sheet, {k: rects[k] for k in frames}
@@ -0,0 +1,127 @@
+// Content-hashed asset URLs (hash_assets.py). Asset IDs are the fixed paths the
+// game has always used ("/characters/atube.png"); once the manifest is loaded
+// they resolve to immutable hashed URLs, otherwise to themselves. Images that
+// encode_assets.py re-encoded resolve to the first of their sources the
+// browser can decode. Assets loaded from the packs (pack_assets.py) resolve to
+// object URLs of their in-memory copies.
+
+import { loadAssetPacks } from './AssetPack';
+
+export interface AssetSource {
+  url: string;
+  bytes: number;
+  type: string;
+  hash: string;
+}
+
+export interface AssetEntry {
+  url: string;
+  bytes: number;
+  type: string;
+  hash: string;
+  width?: number;
+  height?: number;
+  placeholder?: string;  // tiny data-URL thumbnail painted until the full image loads
+  standIn?: boolean;     // procedural stand-in from generate_placeholders.py, not a real render
+  sources?: AssetSource[];  // smaller encodings, smallest first, ending with a PNG
+}
+
+interface AssetManifestData {
+  version: string;
+  assets: Record<string, AssetEntry>;
+  preload: string[];  // asset IDs, most urgent first
+}
+
+const MANIFEST_URL = '/hashed/manifest.json';
+
+// 1x1 images with alpha, decoded once to find the formats the browser supports
+const FORMAT_PROBES: Record<string, string> = {
+  'image/avif': 'data:image/avif;base64,AAAAIGZ0eXBhdmlmAAAAAGF2aWZtaWYxbWlhZk1BMUIAAAGGbWV0YQAAAAAAAAAhaGRscgAAAAAAAAAAcGljdAAAAAAAAAAAAAAAAAAAAAAOcGl0bQAAAAAAAQAAACxpbG9jAAAAAEQAAAIAAQAAAAEAAAG/AAAAKAACAAAAAQAAAa4AAAARAAAAQmlpbmYAAAAAAAIAAAAaaW5mZQIAAAAAAQAAYXYwMUNvbG9yAAAAABppbmZlAgAAAAACAABhdjAxQWxwaGEAAAAAGmlyZWYAAAAAAAAADmF1eGwAAgABAAEAAADDaXBycAAAAJ1pcGNvAAAAFGlzcGUAAAAAAAAAAQAAAAEAAAAQcGl4aQAAAAADCAgIAAAADGF2MUOBAAwAAAAAE2NvbHJuY2x4AAEADQAGgAAAAA5waXhpAAAAAAEIAAAADGF2MUOBABwAAAAAOGF1eEMAAAAAdXJuOm1wZWc6bXBlZ0I6Y2ljcDpzeXN0ZW1zOmF1eGlsaWFyeTphbHBoYQAAAAAeaXBtYQAAAAAAAAACAAEEAQKDBAACBAEFhgcAAABBbWRhdBIACgQYAAYVMgcYACihABCgEgAKCBgABogIaDQgMhoZR4eGIYeeeeaAAACQQMkcYUsrTY9RRU6koA==',
+  'image/webp': 'data:image/webp;base64,UklGRlQAAABXRUJQVlA4WAoAAAAQAAAAAAAAAAAAQUxQSAIAAAAAgFZQOCAsAAAAkAEAnQEqAQABAALATCWgAnS6AAOYAP7uQx/ubHOLcFf/bQ//Wh/+tD/pQAA=',
+};
+
+let manifest: AssetManifestData | null = null;
+const placeholders: Map<string, HTMLImageElement> = new Map();
+const decodableTypes: Set<string> = new Set(['image/png', 'image/jpeg']);
+const packedUrls: Map<string, string> = new Map();
+
+// Resolves once the manifest is loaded and its placeholders are decoded, or
+// immediately usable with fixed paths if it is missing
+export function loadAssetManifest(): Promise<void> {
+  const manifestLoaded = fetch(MANIFEST_URL, { cache: 'no-cache' })
+    .then(res => (res.ok ? res.json() : null))
+    .then((data: AssetManifestData | null) => {
+      if (!data || !data.assets) return;
+      manifest = data;
+      return decodePlaceholders(data);
+    })
+    .catch(() => {}); // manifest not built: serve the fixed paths
+  return Promise.all([manifestLoaded, probeImageFormats()]).then(() => {});
+}
+
+function probeImageFormats(): Promise<void> {
+  return Promise.all(Object.entries(FORMAT_PROBES).map(([type, dataUrl]) => {
+    const img = new Image();
+    img.src = dataUrl;
+    return img.decode().then(() => { decodableTypes.add(type); }, () => {});
+  })).then(() => {});
+}
+
+// Serve assets from the packs where they match the manifest and can be decoded;
+// call after loadAssetManifest() and before the renderers start loading
+export function loadPackedAssets(scale: number): Promise<void> {
+  if (!manifest) return Promise.resolve();
+  return loadAssetPacks(scale).then(packed => {
+    for (const [id, asset] of packed) {
+      const entry = manifest?.assets[id];
+      const form = entry?.sources?.[0] ?? entry;
+      if (!form || !form.hash.startsWith(`sha256-${asset.sha256}`)) continue; // packs from another build
+      if (form.type.startsWith('image/') && !decodableTypes.has(form.type)) continue;
+      packedUrls.set(id, URL.createObjectURL(asset.blob));
+    }
+  });
+}
+
+function decodePlaceholders(data: AssetManifestData): Promise<void> {
+  const pending: Promise<void>[] = [];
+  for (const [id, entry] of Object.entries(data.assets)) {
+    if (!entry.placeholder) continue;
+    const img = new Image();
+    img.src = entry.placeholder;
+    placeholders.set(id, img);
+    pending.push(img.decode().catch(() => {}));
+  }
+  return Promise.all(pending).then(() => {});
+}
+
+export function assetUrl(id: string): string {
+  const packed = packedUrls.get(id);
+  if (packed) return packed;
+  const entry = manifest?.assets[id];
+  if (!entry) return id;
+  return entry.sources?.find(source => decodableTypes.has(source.type))?.url ?? entry.url;
+}
+
+export function getAssetEntry(id: string): AssetEntry | undefined {
+  return manifest?.assets[id];
+}
+
+// Placeholder thumbnail for an image asset, once decoded
+export function getPlaceholder(id: string): HTMLImageElement | undefined {
+  const img = placeholders.get(id);
+  return (img && img.complete && img.naturalWidth > 0) ? img : undefined;
+}
+
+export function getPreloadList(): string[] {
+  return manifest ? manifest.preload.map(id => assetUrl(id)) : [];
+}
+
+// Precache the hashed assets so repeat visits need no revalidation (public/sw.js);
+// the worker is told which encodings to fetch. Packs rely on the HTTP cache.
+// The manifest version in the URL makes each build install a new worker, so
+// its preload list is precached and the previous build's cache is dropped.
+export function registerAssetServiceWorker() {
+  if (!manifest || !('serviceWorker' in navigator)) return;
+  const formats = [...decodableTypes].map(type => type.split('/')[1]).sort().join(',');
+  navigator.serviceWorker.register(`/sw.js?formats=${formats}&v=${manifest.version}`).catch(() => {});
+}
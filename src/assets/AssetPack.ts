@@ -0,0 +1,106 @@
+// Loader for the asset packs written by pack_assets.py. The binary index is
+// fetched once, then every pack holding an asset this display draws is fetched
+// whole (one request instead of one per asset) and sliced into Blobs.
+
+const PACK_DIR = '/packs/';
+const INDEX_URL = `${PACK_DIR}assets.idx`;
+const MAGIC = 'RM4PACK\0';
+const FORMAT_VERSION = 1;
+const HEADER_SIZE = 32;
+const PACK_RECORD_SIZE = 16;
+const ENTRY_RECORD_SIZE = 48;
+const DIGEST_OFFSET = 32;
+const DIGEST_SIZE = 16;
+
+// Type codes stored in the index; keep in sync with TYPE_CODES in pack_assets.py
+const PACK_TYPES = [
+  'application/octet-stream',
+  'image/png',
+  'image/webp',
+  'image/avif',
+  'application/json',
+  'audio/mpeg',
+];
+
+interface PackIndexEntry {
+  id: string;
+  pack: number;
+  offset: number;
+  length: number;
+  type: string;
+  sha256: string;  // first 16 bytes of the asset's SHA-256, hex
+}
+
+export interface PackedAsset {
+  blob: Blob;
+  sha256: string;
+}
+
+function parseIndex(buf: ArrayBuffer): { packUrls: string[]; entries: PackIndexEntry[] } | null {
+  const view = new DataView(buf);
+  const bytes = new Uint8Array(buf);
+  const decoder = new TextDecoder();
+  if (decoder.decode(bytes.subarray(0, 8)) !== MAGIC || view.getUint16(8, true) !== FORMAT_VERSION) {
+    return null;
+  }
+  const count = view.getUint32(12, true);
+  const packCount = view.getUint32(16, true);
+  const entriesOffset = view.getUint32(20, true);
+  const stringsOffset = view.getUint32(24, true);
+  const str = (offset: number, length: number) =>
+    decoder.decode(bytes.subarray(stringsOffset + offset, stringsOffset + offset + length));
+
+  const packUrls: string[] = [];
+  for (let i = 0; i < packCount; i++) {
+    const rec = HEADER_SIZE + i * PACK_RECORD_SIZE;
+    packUrls.push(PACK_DIR + str(view.getUint32(rec, true), view.getUint32(rec + 4, true)));
+  }
+
+  const entries: PackIndexEntry[] = [];
+  for (let i = 0; i < count; i++) {
+    const rec = entriesOffset + i * ENTRY_RECORD_SIZE;
+    const digest = bytes.subarray(rec + DIGEST_OFFSET, rec + DIGEST_OFFSET + DIGEST_SIZE);
+    entries.push({
+      id: str(view.getUint32(rec + 24, true), view.getUint32(rec + 28, true)),
+      pack: view.getUint16(rec, true),
+      offset: Number(view.getBigUint64(rec + 8, true)),
+      length: Number(view.getBigUint64(rec + 16, true)),
+      type: PACK_TYPES[view.getUint16(rec + 2, true)] || PACK_TYPES[0],
+      sha256: Array.from(digest, b => b.toString(16).padStart(2, '0')).join(''),
+    });
+  }
+  return { packUrls, entries };
+}
+
+// Sheets come as "x.png" and "x@2x.png"; only the one for the backing scale is drawn
+function usedAtScale(id: string, ids: Set<string>, scale: number): boolean {
+  if (/@2x\.[^./]+$/.test(id)) return scale === 2;
+  return scale === 1 || !ids.has(id.replace(/(\.[^./]+)$/, '@2x$1'));
+}
+
+// Asset ID -> packed bytes for every asset used at `scale`; empty if the packs are not built
+export function loadAssetPacks(scale: number): Promise<Map<string, PackedAsset>> {
+  return fetch(INDEX_URL, { cache: 'no-cache' })
+    .then(res => (res.ok ? res.arrayBuffer() : null))
+    .then(buf => {
+      const index = buf ? parseIndex(buf) : null;
+      if (!index) return new Map<string, PackedAsset>();
+      const ids = new Set(index.entries.map(e => e.id));
+      const wanted = index.entries.filter(e => usedAtScale(e.id, ids, scale));
+      const packs = [...new Set(wanted.map(e => e.pack))];
+      return Promise.all(packs.map(pack => fetch(index.packUrls[pack])
+        .then(res => (res.ok ? res.arrayBuffer() : null))
+        .catch(() => null)))
+        .then(data => {
+          const assets = new Map<string, PackedAsset>();
+          for (const e of wanted) {
+            const packData = data[packs.indexOf(e.pack)];
+            if (!packData) continue; // that pack failed: its assets load as loose files
+            const blob = new Blob([new Uint8Array(packData, e.offset, e.length)], { type: e.type });
+            assets.set(e.id, { blob, sha256: e.sha256 });
+          }
+          return assets;
+        });
+    })
+    .catch(() => new Map<string, PackedAsset>()); // packs not built: load loose files
+}
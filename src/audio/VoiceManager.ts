@@ -1,4 +1,5 @@
 import { CHARACTER_DEFS } from '../constants';
+import { assetUrl } from '../assets/AssetManifest';
 
 const VOICE_IDS = [
   'select', 'turnStart', 'roll', 'buyProperty', 'payRent', 'getRent',
@@ -26,7 +27,7 @@ export class VoiceManager {
         const path = `/voices/${ch.id}/${vid}.mp3`;
         const audio = new Audio();
         audio.preload = 'auto';
-        audio.src = path;
+        audio.src = assetUrl(path);
         this.cache.set(`${ch.id}/${vid}`, audio);
       }
     }
@@ -1,7 +1,19 @@
 import { PlayerState, PropertyState, AIPersonality, TileType, GameState, Stock, CardType } from '../types';
 import { TILE_DEFS, TOTAL_TILES } from '../constants';
+import { GROUP_OF, GROUP_OFFSETS, GROUP_TILES } from './BoardTables';
 
 export class AI {
+  // Number of tiles in the tile's colour group owned by the player, and the group size
+  private static groupOwnership(playerIndex: number, tileIndex: number, properties: PropertyState[]): [number, number] {
+    const group = GROUP_OF[tileIndex];
+    if (group < 0) return [0, 0];
+    let owned = 0;
+    for (let k = GROUP_OFFSETS[group]; k < GROUP_OFFSETS[group + 1]; k++) {
+      if (properties[GROUP_TILES[k]].ownerIndex === playerIndex) owned++;
+    }
+    return [owned, GROUP_OFFSETS[group + 1] - GROUP_OFFSETS[group]];
+  }
+
   // Decide whether to buy a property
   static shouldBuy(player: PlayerState, tileIndex: number, properties: PropertyState[]): boolean {
     const tile = TILE_DEFS[tileIndex];
@@ -9,10 +21,7 @@ export class AI {
     if (tile.price > player.money) return false;
 
     const moneyRatio = player.money / tile.price;
-
-    // Count how many in same group we own
-    const groupTiles = TILE_DEFS.filter(t => t.colorGroup === tile.colorGroup);
-    const ownedInGroup = groupTiles.filter(t => properties[t.index].ownerIndex === player.index).length;
+    const [ownedInGroup] = this.groupOwnership(player.index, tileIndex, properties);
 
     switch (player.personality) {
       case AIPersonality.AGGRESSIVE:
@@ -38,9 +47,8 @@ export class AI {
     if (tile.buildCost > player.money) return false;
 
     // Check if we own all in group
-    const groupTiles = TILE_DEFS.filter(t => t.colorGroup === tile.colorGroup);
-    const ownsAll = groupTiles.every(t => properties[t.index].ownerIndex === player.index);
-    if (!ownsAll) return false;
+    const [owned, groupSize] = this.groupOwnership(player.index, tileIndex, properties);
+    if (owned < groupSize) return false;
 
     const moneyRatio = player.money / tile.buildCost;
 
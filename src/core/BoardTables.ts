@@ -0,0 +1,69 @@
+// Generated by board_tables.py from TILE_DEFS; do not edit by hand.
+// Landing probabilities come from the stationary distribution of the board's
+// two-dice Markov chain with jail (see board_tables.py).
+
+export const RENT_LEVELS = 6;
+
+// Landings per player turn on each tile
+export const LANDING_PROB = new Float32Array([
+  0.0261864, 0.0265228, 0.0267962, 0.027004, 0.0272183, 0.0275077, 0.0270648, 0.0268361,
+  0.026756, 0.0267746, 0.0295606, 0.0279472, 0.0308021, 0.0292028, 0.032098, 0.0306352,
+  0.0327262, 0.0305157, 0.0327432, 0.0306147, 0.0328515, 0.0306466, 0.0310272, 0.0313008,
+  0.0314394, 0.0315284, 0.0306539, 0.0297656, 0.0287954, 0.0278003, 0.0267904, 0.0256615,
+]);
+
+// Mean of LANDING_PROB over property tiles
+export const MEAN_PROPERTY_LANDING = 0.0292848;
+
+// Expected rent per opponent turn: [tile * RENT_LEVELS + buildings]
+export const EXPECTED_RENT = new Float32Array([
+  0, 0, 0, 0, 0, 0,
+  0.106091, 0.530456, 1.59137, 4.77411, 8.4873, 11.9353,
+  0, 0, 0, 0, 0, 0,
+  0.108016, 0.540081, 1.62024, 4.86073, 8.64129, 12.1518,
+  0, 0, 0, 0, 0, 0,
+  0.165046, 0.825231, 2.47569, 7.42708, 11.0031, 15.1292,
+  0.162389, 0.811943, 2.43583, 7.30749, 10.8259, 14.8856,
+  0.214689, 1.07344, 2.68361, 8.05084, 12.0763, 16.1017,
+  0, 0, 0, 0, 0, 0,
+  0.267746, 1.33873, 4.01619, 12.0486, 16.7341, 20.0809,
+  0.295606, 1.47803, 4.43408, 13.3022, 18.4753, 22.1704,
+  0, 0, 0, 0, 0, 0,
+  0.369625, 1.84812, 5.54437, 15.401, 21.5614, 27.7219,
+  0.408839, 2.0442, 5.84056, 16.0615, 21.9021, 27.7427,
+  0.449372, 2.24686, 6.41961, 17.6539, 24.0735, 30.4931,
+  0.490163, 2.45082, 6.73974, 18.3811, 24.5082, 30.6352,
+  0, 0, 0, 0, 0, 0,
+  0.549283, 2.74641, 7.62893, 21.361, 26.7013, 32.0415,
+  0.589378, 2.94689, 8.1858, 22.9202, 28.6503, 34.3804,
+  0, 0, 0, 0, 0, 0,
+  0.657029, 3.28515, 9.85544, 24.6386, 30.3876, 36.1366,
+  0.674225, 3.37112, 10.1134, 24.5173, 29.8804, 35.2436,
+  0, 0, 0, 0, 0, 0,
+  0.688618, 3.44309, 10.3293, 25.0407, 30.5183, 35.996,
+  0, 0, 0, 0, 0, 0,
+  0.756681, 3.7834, 11.3502, 26.7991, 32.3166, 37.834,
+  0.797002, 3.98501, 11.955, 27.5885, 33.7193, 39.0837,
+  0.773906, 3.86953, 11.6086, 26.7891, 32.7422, 37.9512,
+  0, 0, 0, 0, 0, 0,
+  0.778408, 4.17005, 12.5101, 27.8003, 33.3604, 38.9204,
+  0.937666, 4.68833, 13.3952, 29.4695, 34.8276, 40.1857,
+  1.28308, 5.13231, 15.3969, 35.9262, 43.6246, 51.3231,
+]);
+
+// Colour group of each tile (-1 for non-property tiles)
+export const GROUP_OF = new Int8Array([
+  -1, 0, -1, 0, -1, 1, 1, 1,
+  -1, 2, 2, -1, 2, 3, 3, 3,
+  -1, 4, 4, -1, 4, 5, -1, 5,
+  -1, 5, 6, 6, -1, 6, 7, 7,
+]);
+
+// Property tiles of group g are GROUP_TILES[GROUP_OFFSETS[g] .. GROUP_OFFSETS[g + 1])
+export const GROUP_OFFSETS = new Uint8Array([
+  0, 2, 5, 8, 11, 14, 17, 20, 22,
+]);
+export const GROUP_TILES = new Uint8Array([
+  1, 3, 5, 6, 7, 9, 10, 12, 13, 14, 15, 17, 18, 20, 21, 23,
+  25, 26, 27, 29, 30, 31,
+]);
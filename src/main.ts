@@ -4,6 +4,7 @@ import { Renderer } from './render/Renderer';
 import { LobbyUI } from './net/LobbyUI';
 import { ClientStateHolder } from './net/ClientStateHolder';
 import { GameEvent } from './shared/protocol';
+import { loadAssetManifest, loadPackedAssets, registerAssetServiceWorker } from './assets/AssetManifest';
 
 async function main() {
   const canvas = document.getElementById('gameCanvas') as HTMLCanvasElement;
@@ -12,9 +13,19 @@ async function main() {
     return;
   }
 
+  // Resolve hashed asset URLs before anything starts loading art or audio
+  await loadAssetManifest();
+  registerAssetServiceWorker();
+  // The packs download while the lobby is up. Renderer sizes the canvas backing
+  // store to CANVAS_WIDTH, so the 1x sheet variants are the ones drawn.
+  const packsLoaded = loadPackedAssets(1);
+  // Canvas text only uses an @font-face once it has loaded; fall back if it is missing
+  const fontLoaded = document.fonts.load('16px "Richman4 Sans"').catch(() => []);
+
   // Show lobby to choose mode
   const lobby = new LobbyUI();
   const result = await lobby.run();
+  await Promise.all([packsLoaded, fontLoaded]);
 
   const board = new Board();
 
@@ -22,7 +33,8 @@ async function main() {
     // === Single-player mode (existing flow) ===
     const engine = new GameEngine();
     const renderer = new Renderer(canvas, board, engine);
-    await renderer.uiRenderer.loadCharacterImages();
+    // Placeholders from the asset manifest paint until the full images arrive
+    renderer.uiRenderer.loadCharacterImages();
     renderer.wireEngine(engine);
 
     canvas.addEventListener('click', (e) => {
@@ -80,7 +92,8 @@ async function main() {
       }
     });
 
-    await renderer.uiRenderer.loadCharacterImages();
+    // Placeholders from the asset manifest paint until the full images arrive
+    renderer.uiRenderer.loadCharacterImages();
 
     // Send actions to server
     canvas.addEventListener('click', (e) => {
@@ -1,16 +1,94 @@
 import { Board } from '../core/Board';
 import { GameState, TileType, Vec2 } from '../types';
-import { TILE_DEFS, TOTAL_TILES, GROUP_COLORS } from '../constants';
+import { TILE_DEFS, TOTAL_TILES, GROUP_COLORS, CANVAS_WIDTH, CANVAS_HEIGHT } from '../constants';
+import { assetUrl, getPlaceholder } from '../assets/AssetManifest';
+import { glyphAtlas } from './GlyphAtlas';
+
+// Building sprites pre-rendered at their exact on-board size (generate_buildings.py)
+interface BuildingSheet {
+  image: string;
+  scales: number[];
+  tiles: Record<string, Record<string, number>>;          // tile index -> scale -> sprite size
+  frames: Record<string, [number, number, number, number]>; // "scale:size:level" -> [x, y, w, h]
+}
+
+// Static board layers rasterized from TILE_DEFS (render_board.py), stacked
+// top to bottom in one canvas-sized band each
+interface StaticBoardLayout {
+  images: Record<string, string>;  // scale -> image file
+  layers: string[];                // 'base', 'names', 'prices'
+  tiles: { index: number; priceRect: [number, number, number, number] | null }[];
+}
 
 export class BoardRenderer {
   private board: Board;
   private buildingImages: Map<number, HTMLImageElement> = new Map();
   private imagesLoaded = false;
+  private buildingSheet: BuildingSheet | null = null;
+  private buildingSheetImage: HTMLImageElement | null = null;
+  private staticBoard: StaticBoardLayout | null = null;
+  private staticBoardImage: HTMLImageElement | null = null;
+  private staticBoardScale = 1;
+  private staticBoardRequested = false;
   private currentPlayerPosition: number = -1;
 
   constructor(board: Board) {
     this.board = board;
     this.loadBuildingImages();
+    this.loadBuildingSheet();
+  }
+
+  private loadBuildingSheet() {
+    fetch(assetUrl('/sheets/buildings.json'))
+      .then(res => (res.ok ? res.json() : null))
+      .then((sheet: BuildingSheet | null) => {
+        if (!sheet) return;
+        const img = new Image();
+        img.onload = () => {
+          this.buildingSheet = sheet;
+          this.buildingSheetImage = img;
+        };
+        img.src = assetUrl(`/sheets/${sheet.image}`);
+      })
+      .catch(() => {}); // sheet not built: fall back to the per-level images
+  }
+
+  private loadStaticBoard(scale: number) {
+    this.staticBoardRequested = true;
+    fetch(assetUrl('/sheets/board.json'))
+      .then(res => (res.ok ? res.json() : null))
+      .then((layout: StaticBoardLayout | null) => {
+        const file = layout && (layout.images[scale] || layout.images[1]);
+        if (!layout || !file || !layout.layers) return;
+        const img = new Image();
+        img.onload = () => {
+          this.staticBoard = layout;
+          this.staticBoardImage = img;
+          this.staticBoardScale = img.naturalWidth / CANVAS_WIDTH;
+        };
+        img.src = assetUrl(`/sheets/${file}`);
+      })
+      .catch(() => {}); // layer not built: keep drawing the board procedurally
+  }
+
+  // Sprite scale matching the canvas backing store, so sheet pixels map to device pixels
+  private backingScale(ctx: CanvasRenderingContext2D): number {
+    return ctx.canvas.width / CANVAS_WIDTH >= 1.5 ? 2 : 1;
+  }
+
+  // Blit a building from the sheet 1:1; returns false if no matching frame exists
+  private drawBuildingFromSheet(ctx: CanvasRenderingContext2D, tileIndex: number, level: number, cx: number, cy: number): boolean {
+    const sheet = this.buildingSheet;
+    if (!sheet || !this.buildingSheetImage) return false;
+    const scale = this.backingScale(ctx);
+    const size = sheet.tiles[tileIndex]?.[scale];
+    const frame = size !== undefined ? sheet.frames[`${scale}:${size}:${level}`] : undefined;
+    if (!frame) return false;
+    const [sx, sy, sw, sh] = frame;
+    const dw = sw / scale;
+    const dh = sh / scale;
+    ctx.drawImage(this.buildingSheetImage, sx, sy, sw, sh, Math.round(cx - dw / 2), Math.round(cy - dh / 2), dw, dh);
+    return true;
   }
 
   private loadBuildingImages() {
@@ -23,7 +101,7 @@ export class BoardRenderer {
       const img = new Image();
       img.onload = done;
       img.onerror = done; // don't block on failed images
-      img.src = `/buildings/building_${level}.png`;
+      img.src = assetUrl(`/buildings/building_${level}.png`);
       this.buildingImages.set(level, img);
     }
   }
@@ -35,9 +113,116 @@ export class BoardRenderer {
     } else {
       this.currentPlayerPosition = -1;
     }
-    this.drawBoardSurface(ctx);
-    this.drawTiles(ctx, state);
-    this.drawBoardCenter(ctx);
+    if (!this.staticBoardRequested) this.loadStaticBoard(this.backingScale(ctx));
+
+    if (this.staticBoardImage) {
+      this.drawStaticLayer(ctx, 'base');
+      this.drawTileOverlays(ctx, state);
+      this.drawStaticLayer(ctx, 'names');
+      this.drawStaticPrices(ctx, state);
+    } else {
+      this.drawBoardSurface(ctx);
+      this.drawTiles(ctx, state);
+      this.drawBoardCenter(ctx);
+    }
+    this.drawBuildings(ctx, state);
+  }
+
+  private tracePoly(ctx: CanvasRenderingContext2D, poly: Vec2[]) {
+    ctx.beginPath();
+    ctx.moveTo(poly[0].x, poly[0].y);
+    for (let j = 1; j < poly.length; j++) {
+      ctx.lineTo(poly[j].x, poly[j].y);
+    }
+    ctx.closePath();
+  }
+
+  private tileFillColor(index: number): string {
+    const tile = TILE_DEFS[index];
+    if (tile.type === TileType.PROPERTY && tile.colorGroup >= 0) {
+      return GROUP_COLORS[tile.colorGroup] || '#ddd';
+    } else if (tile.type === TileType.GO) {
+      return '#fff9c4';
+    } else if (tile.type === TileType.JAIL || tile.type === TileType.GO_TO_JAIL) {
+      return '#ffccbc';
+    } else if (tile.type === TileType.CHANCE) {
+      return '#e1bee7';
+    } else if (tile.type === TileType.TAX) {
+      return '#ffcdd2';
+    } else if (tile.type === TileType.FREE_PARKING) {
+      return '#b2dfdb';
+    }
+    return '#e0e0e0';
+  }
+
+  // Blit a region (canvas coordinates) of one band of the static board
+  private blitStatic(ctx: CanvasRenderingContext2D, layer: string, x: number, y: number, w: number, h: number) {
+    const row = this.staticBoard!.layers.indexOf(layer);
+    if (row < 0) return;
+    const s = this.staticBoardScale;
+    ctx.drawImage(this.staticBoardImage!, x * s, (row * CANVAS_HEIGHT + y) * s, w * s, h * s, x, y, w, h);
+  }
+
+  private drawStaticLayer(ctx: CanvasRenderingContext2D, layer: string) {
+    this.blitStatic(ctx, layer, 0, 0, CANVAS_WIDTH, CANVAS_HEIGHT);
+  }
+
+  // Prices are only shown while the property is unowned
+  private drawStaticPrices(ctx: CanvasRenderingContext2D, state: GameState) {
+    for (const layout of this.staticBoard!.tiles) {
+      if (layout.priceRect && state.properties[layout.index].ownerIndex === -1) {
+        const [x, y, w, h] = layout.priceRect;
+        this.blitStatic(ctx, 'prices', x, y, w, h);
+      }
+    }
+  }
+
+  // Per-frame state drawn between the static base and its text layers
+  private drawTileOverlays(ctx: CanvasRenderingContext2D, state: GameState) {
+    for (const layout of this.staticBoard!.tiles) {
+      const poly = this.board.getTileScreenPoly(layout.index);
+      if (poly.length < 4) continue;
+      this.drawTileState(ctx, state, layout.index, poly);
+    }
+  }
+
+  // Current-player highlight and ownership markers for one tile
+  private drawTileState(ctx: CanvasRenderingContext2D, state: GameState, i: number, poly: Vec2[]) {
+    const prop = state.properties[i];
+
+    // Highlight current player's tile
+    if (i === this.currentPlayerPosition) {
+      ctx.save();
+      this.tracePoly(ctx, poly);
+      ctx.fillStyle = 'rgba(255, 235, 59, 0.35)';
+      ctx.fill();
+      ctx.strokeStyle = '#ffc107';
+      ctx.lineWidth = 3;
+      ctx.stroke();
+      ctx.restore();
+    }
+
+    // Owner border highlight and ownership indicator
+    if (prop.ownerIndex >= 0 && state.players[prop.ownerIndex]) {
+      const ownerColor = state.players[prop.ownerIndex].color;
+      this.tracePoly(ctx, poly);
+      ctx.strokeStyle = ownerColor;
+      ctx.lineWidth = 4;
+      ctx.stroke();
+
+      // Draw ownership flag in corner when no buildings yet
+      if (prop.buildings === 0) {
+        const flagX = poly[0].x;
+        const flagY = poly[0].y;
+        ctx.beginPath();
+        ctx.arc(flagX, flagY, 6, 0, Math.PI * 2);
+        ctx.fillStyle = ownerColor;
+        ctx.fill();
+        ctx.strokeStyle = '#fff';
+        ctx.lineWidth = 1;
+        ctx.stroke();
+      }
+    }
   }
 
   private drawBoardSurface(ctx: CanvasRenderingContext2D) {
@@ -85,48 +270,26 @@ export class BoardRenderer {
     // Title
     const center = this.board.project({ x: 0, y: 0, z: -0.05 });
     ctx.fillStyle = '#2e7d32';
-    ctx.font = 'bold 32px "Microsoft YaHei", sans-serif';
+    ctx.font = 'bold 32px "Richman4 Sans", "Microsoft YaHei", sans-serif';
     ctx.textAlign = 'center';
     ctx.textBaseline = 'middle';
-    ctx.fillText('大富翁4', center.x, center.y - 10);
+    glyphAtlas.fillText(ctx, '大富翁4', center.x, center.y - 10);
 
     ctx.fillStyle = '#388e3c';
-    ctx.font = '14px "Microsoft YaHei", sans-serif';
-    ctx.fillText('MONOPOLY', center.x, center.y + 18);
+    ctx.font = '14px "Richman4 Sans", "Microsoft YaHei", sans-serif';
+    glyphAtlas.fillText(ctx, 'MONOPOLY', center.x, center.y + 18);
   }
   private drawTiles(ctx: CanvasRenderingContext2D, state: GameState) {
-    // Pass 1: Draw all tile backgrounds, borders, and text labels
+    // Draw all tile backgrounds, borders, and text labels
     for (let i = 0; i < TOTAL_TILES; i++) {
       const poly = this.board.getTileScreenPoly(i);
       if (poly.length < 4) continue;
       const tile = TILE_DEFS[i];
       const prop = state.properties[i];
-      const isCurrentPlayerTile = i === this.currentPlayerPosition;
 
       // Fill tile background
-      ctx.beginPath();
-      ctx.moveTo(poly[0].x, poly[0].y);
-      for (let j = 1; j < poly.length; j++) {
-        ctx.lineTo(poly[j].x, poly[j].y);
-      }
-      ctx.closePath();
-
-      // Color based on type
-      if (tile.type === TileType.PROPERTY && tile.colorGroup >= 0) {
-        ctx.fillStyle = GROUP_COLORS[tile.colorGroup] || '#ddd';
-      } else if (tile.type === TileType.GO) {
-        ctx.fillStyle = '#fff9c4';
-      } else if (tile.type === TileType.JAIL || tile.type === TileType.GO_TO_JAIL) {
-        ctx.fillStyle = '#ffccbc';
-      } else if (tile.type === TileType.CHANCE) {
-        ctx.fillStyle = '#e1bee7';
-      } else if (tile.type === TileType.TAX) {
-        ctx.fillStyle = '#ffcdd2';
-      } else if (tile.type === TileType.FREE_PARKING) {
-        ctx.fillStyle = '#b2dfdb';
-      } else {
-        ctx.fillStyle = '#e0e0e0';
-      }
+      this.tracePoly(ctx, poly);
+      ctx.fillStyle = this.tileFillColor(i);
       ctx.fill();
 
       // Inner shadow effect
@@ -142,59 +305,12 @@ export class BoardRenderer {
       ctx.restore();
 
       // Tile border
-      ctx.beginPath();
-      ctx.moveTo(poly[0].x, poly[0].y);
-      for (let j = 1; j < poly.length; j++) {
-        ctx.lineTo(poly[j].x, poly[j].y);
-      }
-      ctx.closePath();
+      this.tracePoly(ctx, poly);
       ctx.strokeStyle = '#444';
       ctx.lineWidth = 1;
       ctx.stroke();
 
-      // Highlight current player's tile
-      if (isCurrentPlayerTile) {
-        ctx.save();
-        ctx.beginPath();
-        ctx.moveTo(poly[0].x, poly[0].y);
-        for (let j = 1; j < poly.length; j++) {
-          ctx.lineTo(poly[j].x, poly[j].y);
-        }
-        ctx.closePath();
-        ctx.fillStyle = 'rgba(255, 235, 59, 0.35)';
-        ctx.fill();
-        ctx.strokeStyle = '#ffc107';
-        ctx.lineWidth = 3;
-        ctx.stroke();
-        ctx.restore();
-      }
-
-      // Owner border highlight and ownership indicator
-      if (prop.ownerIndex >= 0 && state.players[prop.ownerIndex]) {
-        const ownerColor = state.players[prop.ownerIndex].color;
-        ctx.beginPath();
-        ctx.moveTo(poly[0].x, poly[0].y);
-        for (let j = 1; j < poly.length; j++) {
-          ctx.lineTo(poly[j].x, poly[j].y);
-        }
-        ctx.closePath();
-        ctx.strokeStyle = ownerColor;
-        ctx.lineWidth = 4;
-        ctx.stroke();
-
-        // Draw ownership flag in corner when no buildings yet
-        if (prop.buildings === 0) {
-          const flagX = poly[0].x;
-          const flagY = poly[0].y;
-          ctx.beginPath();
-          ctx.arc(flagX, flagY, 6, 0, Math.PI * 2);
-          ctx.fillStyle = ownerColor;
-          ctx.fill();
-          ctx.strokeStyle = '#fff';
-          ctx.lineWidth = 1;
-          ctx.stroke();
-        }
-      }
+      this.drawTileState(ctx, state, i, poly);
 
       // Tile label
       const cx = poly.reduce((s, p) => s + p.x, 0) / poly.length;
@@ -207,7 +323,7 @@ export class BoardRenderer {
       const fontSize = Math.max(7, Math.min(12, tileW * 0.3));
 
       ctx.fillStyle = '#222';
-      ctx.font = `bold ${fontSize}px "Microsoft YaHei", sans-serif`;
+      ctx.font = `bold ${fontSize}px "Richman4 Sans", "Microsoft YaHei", sans-serif`;
       ctx.textAlign = 'center';
       ctx.textBaseline = 'middle';
       ctx.fillText(tile.name, cx, cy - fontSize * 0.35);
@@ -215,13 +331,15 @@ export class BoardRenderer {
       // Price text for unowned properties
       if (tile.type === TileType.PROPERTY && prop.ownerIndex === -1) {
         const infoSize = Math.max(6, fontSize * 0.7);
-        ctx.font = `${infoSize}px "Microsoft YaHei", sans-serif`;
+        ctx.font = `${infoSize}px "Richman4 Sans", "Microsoft YaHei", sans-serif`;
         ctx.fillStyle = '#555';
         ctx.fillText(`$${tile.price}`, cx, cy + fontSize * 0.45);
       }
     }
+  }
 
-    // Pass 2: Draw all building sprites on top so they aren't covered by adjacent tiles
+  private drawBuildings(ctx: CanvasRenderingContext2D, state: GameState) {
+    // Drawn after all tiles so buildings aren't covered by adjacent tiles
     for (let i = 0; i < TOTAL_TILES; i++) {
       const poly = this.board.getTileScreenPoly(i);
       if (poly.length < 4) continue;
@@ -234,6 +352,8 @@ export class BoardRenderer {
       const cx = poly.reduce((s, p) => s + p.x, 0) / poly.length;
       const cy = poly.reduce((s, p) => s + p.y, 0) / poly.length;
 
+      if (this.drawBuildingFromSheet(ctx, i, prop.buildings, cx, cy)) continue;
+
       // Compute bounding box for size reference
       let minX = Infinity, minY = Infinity, maxX = -Infinity, maxY = -Infinity;
       for (const p of poly) {
@@ -246,8 +366,11 @@ export class BoardRenderer {
       const tileH = maxY - minY;
       const imgSize = Math.min(tileW, tileH) * 0.7;
 
-      const buildingImg = this.buildingImages.get(prop.buildings);
-      if (buildingImg && buildingImg.complete && buildingImg.naturalWidth > 0) {
+      let buildingImg = this.buildingImages.get(prop.buildings);
+      if (!buildingImg || !buildingImg.complete || buildingImg.naturalWidth === 0) {
+        buildingImg = getPlaceholder(`/buildings/building_${prop.buildings}.png`);
+      }
+      if (buildingImg) {
         // Draw building image centered on tile
         ctx.drawImage(
           buildingImg,
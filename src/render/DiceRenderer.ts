@@ -1,5 +1,18 @@
 import { DiceResult } from '../types';
 import { CANVAS_WIDTH, CANVAS_HEIGHT } from '../constants';
+import { assetUrl } from '../assets/AssetManifest';
+
+// Faces and rotated tumble frames with the drop shadow baked in (generate_dice_sprites.py)
+interface DiceSheet {
+  images: Record<string, string>;  // scale -> image file
+  rotationSteps: number;           // tumble frames per full turn
+  center: [number, number];        // frame top-left -> die center, CSS px
+  frames: Record<string, [number, number, number, number]>;  // "scale:face:step" -> [x, y, w, h]
+}
+
+const DIE_SIZE = 40;
+const DIE_RADIUS = 8;
+const DIE_GAP = 12;
 
 export class DiceRenderer {
   private animating = false;
@@ -10,6 +23,31 @@ export class DiceRenderer {
   private rotation = [0, 0];
   private bounce = [0, 0];
   private bounceVelocity = [0, 0];
+  private diceSheet: DiceSheet | null = null;
+  private diceSheetImage: HTMLImageElement | null = null;
+  private diceSheetRequested = false;
+
+  private loadDiceSheet(scale: number) {
+    this.diceSheetRequested = true;
+    fetch(assetUrl('/sheets/dice.json'))
+      .then(res => (res.ok ? res.json() : null))
+      .then((sheet: DiceSheet | null) => {
+        const file = sheet && (sheet.images[scale] || sheet.images[1]);
+        if (!sheet || !file) return;
+        const img = new Image();
+        img.onload = () => {
+          this.diceSheet = sheet;
+          this.diceSheetImage = img;
+        };
+        img.src = assetUrl(`/sheets/${file}`);
+      })
+      .catch(() => {}); // sheet not built: draw the dice procedurally
+  }
+
+  // Sprite scale matching the canvas backing store, so sheet pixels map to device pixels
+  private backingScale(ctx: CanvasRenderingContext2D): number {
+    return ctx.canvas.width / CANVAS_WIDTH >= 1.5 ? 2 : 1;
+  }
 
   startAnimation(result: DiceResult) {
     this.finalResult = result;
@@ -22,6 +60,7 @@ export class DiceRenderer {
 
   draw(ctx: CanvasRenderingContext2D, now: number, dice: DiceResult | null) {
     if (!dice && !this.animating) return;
+    if (!this.diceSheetRequested) this.loadDiceSheet(this.backingScale(ctx));
 
     const elapsed = now - this.animStart;
     let die1: number, die2: number;
@@ -68,8 +107,8 @@ export class DiceRenderer {
     // Draw dice in center of board area
     const cx = CANVAS_WIDTH / 2;
     const cy = CANVAS_HEIGHT / 2 + 10;
-    const size = 40;
-    const gap = 12;
+    const size = DIE_SIZE;
+    const gap = DIE_GAP;
 
     const animProgress = this.animating ? Math.min(1, elapsed / this.animDuration) : 1;
     const rot1 = this.animating ? this.rotation[0] * (1 - animProgress) : 0;
@@ -79,8 +118,26 @@ export class DiceRenderer {
     this.drawDie(ctx, cx + gap / 2, cy + this.bounce[1], size, die2, rot2);
   }
 
+  // Blit the baked frame nearest to this face and rotation; returns false if the sheet lacks it
+  private drawDieFromSheet(ctx: CanvasRenderingContext2D, x: number, y: number, size: number, face: number, rotation: number): boolean {
+    const sheet = this.diceSheet;
+    if (!sheet || !this.diceSheetImage || size !== DIE_SIZE) return false;
+    const scale = this.backingScale(ctx);
+    // Frames cover [0, 2*PI): the body gradient is not symmetric under a half turn
+    const steps = sheet.rotationSteps;
+    const step = ((Math.round(rotation / (2 * Math.PI / steps)) % steps) + steps) % steps;
+    const frame = sheet.frames[`${scale}:${face}:${step}`];
+    if (!frame) return false;
+    const [sx, sy, sw, sh] = frame;
+    const dx = Math.round((x + size / 2 - sheet.center[0]) * scale) / scale;
+    const dy = Math.round((y + size / 2 - sheet.center[1]) * scale) / scale;
+    ctx.drawImage(this.diceSheetImage, sx, sy, sw, sh, dx, dy, sw / scale, sh / scale);
+    return true;
+  }
+
   private drawDie(ctx: CanvasRenderingContext2D, x: number, y: number, size: number, face: number, rotation: number = 0) {
-    const r = 8;
+    if (this.drawDieFromSheet(ctx, x, y, size, face, rotation)) return;
+    const r = DIE_RADIUS;
 
     ctx.save();
     ctx.translate(x + size / 2, y + size / 2);
@@ -0,0 +1,118 @@
+import { CANVAS_WIDTH } from '../constants';
+import { assetUrl } from '../assets/AssetManifest';
+
+// White glyphs of the renderers' static text, pre-rasterized per font style (glyph_atlas.py)
+interface GlyphStyle {
+  emAscent: number;                               // CSS px from the em box's top down to the baseline
+  emDescent: number;                              // CSS px from the baseline down to the em box's bottom
+  advances: Record<string, number>;               // char -> advance, CSS px
+  bands: Record<string, [number, number, number]>;  // scale -> [y, w, h] of the style's band in the sheet
+  glyphs: Record<string, Record<string, [number, number, number, number, number, number]>>;
+  // scale -> char -> [x, y, w, h, left, top]: rect in the band, offset from the pen on the baseline (device px)
+}
+
+interface GlyphSheet {
+  images: Record<string, string>;  // scale -> image file
+  styles: Record<string, GlyphStyle>;  // "bold 14px" -> glyphs
+}
+
+const MAX_TINTS = 48;
+
+// Draws text as blits from the glyph atlas where it has every glyph of the
+// current font style, instead of shaping and rasterizing it on each frame
+class GlyphAtlas {
+  private sheet: GlyphSheet | null = null;
+  private images: Map<number, HTMLImageElement> = new Map();
+  private requested: Set<number> = new Set();
+  private tints: Map<string, HTMLCanvasElement> = new Map();  // "scale|style|color" -> tinted band
+
+  // Drop-in for ctx.fillText honouring font, fillStyle, textAlign and textBaseline
+  fillText(ctx: CanvasRenderingContext2D, text: string, x: number, y: number) {
+    if (!this.drawText(ctx, text, x, y)) ctx.fillText(text, x, y);
+  }
+
+  private load(scale: number) {
+    this.requested.add(scale);
+    const sheetReady = this.sheet
+      ? Promise.resolve(this.sheet)
+      : fetch(assetUrl('/sheets/glyphs.json')).then(res => (res.ok ? res.json() : null));
+    sheetReady
+      .then((sheet: GlyphSheet | null) => {
+        const file = sheet?.images[scale];
+        if (!sheet || !file) return;
+        const img = new Image();
+        img.onload = () => {
+          this.sheet = sheet;
+          this.images.set(scale, img);
+        };
+        img.src = assetUrl(`/sheets/${file}`);
+      })
+      .catch(() => {}); // atlas not built: keep using fillText
+  }
+
+  private drawText(ctx: CanvasRenderingContext2D, text: string, x: number, y: number): boolean {
+    const scale = ctx.canvas.width / CANVAS_WIDTH >= 1.5 ? 2 : 1;
+    if (!this.requested.has(scale)) this.load(scale);
+    const image = this.images.get(scale);
+    if (!this.sheet || !image || typeof ctx.fillStyle !== 'string') return false;
+
+    const font = /^(bold\s+)?(\d+)px/.exec(ctx.font);
+    const styleKey = font ? `${font[1] ? 'bold ' : ''}${font[2]}px` : '';
+    const style = this.sheet.styles[styleKey];
+    if (!style || !ctx.font.includes('Richman4 Sans')) return false;
+    const glyphs = style.glyphs[scale];
+
+    let width = 0;
+    for (const ch of text) {
+      const advance = style.advances[ch];
+      if (advance === undefined) return false;
+      width += advance;
+    }
+
+    let penX = x;
+    if (ctx.textAlign === 'center') penX -= width / 2;
+    else if (ctx.textAlign === 'right' || ctx.textAlign === 'end') penX -= width;
+    // 'top', 'middle' and 'bottom' are the em box's; the atlas has no hanging or ideographic baseline
+    let baseY = y;
+    if (ctx.textBaseline === 'top') baseY += style.emAscent;
+    else if (ctx.textBaseline === 'middle') baseY += (style.emAscent - style.emDescent) / 2;
+    else if (ctx.textBaseline === 'bottom') baseY -= style.emDescent;
+    else if (ctx.textBaseline !== 'alphabetic') return false;
+
+    const band = this.tinted(image, scale, styleKey, style, ctx.fillStyle);
+    const devY = Math.round(baseY * scale);
+    for (const ch of text) {
+      const g = glyphs[ch];
+      if (g) {
+        const [sx, sy, sw, sh, left, top] = g;
+        ctx.drawImage(band, sx, sy, sw, sh,
+          (Math.round(penX * scale) + left) / scale, (devY + top) / scale, sw / scale, sh / scale);
+      }
+      penX += style.advances[ch];
+    }
+    return true;
+  }
+
+  // The style's band of the sheet filled with one colour, built on first use
+  private tinted(image: HTMLImageElement, scale: number, styleKey: string, style: GlyphStyle, color: string): HTMLCanvasElement {
+    const key = `${scale}|${styleKey}|${color}`;
+    let canvas = this.tints.get(key);
+    if (canvas) return canvas;
+
+    const [bandY, w, h] = style.bands[scale];
+    canvas = document.createElement('canvas');
+    canvas.width = w;
+    canvas.height = h;
+    const tctx = canvas.getContext('2d')!;
+    tctx.drawImage(image, 0, bandY, w, h, 0, 0, w, h);
+    tctx.globalCompositeOperation = 'source-in';
+    tctx.fillStyle = color;
+    tctx.fillRect(0, 0, w, h);
+
+    if (this.tints.size >= MAX_TINTS) this.tints.delete(this.tints.keys().next().value!);
+    this.tints.set(key, canvas);
+    return canvas;
+  }
+}
+
+export const glyphAtlas = new GlyphAtlas();
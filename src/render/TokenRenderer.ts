@@ -1,6 +1,8 @@
 import { Board } from '../core/Board';
 import { GameState, Vec2, Vec3 } from '../types';
-import { TOTAL_TILES, TILES_PER_SIDE } from '../constants';
+import { TOTAL_TILES, TILES_PER_SIDE, CANVAS_WIDTH } from '../constants';
+import { assetUrl } from '../assets/AssetManifest';
+import { glyphAtlas } from './GlyphAtlas';
 
 // Direction enum for walking animation
 enum WalkDirection {
@@ -19,6 +21,15 @@ interface TokenAnim {
   direction: WalkDirection;
 }
 
+// Pre-baked token frames with mirrored variants and drop shadows (generate_token_sprites.py)
+interface TokenSheet {
+  image: string;
+  anchor: [number, number];  // token position -> frame top-left offset, CSS px
+  walkFrames: number;        // walk poses per cycle, in-betweens included
+  walkSteps: number;         // walk poses per generated walk frame
+  frames: Record<string, [number, number, number, number]>;  // "scale:characterId:pose:facing" -> [x, y, w, h]
+}
+
 const TOKEN_SIZE = 72;
 const WALK_FRAME_INTERVAL = 150; // ms per frame
 
@@ -30,6 +41,8 @@ export class TokenRenderer {
   private playerDirections: Map<number, WalkDirection> = new Map();
   private getImage: (characterId: string) => HTMLImageElement | undefined;
   private getWalkFrame: (characterId: string, frameIndex: number) => HTMLImageElement | undefined;
+  private tokenSheet: TokenSheet | null = null;
+  private tokenSheetImage: HTMLImageElement | null = null;
 
   constructor(
     board: Board,
@@ -39,6 +52,38 @@ export class TokenRenderer {
     this.board = board;
     this.getImage = getImage;
     this.getWalkFrame = getWalkFrame;
+    this.loadTokenSheet();
+  }
+
+  private loadTokenSheet() {
+    fetch(assetUrl('/sheets/tokens.json'))
+      .then(res => (res.ok ? res.json() : null))
+      .then((sheet: TokenSheet | null) => {
+        if (!sheet) return;
+        const img = new Image();
+        img.onload = () => {
+          this.tokenSheet = sheet;
+          this.tokenSheetImage = img;
+        };
+        img.src = assetUrl(`/sheets/${sheet.image}`);
+      })
+      .catch(() => {}); // sheet not built: draw from the character images
+  }
+
+  // Single untransformed blit of a pre-baked frame; returns false if the sheet lacks it
+  private drawTokenFromSheet(ctx: CanvasRenderingContext2D, pos: Vec2, characterId: string, pose: string, flip: boolean): boolean {
+    const sheet = this.tokenSheet;
+    if (!sheet || !this.tokenSheetImage) return false;
+    const scale = ctx.canvas.width / CANVAS_WIDTH >= 1.5 ? 2 : 1;
+    const facing = flip ? 'L' : 'R';
+    const frame = sheet.frames[`${scale}:${characterId}:${pose}:${facing}`]
+      || sheet.frames[`${scale}:${characterId}:stand:${facing}`];
+    if (!frame) return false;
+    const [sx, sy, sw, sh] = frame;
+    const [ax, ay] = sheet.anchor;
+    ctx.drawImage(this.tokenSheetImage, sx, sy, sw, sh,
+      Math.round(pos.x - ax), Math.round(pos.y - ay), sw / scale, sh / scale);
+    return true;
   }
 
   // Determine walking direction based on tile position
@@ -153,20 +198,30 @@ export class TokenRenderer {
 
   private drawToken(ctx: CanvasRenderingContext2D, pos: Vec2, color: string, initial: string, characterId: string, isMoving: boolean, now: number, direction: WalkDirection) {
     const size = TOKEN_SIZE;
+    const frameIndex = Math.floor(now / WALK_FRAME_INTERVAL) % 4;
+
+    // Determine if we need to flip the image based on direction
+    // Original sprites face right, so flip for left-facing directions
+    const shouldFlip = direction === WalkDirection.LEFT || direction === WalkDirection.DOWN;
+
+    // The sheet's walk cycle has in-betweens, played at the same cycle speed
+    const steps = this.tokenSheet?.walkSteps || 1;
+    const sheetFrames = this.tokenSheet?.walkFrames || 4;
+    const sheetIndex = Math.floor(now * steps / WALK_FRAME_INTERVAL) % sheetFrames;
+    const pose = isMoving ? `walk${sheetIndex}` : 'stand';
+    if (this.drawTokenFromSheet(ctx, pos, characterId, pose, shouldFlip)) {
+      this.drawNameTag(ctx, pos, color, initial);
+      return;
+    }
 
     let img: HTMLImageElement | undefined;
     if (isMoving) {
-      const frameIndex = Math.floor(now / WALK_FRAME_INTERVAL) % 4;
       img = this.getWalkFrame(characterId, frameIndex);
     }
     if (!img) {
       img = this.getImage(characterId);
     }
 
-    // Determine if we need to flip the image based on direction
-    // Original sprites face right, so flip for left-facing directions
-    const shouldFlip = direction === WalkDirection.LEFT || direction === WalkDirection.DOWN;
-
     if (img && img.complete && img.naturalWidth > 0) {
       ctx.beginPath();
       ctx.ellipse(pos.x, pos.y + size * 0.38, size * 0.3, size * 0.12, 0, 0, Math.PI * 2);
@@ -187,30 +242,7 @@ export class TokenRenderer {
       }
       ctx.restore();
 
-      const tagY = pos.y + size * 0.32;
-      ctx.fillStyle = color;
-      ctx.globalAlpha = 0.85;
-      const tagW = 36;
-      const tagH = 13;
-      ctx.beginPath();
-      ctx.moveTo(pos.x - tagW / 2 + 3, tagY - tagH / 2);
-      ctx.lineTo(pos.x + tagW / 2 - 3, tagY - tagH / 2);
-      ctx.quadraticCurveTo(pos.x + tagW / 2, tagY - tagH / 2, pos.x + tagW / 2, tagY - tagH / 2 + 3);
-      ctx.lineTo(pos.x + tagW / 2, tagY + tagH / 2 - 3);
-      ctx.quadraticCurveTo(pos.x + tagW / 2, tagY + tagH / 2, pos.x + tagW / 2 - 3, tagY + tagH / 2);
-      ctx.lineTo(pos.x - tagW / 2 + 3, tagY + tagH / 2);
-      ctx.quadraticCurveTo(pos.x - tagW / 2, tagY + tagH / 2, pos.x - tagW / 2, tagY + tagH / 2 - 3);
-      ctx.lineTo(pos.x - tagW / 2, tagY - tagH / 2 + 3);
-      ctx.quadraticCurveTo(pos.x - tagW / 2, tagY - tagH / 2, pos.x - tagW / 2 + 3, tagY - tagH / 2);
-      ctx.closePath();
-      ctx.fill();
-      ctx.globalAlpha = 1.0;
-
-      ctx.fillStyle = '#fff';
-      ctx.font = 'bold 9px "Microsoft YaHei", sans-serif';
-      ctx.textAlign = 'center';
-      ctx.textBaseline = 'middle';
-      ctx.fillText(initial, pos.x, tagY);
+      this.drawNameTag(ctx, pos, color, initial);
     } else {
       const r = 20;
       ctx.beginPath();
@@ -230,12 +262,39 @@ export class TokenRenderer {
       ctx.stroke();
 
       ctx.fillStyle = '#fff';
-      ctx.font = 'bold 16px "Microsoft YaHei", sans-serif';
+      ctx.font = 'bold 16px "Richman4 Sans", "Microsoft YaHei", sans-serif';
       ctx.textAlign = 'center';
       ctx.textBaseline = 'middle';
-      ctx.fillText(initial, pos.x, pos.y + 1);
+      glyphAtlas.fillText(ctx, initial, pos.x, pos.y + 1);
     }
   }
+
+  private drawNameTag(ctx: CanvasRenderingContext2D, pos: Vec2, color: string, initial: string) {
+    const tagY = pos.y + TOKEN_SIZE * 0.32;
+    ctx.fillStyle = color;
+    ctx.globalAlpha = 0.85;
+    const tagW = 36;
+    const tagH = 13;
+    ctx.beginPath();
+    ctx.moveTo(pos.x - tagW / 2 + 3, tagY - tagH / 2);
+    ctx.lineTo(pos.x + tagW / 2 - 3, tagY - tagH / 2);
+    ctx.quadraticCurveTo(pos.x + tagW / 2, tagY - tagH / 2, pos.x + tagW / 2, tagY - tagH / 2 + 3);
+    ctx.lineTo(pos.x + tagW / 2, tagY + tagH / 2 - 3);
+    ctx.quadraticCurveTo(pos.x + tagW / 2, tagY + tagH / 2, pos.x + tagW / 2 - 3, tagY + tagH / 2);
+    ctx.lineTo(pos.x - tagW / 2 + 3, tagY + tagH / 2);
+    ctx.quadraticCurveTo(pos.x - tagW / 2, tagY + tagH / 2, pos.x - tagW / 2, tagY + tagH / 2 - 3);
+    ctx.lineTo(pos.x - tagW / 2, tagY - tagH / 2 + 3);
+    ctx.quadraticCurveTo(pos.x - tagW / 2, tagY - tagH / 2, pos.x - tagW / 2 + 3, tagY - tagH / 2);
+    ctx.closePath();
+    ctx.fill();
+    ctx.globalAlpha = 1.0;
+
+    ctx.fillStyle = '#fff';
+    ctx.font = 'bold 9px "Richman4 Sans", "Microsoft YaHei", sans-serif';
+    ctx.textAlign = 'center';
+    ctx.textBaseline = 'middle';
+    glyphAtlas.fillText(ctx, initial, pos.x, tagY);
+  }
 }
 
 function lighten(hex: string, amount: number): string {
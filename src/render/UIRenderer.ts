@@ -1,5 +1,7 @@
 import { GameState, GamePhase, Button, CardType, Stock } from '../types';
 import { CANVAS_WIDTH, CANVAS_HEIGHT, CHARACTER_DEFS, CARD_DEFS } from '../constants';
+import { assetUrl, getPlaceholder } from '../assets/AssetManifest';
+import { glyphAtlas } from './GlyphAtlas';
 
 export class UIRenderer {
   buttons: Button[] = [];
@@ -18,7 +20,7 @@ export class UIRenderer {
         const img = new Image();
         img.onload = () => { this.characterImages.set(char.id, img); resolve(); };
         img.onerror = () => { console.warn(`Failed to load: ${char.imagePath}`); resolve(); };
-        img.src = char.imagePath;
+        img.src = assetUrl(char.imagePath);
       }));
 
       // Load walk frames
@@ -30,7 +32,7 @@ export class UIRenderer {
         promises.push(new Promise<void>((resolve) => {
           frameImg.onload = () => { resolve(); };
           frameImg.onerror = () => { console.warn(`Failed to load walk frame: ${char.walkFrames[i]}`); resolve(); };
-          frameImg.src = char.walkFrames[i];
+          frameImg.src = assetUrl(char.walkFrames[i]);
         }));
       }
     }
@@ -38,8 +40,12 @@ export class UIRenderer {
     return Promise.all(promises).then(() => { this.imagesLoaded = true; });
   }
 
+  // Full portrait once loaded, otherwise its manifest placeholder
   getCharacterImage(id: string): HTMLImageElement | undefined {
-    return this.characterImages.get(id);
+    const img = this.characterImages.get(id);
+    if (img) return img;
+    const char = CHARACTER_DEFS.find(c => c.id === id);
+    return char ? getPlaceholder(char.imagePath) : undefined;
   }
 
   getWalkFrame(id: string, frameIndex: number): HTMLImageElement | undefined {
@@ -71,14 +77,14 @@ export class UIRenderer {
 
     // Title
     ctx.fillStyle = '#f1c40f';
-    ctx.font = 'bold 42px "Microsoft YaHei", sans-serif';
+    ctx.font = 'bold 42px "Richman4 Sans", "Microsoft YaHei", sans-serif';
     ctx.textAlign = 'center';
     ctx.textBaseline = 'middle';
-    ctx.fillText('大富翁4', CANVAS_WIDTH / 2, 60);
+    glyphAtlas.fillText(ctx, '大富翁4', CANVAS_WIDTH / 2, 60);
 
     ctx.fillStyle = '#aaa';
-    ctx.font = '18px "Microsoft YaHei", sans-serif';
-    ctx.fillText('选择你的角色', CANVAS_WIDTH / 2, 105);
+    ctx.font = '18px "Richman4 Sans", "Microsoft YaHei", sans-serif';
+    glyphAtlas.fillText(ctx, '选择你的角色', CANVAS_WIDTH / 2, 105);
     // Character cards - 2x2 grid
     const cardW = 220;
     const cardH = 300;
@@ -105,7 +111,7 @@ export class UIRenderer {
       ctx.stroke();
 
       // Character image
-      const img = this.characterImages.get(char.id);
+      const img = this.getCharacterImage(char.id);
       const imgSize = 160;
       const imgX = x + (cardW - imgSize) / 2;
       const imgY = y + 15;
@@ -122,23 +128,23 @@ export class UIRenderer {
         this.roundRect(ctx, imgX, imgY, imgSize, imgSize, 8);
         ctx.fill();
         ctx.fillStyle = '#666';
-        ctx.font = '48px "Microsoft YaHei", sans-serif';
+        ctx.font = '48px "Richman4 Sans", "Microsoft YaHei", sans-serif';
         ctx.textAlign = 'center';
         ctx.textBaseline = 'middle';
-        ctx.fillText(char.name[0], imgX + imgSize / 2, imgY + imgSize / 2);
+        glyphAtlas.fillText(ctx, char.name[0], imgX + imgSize / 2, imgY + imgSize / 2);
       }
 
       // Name
       ctx.fillStyle = '#fff';
-      ctx.font = 'bold 20px "Microsoft YaHei", sans-serif';
+      ctx.font = 'bold 20px "Richman4 Sans", "Microsoft YaHei", sans-serif';
       ctx.textAlign = 'center';
       ctx.textBaseline = 'middle';
-      ctx.fillText(char.name, x + cardW / 2, y + imgSize + 35);
+      glyphAtlas.fillText(ctx, char.name, x + cardW / 2, y + imgSize + 35);
 
       // Description
       ctx.fillStyle = '#aaa';
-      ctx.font = '14px "Microsoft YaHei", sans-serif';
-      ctx.fillText(char.description, x + cardW / 2, y + imgSize + 60);
+      ctx.font = '14px "Richman4 Sans", "Microsoft YaHei", sans-serif';
+      glyphAtlas.fillText(ctx, char.description, x + cardW / 2, y + imgSize + 60);
 
       // Register as clickable button
       this.buttons.push({
@@ -202,7 +208,7 @@ export class UIRenderer {
       }
 
       // Character portrait or color dot
-      const charImg = this.characterImages.get(player.characterId);
+      const charImg = this.getCharacterImage(player.characterId);
       if (charImg && charImg.complete && charImg.naturalWidth > 0) {
         ctx.save();
         ctx.beginPath();
@@ -224,28 +230,28 @@ export class UIRenderer {
 
       // Name
       ctx.fillStyle = player.bankrupt ? '#999' : '#333';
-      ctx.font = 'bold 14px "Microsoft YaHei", sans-serif';
+      ctx.font = 'bold 14px "Richman4 Sans", "Microsoft YaHei", sans-serif';
       ctx.textAlign = 'left';
       ctx.textBaseline = 'middle';
       let nameLabel = player.index === this.localPlayerIndex ? `${player.name} (你)` : player.name;
       if (player.isHuman && player.autoPlay) {
         nameLabel += ' [托管]';
       }
-      ctx.fillText(nameLabel, x + 30, y + 20);
+      glyphAtlas.fillText(ctx, nameLabel, x + 30, y + 20);
 
       // Money
       ctx.fillStyle = player.bankrupt ? '#999' : '#2e7d32';
-      ctx.font = 'bold 16px "Microsoft YaHei", sans-serif';
-      ctx.fillText(`$${player.money}`, x + 16, y + 48);
+      ctx.font = 'bold 16px "Richman4 Sans", "Microsoft YaHei", sans-serif';
+      glyphAtlas.fillText(ctx, `$${player.money}`, x + 16, y + 48);
 
       if (player.bankrupt) {
         ctx.fillStyle = '#e74c3c';
-        ctx.font = '12px "Microsoft YaHei", sans-serif';
-        ctx.fillText('破产', x + 110, y + 48);
+        ctx.font = '12px "Richman4 Sans", "Microsoft YaHei", sans-serif';
+        glyphAtlas.fillText(ctx, '破产', x + 110, y + 48);
       } else if (player.inJail) {
         ctx.fillStyle = '#e74c3c';
-        ctx.font = '12px "Microsoft YaHei", sans-serif';
-        ctx.fillText('监狱中', x + 100, y + 48);
+        ctx.font = '12px "Richman4 Sans", "Microsoft YaHei", sans-serif';
+        glyphAtlas.fillText(ctx, '监狱中', x + 100, y + 48);
       }
     }
   }
@@ -279,20 +285,20 @@ export class UIRenderer {
     ctx.stroke();
 
     ctx.fillStyle = '#f1c40f';
-    ctx.font = 'bold 14px "Microsoft YaHei", sans-serif';
+    ctx.font = 'bold 14px "Richman4 Sans", "Microsoft YaHei", sans-serif';
     ctx.textAlign = 'left';
     ctx.textBaseline = 'top';
-    ctx.fillText('游戏消息', msgX + 10, msgY + 8);
+    glyphAtlas.fillText(ctx, '游戏消息', msgX + 10, msgY + 8);
 
     const maxShow = 10;
     const msgs = state.messages.slice(-maxShow);
-    ctx.font = '12px "Microsoft YaHei", sans-serif';
+    ctx.font = '12px "Richman4 Sans", "Microsoft YaHei", sans-serif';
     msgs.forEach((msg, i) => {
       ctx.fillStyle = msg.color || '#ddd';
       const y = msgY + 30 + i * 22;
       let text = msg.text;
       if (text.length > 22) text = text.substring(0, 21) + '\u2026';
-      ctx.fillText(text, msgX + 10, y);
+      glyphAtlas.fillText(ctx, text, msgX + 10, y);
     });
   }
 
@@ -380,12 +386,12 @@ export class UIRenderer {
     }
 
     ctx.fillStyle = '#fff';
-    ctx.font = 'bold 15px "Microsoft YaHei", sans-serif';
+    ctx.font = 'bold 15px "Richman4 Sans", "Microsoft YaHei", sans-serif';
     ctx.textAlign = 'center';
     ctx.textBaseline = 'middle';
     let displayLabel = label;
     if (displayLabel.length > 14) displayLabel = displayLabel.substring(0, 13) + '\u2026';
-    ctx.fillText(displayLabel, x + w / 2, y + h / 2);
+    glyphAtlas.fillText(ctx, displayLabel, x + w / 2, y + h / 2);
 
     this.buttons.push({ x, y, w, h, label, action, visible: true, enabled });
   }
@@ -411,15 +417,15 @@ export class UIRenderer {
       ctx.fillStyle = 'rgba(0,0,0,0.6)';
       ctx.fillRect(0, 0, CANVAS_WIDTH, CANVAS_HEIGHT);
       ctx.fillStyle = '#f1c40f';
-      ctx.font = 'bold 48px "Microsoft YaHei", sans-serif';
+      ctx.font = 'bold 48px "Richman4 Sans", "Microsoft YaHei", sans-serif';
       ctx.textAlign = 'center';
       ctx.textBaseline = 'middle';
-      ctx.fillText('游戏结束', CANVAS_WIDTH / 2, CANVAS_HEIGHT / 2 - 30);
+      glyphAtlas.fillText(ctx, '游戏结束', CANVAS_WIDTH / 2, CANVAS_HEIGHT / 2 - 30);
       if (state.winner >= 0) {
         const winner = state.players[state.winner];
         ctx.fillStyle = winner.color;
-        ctx.font = 'bold 32px "Microsoft YaHei", sans-serif';
-        ctx.fillText(`${winner.name} 获胜！`, CANVAS_WIDTH / 2, CANVAS_HEIGHT / 2 + 30);
+        ctx.font = 'bold 32px "Richman4 Sans", "Microsoft YaHei", sans-serif';
+        glyphAtlas.fillText(ctx, `${winner.name} 获胜！`, CANVAS_WIDTH / 2, CANVAS_HEIGHT / 2 + 30);
       }
       return;
     }
@@ -431,10 +437,10 @@ export class UIRenderer {
       this.roundRect(ctx, CANVAS_WIDTH / 2 - 100, CANVAS_HEIGHT - 50, 200, 35, 8);
       ctx.fill();
       ctx.fillStyle = player.color;
-      ctx.font = '14px "Microsoft YaHei", sans-serif';
+      ctx.font = '14px "Richman4 Sans", "Microsoft YaHei", sans-serif';
       ctx.textAlign = 'center';
       ctx.textBaseline = 'middle';
-      ctx.fillText(`${player.name} 思考中...`, CANVAS_WIDTH / 2, CANVAS_HEIGHT - 32);
+      glyphAtlas.fillText(ctx, `${player.name} 思考中...`, CANVAS_WIDTH / 2, CANVAS_HEIGHT - 32);
     }
   }
 
@@ -492,17 +498,17 @@ export class UIRenderer {
 
     // Title
     ctx.fillStyle = '#fff';
-    ctx.font = 'bold 12px "Microsoft YaHei", sans-serif';
+    ctx.font = 'bold 12px "Richman4 Sans", "Microsoft YaHei", sans-serif';
     ctx.textAlign = 'left';
     ctx.textBaseline = 'middle';
-    ctx.fillText('我的卡片', panelX + 10, panelY + 14);
+    glyphAtlas.fillText(ctx, '我的卡片', panelX + 10, panelY + 14);
 
     // Immunity indicator
     if (localPlayer.immuneTurns > 0) {
       ctx.fillStyle = '#f1c40f';
-      ctx.font = '10px "Microsoft YaHei", sans-serif';
+      ctx.font = '10px "Richman4 Sans", "Microsoft YaHei", sans-serif';
       ctx.textAlign = 'right';
-      ctx.fillText(`免租:${localPlayer.immuneTurns}回合`, panelX + panelW - 10, panelY + 14);
+      glyphAtlas.fillText(ctx, `免租:${localPlayer.immuneTurns}回合`, panelX + panelW - 10, panelY + 14);
     }
 
     // Card list
@@ -520,8 +526,8 @@ export class UIRenderer {
 
       // Card name
       ctx.fillStyle = '#fff';
-      ctx.font = '11px "Microsoft YaHei", sans-serif';
-      ctx.fillText(cardDef.name, panelX + 12, y + cardH / 2);
+      ctx.font = '11px "Richman4 Sans", "Microsoft YaHei", sans-serif';
+      glyphAtlas.fillText(ctx, cardDef.name, panelX + 12, y + cardH / 2);
     });
   }
 
@@ -552,10 +558,10 @@ export class UIRenderer {
 
     // Title
     ctx.fillStyle = '#f1c40f';
-    ctx.font = 'bold 12px "Microsoft YaHei", sans-serif';
+    ctx.font = 'bold 12px "Richman4 Sans", "Microsoft YaHei", sans-serif';
     ctx.textAlign = 'left';
     ctx.textBaseline = 'middle';
-    ctx.fillText('股票市场', panelX + 10, panelY + 16);
+    glyphAtlas.fillText(ctx, '股票市场', panelX + 10, panelY + 16);
 
     // Local player holdings
     const localPlayer = state.players[this.localPlayerIndex];
@@ -571,23 +577,23 @@ export class UIRenderer {
 
       // Stock name
       ctx.fillStyle = '#fff';
-      ctx.font = '11px "Microsoft YaHei", sans-serif';
+      ctx.font = '11px "Richman4 Sans", "Microsoft YaHei", sans-serif';
       ctx.textAlign = 'left';
-      ctx.fillText(stock.name, panelX + 12, y + stockH / 2);
+      glyphAtlas.fillText(ctx, stock.name, panelX + 12, y + stockH / 2);
 
       // Price with trend indicator
       const trendColor = stock.trend > 0 ? '#2ecc71' : stock.trend < 0 ? '#e74c3c' : '#fff';
       const trendArrow = stock.trend > 0 ? '▲' : stock.trend < 0 ? '▼' : '─';
       ctx.fillStyle = trendColor;
       ctx.textAlign = 'center';
-      ctx.fillText(`$${stock.price} ${trendArrow}`, panelX + 130, y + stockH / 2);
+      glyphAtlas.fillText(ctx, `$${stock.price} ${trendArrow}`, panelX + 130, y + stockH / 2);
 
       // Player holdings
       if (localPlayer) {
         const holding = localPlayer.stocks[stock.id] || 0;
         ctx.fillStyle = holding > 0 ? '#3498db' : '#888';
         ctx.textAlign = 'right';
-        ctx.fillText(`持有: ${holding}`, panelX + panelW - 12, y + stockH / 2);
+        glyphAtlas.fillText(ctx, `持有: ${holding}`, panelX + panelW - 12, y + stockH / 2);
       }
     });
   }